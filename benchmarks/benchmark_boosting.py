@@ -0,0 +1,119 @@
+"""Benchmark of the exact and histogram-based gradient boosting models.
+
+Fits both models on synthetic quarter-hourly data and reports the fit
+time and the pinball loss on the last days, e.g.::
+
+    python benchmarks/benchmark_boosting.py --years 2 --pooled
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import mean_pinball_loss
+
+from spotopt import Frequency, ModelName, SpotOptConfig, SpotOptModel
+
+_QUANTILES = [5, 50, 95]
+_TEST_DAYS = 28
+
+
+def make_data(years: float, frequency: Frequency) -> pd.DataFrame:
+    """Make observations and forecasts with a daily profile.
+
+    Args:
+        years: Length of the data in years.
+        frequency: Frequency of the data.
+    """
+    start = pd.Timestamp("2020-01-01", tz="CET")
+    index = pd.date_range(
+        start=start,
+        end=start
+        + pd.DateOffset(days=int(years * 365))
+        - pd.DateOffset(minutes=frequency.value),
+        freq=f"{frequency.value}min",
+        name="delivery",
+    )
+    rng = np.random.default_rng(0)
+    hours = index.hour + index.minute / 60
+    profile = 50 + 20 * np.sin(2 * np.pi * (hours - 8) / 24)
+    fcast = profile + 10 * rng.standard_normal(len(index))
+    noise = rng.standard_normal(len(index)) * (5 + 0.1 * np.abs(fcast))
+    return pd.DataFrame({"obs": fcast + noise, "fcast": fcast}, index=index)
+
+
+def run(
+    model_name: ModelName,
+    df: pd.DataFrame,
+    frequency: Frequency,
+    mdl_kwargs: dict[str, object],
+    *,
+    pooled: bool,
+) -> tuple[float, float]:
+    """Fit a model and score it on the last days.
+
+    Args:
+        model_name: Name of the model.
+        df: Observations and forecasts.
+        frequency: Frequency of the data.
+        mdl_kwargs: Keyword arguments of the model.
+        pooled: Whether to fit pooled models.
+
+    Returns:
+        Fit time in seconds and the mean pinball loss.
+    """
+    split = df.index[-1].normalize() - pd.DateOffset(days=_TEST_DAYS)
+    config = SpotOptConfig(
+        model_name=model_name,
+        frequency=frequency,
+        mdl_kwargs=mdl_kwargs,
+        fit_quantiles=_QUANTILES,
+        pooled=pooled,
+    )
+    model = SpotOptModel(config)
+    start = time.perf_counter()
+    model.fit(df[df.index < split])
+    seconds = time.perf_counter() - start
+    predictions = model.predict(df[df.index >= split - pd.DateOffset(days=1)])
+    obs = df["obs"].reindex(predictions.index)
+    loss = np.mean(
+        [
+            mean_pinball_loss(obs, predictions[f"q_{q:03d}"], alpha=q / 100)
+            for q in _QUANTILES
+        ],
+    )
+    return seconds, float(loss)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=float, default=1.0)
+    parser.add_argument("--frequency", type=int, default=Frequency.QH)
+    parser.add_argument("--n-stages", type=int, default=100)
+    parser.add_argument("--pooled", action="store_true")
+    args = parser.parse_args()
+
+    frequency = Frequency(args.frequency)
+    df = make_data(args.years, frequency)
+    mdl_kwargs = {
+        ModelName.GBR: {"n_estimators": args.n_stages},
+        ModelName.HGB: {"max_iter": args.n_stages},
+    }
+    print(f"{len(df)} rows, pooled={args.pooled}")
+    for model_name, kwargs in mdl_kwargs.items():
+        seconds, loss = run(
+            model_name,
+            df,
+            frequency,
+            kwargs,
+            pooled=args.pooled,
+        )
+        print(f"{model_name:>3}: fit {seconds:8.2f} s, pinball {loss:.4f}")
+
+
+if __name__ == "__main__":
+    main()
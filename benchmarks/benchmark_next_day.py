@@ -0,0 +1,60 @@
+"""Benchmark of the prediction latency of a single delivery day.
+
+Fits a Lasso model on synthetic data and compares the latency of
+``predict_next_day`` with ``predict`` on the same day, e.g.::
+
+    python benchmarks/benchmark_next_day.py --days 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+import numpy as np
+import pandas as pd
+from benchmark_boosting import make_data
+
+from spotopt import Frequency, ModelName, SpotOptConfig, SpotOptModel
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--frequency", type=int, default=Frequency.QH)
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+
+    frequency = Frequency(args.frequency)
+    df = make_data(args.days / 365, frequency)
+    day = df.index[-1].normalize()
+    previous = df[df.index >= day - pd.DateOffset(days=1)]
+    model = SpotOptModel(
+        SpotOptConfig(
+            model_name=ModelName.LASSO,
+            frequency=frequency,
+            mdl_kwargs={"alpha": 0.1},
+        ),
+    )
+    model.fit(df[df.index < day])
+    obs = previous.loc[previous.index < day, "obs"].to_numpy()
+    fcast = previous.loc[previous.index >= day, "fcast"].to_numpy()
+
+    expected = model.predict(previous).to_numpy()
+    predictions = model.predict_next_day(obs, fcast, delivery_day=day)
+    np.testing.assert_allclose(predictions, expected, rtol=1e-9)
+    for name, call in {
+        "predict": lambda: model.predict(previous),
+        "predict_next_day": lambda: model.predict_next_day(
+            obs,
+            fcast,
+            delivery_day=day,
+        ),
+    }.items():
+        seconds = min(timeit.repeat(call, number=1, repeat=args.repeat))
+        print(f"{name:>16}: {seconds * 1e6:10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
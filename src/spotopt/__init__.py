@@ -3,7 +3,17 @@
 import logging
 
 from spotopt._logging import configure_logging
-from spotopt._types import Frequency, ModelName, SpotOptConfig
+from spotopt._types import (
+    CVStrategy,
+    Frequency,
+    ModelName,
+    QuantileMode,
+    SearchScope,
+    SearchStrategy,
+    SlotEncoding,
+    SpotOptConfig,
+    WeekdayEncoding,
+)
 from spotopt.model import SpotOptModel
 
 __version__ = "0.1.0"
@@ -11,10 +21,16 @@ __version__ = "0.1.0"
 logging.getLogger("spotopt").addHandler(logging.NullHandler())
 
 __all__ = [
+    "CVStrategy",
     "Frequency",
     "ModelName",
+    "QuantileMode",
+    "SearchScope",
+    "SearchStrategy",
+    "SlotEncoding",
     "SpotOptConfig",
     "SpotOptModel",
+    "WeekdayEncoding",
     "__version__",
     "configure_logging",
 ]
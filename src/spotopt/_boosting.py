@@ -0,0 +1,145 @@
+"""Early stopping and time budgets of gradient boosting models."""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from sklearn.base import clone
+from sklearn.metrics import mean_pinball_loss
+
+if TYPE_CHECKING:
+    from sklearn.ensemble import GradientBoostingRegressor
+
+
+@dataclass(frozen=True, slots=True)
+class TimeBudget:
+    """Share of a wall-clock budget of a fitting task.
+
+    Args:
+        deadline: Time since the epoch in seconds by which all tasks
+            should be fitted.
+        n_remaining: Number of tasks from this one to the last one per
+            worker.
+    """
+
+    deadline: float
+    n_remaining: float
+
+    def allowance(self) -> float:
+        """Get the seconds that the task may use from now on."""
+        return max(self.deadline - time.time(), 0.0) / self.n_remaining
+
+
+class _StoppingMonitor:
+    """Monitor that stops boosting on a deadline or a stalled holdout.
+
+    Args:
+        deadline: Time since the epoch in seconds after which boosting
+            stops. Never stops on time if None.
+        X_val: Holdout features. Never stops on the holdout if None.
+        y_val: Holdout target.
+        n_iter_no_change: Number of stages without an improvement of the
+            holdout pinball loss by at least ``tol`` before stopping.
+    """
+
+    def __init__(
+        self,
+        deadline: float | None,
+        X_val: np.ndarray | None = None,  # noqa: N803
+        y_val: np.ndarray | None = None,
+        n_iter_no_change: int | None = None,
+    ) -> None:
+        self.deadline = deadline
+        self.X_val = X_val
+        self.y_val = y_val
+        self.n_iter_no_change = n_iter_no_change
+        self._raw: np.ndarray | None = None
+        self._best_loss = np.inf
+        self._best_stage = 0
+
+    def __call__(
+        self,
+        i: int,
+        est: GradientBoostingRegressor,
+        _locals: dict[str, Any],
+    ) -> bool:
+        """Decide whether to stop after stage ``i``."""
+        if self.deadline is not None and time.time() >= self.deadline:
+            return True
+        if self.X_val is None:
+            return False
+        if self._raw is None:
+            self._raw = (
+                np.zeros(len(self.y_val))
+                if isinstance(est.init_, str)
+                else est.init_.predict(self.X_val).astype(float)
+            )
+        self._raw += est.learning_rate * est.estimators_[i, 0].predict(
+            self.X_val,
+        )
+        loss = mean_pinball_loss(self.y_val, self._raw, alpha=est.alpha)
+        if loss < self._best_loss - est.tol:
+            self._best_loss = loss
+            self._best_stage = i
+        return i - self._best_stage >= self.n_iter_no_change
+
+
+def fit_boosting(
+    mdl: GradientBoostingRegressor,
+    X: np.ndarray,  # noqa: N803
+    y: np.ndarray,
+    early_stopping: tuple[int, float] | None,
+    budget: TimeBudget | None,
+) -> GradientBoostingRegressor:
+    """Fit a gradient boosting model with early stopping and a budget.
+
+    For early stopping, the model is first fitted on the rows before a
+    holdout of the latest rows. Boosting stops once the pinball loss on
+    the holdout has not improved for ``n_iter_no_change`` stages. As
+    the latest rows matter most for the next day, the model is then
+    refitted on all rows with the number of stages found. The time
+    allowance of the budget is split between both fits in proportion
+    to their rows, and every fit stops at the end of its share, keeping
+    at least one stage. The refit may also use the time left by the
+    first fit. If the refit does not reach the stages found, the model
+    fitted before the holdout is returned.
+
+    Args:
+        mdl: Unfitted quantile model.
+        X: Features in chronological order.
+        y: Target.
+        early_stopping: Number of stages without improvement and
+            fraction of the rows in the holdout. No early stopping if
+            None.
+        budget: Time budget of the task. No limit if None.
+    """
+    start = time.time()
+    deadline = None if budget is None else start + budget.allowance()
+    if early_stopping is None:
+        return mdl.fit(X, y, monitor=_StoppingMonitor(deadline))
+    n_iter_no_change, validation_fraction = early_stopping
+    split = len(y) - max(int(len(y) * validation_fraction), 1)
+    holdout_deadline = (
+        None
+        if deadline is None
+        else start + (deadline - start) * split / (split + len(y))
+    )
+    mdl.fit(
+        X[:split],
+        y[:split],
+        monitor=_StoppingMonitor(
+            holdout_deadline,
+            X[split:],
+            y[split:],
+            n_iter_no_change,
+        ),
+    )
+    n_stages = mdl.estimators_.shape[0]
+    refitted = clone(mdl).set_params(n_estimators=n_stages)
+    refitted.fit(X, y, monitor=_StoppingMonitor(deadline))
+    if refitted.estimators_.shape[0] < n_stages:
+        return mdl
+    return refitted
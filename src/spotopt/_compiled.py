@@ -0,0 +1,394 @@
+"""Compiled representations of fitted quantile models."""
+
+from __future__ import annotations
+
+import itertools
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+from sklearn.dummy import DummyRegressor
+from sklearn.ensemble import HistGradientBoostingRegressor
+
+if TYPE_CHECKING:
+    from sklearn.ensemble import GradientBoostingRegressor
+    from sklearn.ensemble._hist_gradient_boosting.predictor import (
+        TreePredictor,
+    )
+    from sklearn.tree._tree import Tree
+
+    from spotopt._types import Frequency, QRs
+
+# Child index of leaves in scikit-learn trees.
+_TREE_LEAF = -1
+
+
+@dataclass(frozen=True, slots=True)
+class LinearStack:
+    """Stacked coefficients of linear quantile models.
+
+    Slots or quantiles without a fitted model have a NaN intercept, so
+    their predictions are NaN.
+
+    Args:
+        coef: Coefficients with shape
+            (n_slots, n_quantiles, n_features).
+        intercept: Intercepts with shape (n_slots, n_quantiles).
+        quantiles: Quantiles along the second axis.
+
+    Models shared by several slots are replicated per slot. The terms of
+    their slot features are folded into the intercepts.
+    """
+
+    coef: np.ndarray
+    intercept: np.ndarray
+    quantiles: tuple[int, ...]
+
+    def predict(self, X: np.ndarray) -> np.ndarray:  # noqa: N803
+        """Predict all slots and quantiles in one batched product.
+
+        The result equals the predictions of the individual models up
+        to the floating-point summation order.
+
+        Args:
+            X: Features with shape (n_days, n_slots, n_features).
+
+        Returns:
+            Predictions with shape (n_days, n_slots, n_quantiles).
+        """
+        return np.einsum("dsf,sqf->dsq", X, self.coef) + self.intercept
+
+
+def compile_linear(
+    qrs: QRs,
+    frequency: Frequency,
+    quantiles: list[int],
+    slot_groups: np.ndarray | None = None,
+    slot_features: np.ndarray | None = None,
+) -> LinearStack:
+    """Compile linear quantile models into stacked coefficients.
+
+    Args:
+        qrs: Fitted linear quantile models.
+        frequency: Frequency of the data.
+        quantiles: Quantiles to compile.
+        slot_groups: First slot of the group of every slot. Defaults to
+            one group per slot.
+        slot_features: Slot features appended to the features of the
+            models with shape (n_slots, n_slot_features).
+    """
+    n_slots = 24 * 60 // frequency.value
+    if slot_groups is None:
+        slot_groups = np.arange(n_slots)
+    n_slot_features = 0 if slot_features is None else slot_features.shape[1]
+    n_features = next(iter(qrs.values())).coef_.shape[0] - n_slot_features
+    quantile_pos = {q: i for i, q in enumerate(quantiles)}
+    coef = np.zeros((n_slots, len(quantiles), n_features))
+    intercept = np.full((n_slots, len(quantiles)), np.nan)
+    for (h, m, q), mdl in qrs.items():
+        group = (h * 60 + m) // frequency.value
+        slots = np.flatnonzero(slot_groups == group)
+        coef[slots, quantile_pos[q]] = mdl.coef_[:n_features]
+        intercept[slots, quantile_pos[q]] = mdl.intercept_
+        if slot_features is not None:
+            intercept[slots, quantile_pos[q]] += (
+                slot_features[slots] @ mdl.coef_[n_features:]
+            )
+    return LinearStack(
+        coef=coef,
+        intercept=intercept,
+        quantiles=tuple(quantiles),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class TreeStack:
+    """Flattened tree ensembles of gradient boosting quantile models.
+
+    Both the exact and the histogram-based gradient boosting models are
+    supported. The nodes of all trees are stored in contiguous arrays.
+    Leaves point to themselves, so a traversal can run a fixed number of
+    steps. The trees of a model are stored consecutively, and the models
+    are ordered by slot and quantile, i.e. the trees of slot ``s`` and
+    quantile position ``k`` are ``roots[tree_ptr[i]:tree_ptr[i + 1]]``
+    with ``i = s * n_quantiles + k``.
+
+    Args:
+        feature: Split feature of every node.
+        threshold: Split threshold of every node.
+        left: Left child of every node.
+        right: Right child of every node.
+        value: Value of every node.
+        roots: Root node of every tree.
+        tree_ptr: Offsets of the trees of every model.
+        init: Initial predictions with shape (n_slots, n_quantiles).
+        learning_rate: Learning rates with shape
+            (n_slots, n_quantiles).
+        max_depth: Maximum depth of all trees.
+        quantiles: Quantiles along the second axis.
+        slot_groups: First slot of the group of every slot, whose
+            models predict the slot. Defaults to one group per slot.
+        slot_features: Slot features appended to the features of the
+            models with shape (n_slots, n_slot_features).
+        missing_left: Whether missing values go to the left child of
+            every node. Missing values go to the right child if None.
+        single_precision: Whether the features are compared in single
+            precision, like the exact gradient boosting models do. The
+            histogram-based models compare in double precision.
+    """
+
+    feature: np.ndarray
+    threshold: np.ndarray
+    left: np.ndarray
+    right: np.ndarray
+    value: np.ndarray
+    roots: np.ndarray
+    tree_ptr: np.ndarray
+    init: np.ndarray
+    learning_rate: np.ndarray
+    max_depth: int
+    quantiles: tuple[int, ...]
+    slot_groups: np.ndarray | None = None
+    slot_features: np.ndarray | None = None
+    missing_left: np.ndarray | None = None
+    single_precision: bool = True
+
+    def predict(self, X: np.ndarray) -> np.ndarray:  # noqa: N803
+        """Predict all quantiles of a slot in one traversal.
+
+        Like scikit-learn, the features are compared in the precision of
+        the models and the scaled tree values are added in the order of
+        the boosting stages, so the predictions equal those of the
+        individual models.
+
+        Args:
+            X: Features with shape (n_days, n_slots, n_features).
+
+        Returns:
+            Predictions with shape (n_days, n_slots, n_quantiles).
+        """
+        n_days, n_slots, _ = X.shape
+        n_quantiles = len(self.quantiles)
+        dtype = np.float32 if self.single_precision else np.float64
+        X = X.astype(dtype)  # noqa: N806
+        rows = np.arange(n_days)[:, np.newaxis]
+        predictions = np.full((n_days, n_slots, n_quantiles), np.nan)
+        for slot in range(n_slots):
+            group = (
+                slot if self.slot_groups is None else self.slot_groups[slot]
+            )
+            ptr = self.tree_ptr[
+                group * n_quantiles : (group + 1) * n_quantiles + 1
+            ]
+            if ptr[0] == ptr[-1]:
+                continue
+            X_slot = X[:, slot]  # noqa: N806
+            if self.slot_features is not None:
+                X_slot = np.hstack(  # noqa: N806
+                    [
+                        X_slot,
+                        np.broadcast_to(
+                            self.slot_features[slot].astype(dtype),
+                            (n_days, self.slot_features.shape[1]),
+                        ),
+                    ],
+                )
+            nodes = np.tile(self.roots[ptr[0] : ptr[-1]], (n_days, 1))
+            for _ in range(self.max_depth):
+                x = X_slot[rows, self.feature[nodes]]
+                go_left = x <= self.threshold[nodes]
+                if self.missing_left is not None:
+                    go_left |= np.isnan(x) & self.missing_left[nodes]
+                nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+            values = self.value[nodes]
+            for k in range(n_quantiles):
+                begin, end = ptr[k] - ptr[0], ptr[k + 1] - ptr[0]
+                if begin == end:
+                    continue
+                stages = np.empty((n_days, end - begin + 1))
+                stages[:, 0] = self.init[group, k]
+                np.multiply(
+                    self.learning_rate[group, k],
+                    values[:, begin:end],
+                    out=stages[:, 1:],
+                )
+                # Accumulate sequentially, like scikit-learn does.
+                predictions[:, slot, k] = np.cumsum(stages, axis=1)[:, -1]
+        return predictions
+
+
+def compile_trees(
+    qrs: QRs,
+    frequency: Frequency,
+    quantiles: list[int],
+    slot_groups: np.ndarray | None = None,
+    slot_features: np.ndarray | None = None,
+) -> TreeStack:
+    """Compile gradient boosting quantile models into flat node arrays.
+
+    Args:
+        qrs: Fitted exact or histogram-based gradient boosting quantile
+            models.
+        frequency: Frequency of the data.
+        quantiles: Quantiles to compile.
+        slot_groups: First slot of the group of every slot. Defaults to
+            one group per slot.
+        slot_features: Slot features appended to the features of the
+            models with shape (n_slots, n_slot_features).
+    """
+    n_slots = 24 * 60 // frequency.value
+    quantile_pos = {q: i for i, q in enumerate(quantiles)}
+    models = {
+        ((h * 60 + m) // frequency.value, quantile_pos[q]): mdl
+        for (h, m, q), mdl in qrs.items()
+    }
+    hist = any(
+        isinstance(mdl, HistGradientBoostingRegressor)
+        for mdl in models.values()
+    )
+    init = np.full((n_slots, len(quantiles)), np.nan)
+    learning_rate = np.zeros((n_slots, len(quantiles)))
+    trees = []
+    n_trees = [0]
+    for slot, k in itertools.product(range(n_slots), range(len(quantiles))):
+        mdl = models.get((slot, k))
+        if mdl is None:
+            n_trees.append(0)
+            continue
+        init[slot, k], learning_rate[slot, k], mdl_trees = _get_trees(mdl)
+        trees.extend(mdl_trees)
+        n_trees.append(len(mdl_trees))
+
+    node_counts = np.array([len(tree.left) for tree in trees], dtype=np.intp)
+    roots = np.concatenate([[0], np.cumsum(node_counts)[:-1]]).astype(np.intp)
+    feature = np.concatenate([tree.feature for tree in trees])
+    threshold = np.concatenate([tree.threshold for tree in trees])
+    left = np.concatenate([tree.left for tree in trees])
+    right = np.concatenate([tree.right for tree in trees])
+    value = np.concatenate([tree.value for tree in trees])
+    is_leaf = np.concatenate([tree.is_leaf for tree in trees])
+
+    # Children are stored relative to their tree, leaves point to
+    # themselves.
+    offsets = np.repeat(roots, node_counts)
+    nodes = np.arange(len(left), dtype=np.intp)
+    left = np.where(is_leaf, nodes, left + offsets)
+    right = np.where(is_leaf, nodes, right + offsets)
+    feature = np.where(is_leaf, 0, feature)
+
+    return TreeStack(
+        feature=feature.astype(np.intp),
+        threshold=threshold.astype(np.float64),
+        left=left,
+        right=right,
+        value=value.astype(np.float64),
+        roots=roots,
+        tree_ptr=np.cumsum(n_trees).astype(np.intp),
+        init=init,
+        learning_rate=learning_rate,
+        max_depth=max((tree.max_depth for tree in trees), default=0),
+        quantiles=tuple(quantiles),
+        slot_groups=slot_groups,
+        slot_features=slot_features,
+        missing_left=(
+            np.concatenate([tree.missing_left for tree in trees])
+            if hist
+            else None
+        ),
+        single_precision=not hist,
+    )
+
+
+def _get_trees(
+    mdl: GradientBoostingRegressor | HistGradientBoostingRegressor,
+) -> tuple[float, float, list[_TreeNodes]]:
+    """Get the initial prediction, learning rate and trees of a model.
+
+    The leaf values of the histogram-based models already include the
+    learning rate, so their learning rate is 1.
+
+    Args:
+        mdl: Fitted gradient boosting quantile model.
+    """
+    if isinstance(mdl, HistGradientBoostingRegressor):
+        return (
+            float(mdl._baseline_prediction.ravel()[0]),  # noqa: SLF001
+            1.0,
+            [_get_hist_nodes(p[0]) for p in mdl._predictors],  # noqa: SLF001
+        )
+    return (
+        _get_init_prediction(mdl),
+        mdl.learning_rate,
+        [_get_tree_nodes(est.tree_) for est in mdl.estimators_[:, 0]],
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class _TreeNodes:
+    """Nodes of a single tree with children relative to the tree."""
+
+    feature: np.ndarray
+    threshold: np.ndarray
+    left: np.ndarray
+    right: np.ndarray
+    value: np.ndarray
+    is_leaf: np.ndarray
+    missing_left: np.ndarray | None
+    max_depth: int
+
+
+def _get_tree_nodes(tree: Tree) -> _TreeNodes:
+    """Get the nodes of a tree of an exact gradient boosting model.
+
+    Args:
+        tree: Fitted scikit-learn tree.
+    """
+    return _TreeNodes(
+        feature=tree.feature,
+        threshold=tree.threshold,
+        left=tree.children_left,
+        right=tree.children_right,
+        value=tree.value[:, 0, 0],
+        is_leaf=tree.children_left == _TREE_LEAF,
+        missing_left=None,
+        max_depth=tree.max_depth,
+    )
+
+
+def _get_hist_nodes(predictor: TreePredictor) -> _TreeNodes:
+    """Get the nodes of a tree of a histogram-based boosting model.
+
+    Args:
+        predictor: Fitted tree predictor.
+    """
+    nodes = predictor.nodes
+    if nodes["is_categorical"].any():
+        msg = "Only models without categorical splits can be compiled."
+        raise ValueError(msg)
+    return _TreeNodes(
+        feature=nodes["feature_idx"],
+        threshold=nodes["num_threshold"],
+        left=nodes["left"].astype(np.intp),
+        right=nodes["right"].astype(np.intp),
+        value=nodes["value"],
+        is_leaf=nodes["is_leaf"].astype(bool),
+        missing_left=nodes["missing_go_to_left"].astype(bool),
+        max_depth=int(nodes["depth"].max()),
+    )
+
+
+def _get_init_prediction(mdl: GradientBoostingRegressor) -> float:
+    """Get the constant initial prediction of a gradient boosting model.
+
+    Args:
+        mdl: Fitted gradient boosting model.
+    """
+    if isinstance(mdl.init_, str) and mdl.init_ == "zero":
+        return 0.0
+    if isinstance(mdl.init_, DummyRegressor):
+        return float(mdl.init_.constant_.ravel()[0])
+    msg = "Only models with a constant init estimator can be compiled."
+    raise ValueError(msg)
+
+
+CompiledModels = LinearStack | TreeStack
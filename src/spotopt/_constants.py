@@ -9,6 +9,9 @@ COLS_REQ: Final[frozenset[str]] = frozenset(["obs", "fcast"])
 
 QUANTILES: Final[list[int]] = [1, 5, 10, 25, 50, 75, 90, 95, 99]
 
+# Quantile of the single model fitted per slot in the residual mode.
+RESIDUAL_BASE_QUANTILE: Final[int] = 50
+
 BASE_DTYPES: dict = {
     "obs": float,
     "fcast": float,
@@ -22,11 +25,37 @@ CV_PARAMS = {
         "learning_rate": [0.1, 0.5],
         "n_estimators": [1000, 2000],
     },
+    "HGB": {
+        "learning_rate": [0.05, 0.1],
+        "max_iter": [200, 500],
+    },
 }
 
+# Parameters with the number of boosting stages.
+STAGES_PARAMS: Final[dict[str, str]] = {
+    "GBR": "n_estimators",
+    "HGB": "max_iter",
+}
+
+# scipy.optimize.linprog methods of QuantileRegressor that accept
+# sparse input.
+LASSO_SOLVERS: Final[frozenset[str]] = frozenset(
+    ["highs", "highs-ds", "highs-ipm"],
+)
+
 FORBIDDEN_KEYWORDS = {
     "Lasso": {"quantile"},
     "GBR": {"loss", "alpha"},
+    "HGB": {"loss", "quantile"},
 }
 
 DEFAULT_NR_CV = 3
+
+DEFAULT_N_JOBS = 1
+
+DEFAULT_VALIDATION_FRACTION = 0.1
+
+DEFAULT_LAG_COLS: Final[list[str]] = ["obs"]
+DEFAULT_LAG_DAYS: Final[list[int]] = [1]
+
+MODEL_FORMAT_VERSION = 1
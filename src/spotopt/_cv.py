@@ -0,0 +1,82 @@
+"""Cross-validation splits of the hyperparameter search."""
+
+from __future__ import annotations
+
+import numpy as np
+
+Splits = list[tuple[np.ndarray, np.ndarray]]
+
+
+def get_day_splits(
+    n_days: int,
+    n_splits: int,
+    gap_days: int = 0,
+    max_train_days: int | None = None,
+) -> Splits:
+    """Get forward-chaining splits of whole days.
+
+    Like ``sklearn.model_selection.TimeSeriesSplit``, the days are cut
+    into ``n_splits + 1`` blocks, and every block but the first is the
+    test block of a fold, which trains on the days before it.
+
+    Args:
+        n_days: Number of days.
+        n_splits: Number of folds.
+        gap_days: Number of days between the training and test days.
+        max_train_days: Maximum number of training days of a fold. All
+            previous days if None.
+
+    Returns:
+        Training and test days of every fold.
+    """
+    test_days = n_days // (n_splits + 1)
+    first_test = n_days - n_splits * test_days
+    if test_days == 0 or first_test - gap_days <= 0:
+        msg = (
+            f"{n_days} days are too few for {n_splits} forward splits "
+            f"with a gap of {gap_days} days."
+        )
+        raise ValueError(msg)
+    days = np.arange(n_days, dtype=np.intp)
+    splits = []
+    for test_start in range(first_test, n_days, test_days):
+        train_end = test_start - gap_days
+        train_start = (
+            0 if max_train_days is None else max(train_end - max_train_days, 0)
+        )
+        splits.append(
+            (
+                days[train_start:train_end],
+                days[test_start : test_start + test_days],
+            ),
+        )
+    return splits
+
+
+def get_row_splits(day_splits: Splits, days: np.ndarray) -> Splits:
+    """Map splits of days to the rows of a model.
+
+    The day splits are returned as they are if the model has one row
+    per day, so that all such models share the same index arrays.
+
+    Args:
+        day_splits: Training and test days of every fold.
+        days: Day position of every row in chronological order.
+    """
+    # The last test block ends with the last day.
+    n_days = int(day_splits[-1][1][-1]) + 1
+    if len(days) == n_days and (days == np.arange(n_days)).all():
+        return day_splits
+    row_splits = []
+    for train, test in day_splits:
+        train_mask = np.zeros(n_days, dtype=bool)
+        train_mask[train] = True
+        test_mask = np.zeros(n_days, dtype=bool)
+        test_mask[test] = True
+        row_splits.append(
+            (
+                np.flatnonzero(train_mask[days]),
+                np.flatnonzero(test_mask[days]),
+            ),
+        )
+    return row_splits
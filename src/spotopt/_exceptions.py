@@ -17,6 +17,10 @@ class ForbiddenKeyWordError(SpotOptConfigError):
     """Exception for keyword mismatch errors."""
 
 
+class InvalidConfigValueError(SpotOptConfigError):
+    """Exception for invalid configuration values."""
+
+
 class SpotOptInputError(SpotOptError):
     """Base exceptions for the spotopt input."""
 
@@ -35,3 +39,7 @@ class ShortTrainingDataError(SpotOptInputError):
 
 class ModelNotFittedError(SpotOptError):
     """Exception for model not fitted error."""
+
+
+class ModelFormatError(SpotOptError):
+    """Exception for incompatible saved models."""
@@ -3,25 +3,42 @@
 from __future__ import annotations
 
 import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
+from spotopt._types import WeekdayEncoding
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 _logger = logging.getLogger("spotopt")
 
+_WEEKDAY_COLS = [f"weekday_{i}" for i in range(1, 8)]
+
 
 def add_lags(
     df: pd.DataFrame,
     col_names: list[str],
-    lag_days: int,
+    lag_days: int | Sequence[int],
     *,
     drop_origin: bool = False,
 ) -> pd.DataFrame:
-    """Adds a lagged column to the DataFrame.
+    """Adds lagged columns to the DataFrame.
+
+    On a regular grid, as produced by ``account_for_dst``, a lag of a
+    day is an offset of the steps per day, so the columns are shifted
+    by position. Otherwise, they are shifted in time and aligned on the
+    index.
 
     Args:
         df: The input DataFrame.
         col_names: The names of the columns to lag.
-        lag_days: Lag in number of days.
+        lag_days: Lag or lags in number of days. Every column is lagged
+            by every lag.
         drop_origin: Whether to drop the original columns.
     """
     if not isinstance(df.index, pd.DatetimeIndex):
@@ -32,21 +49,40 @@ def add_lags(
         msg = "The index should not have a time zone internally."
         raise ValueError(msg)
 
-    if not isinstance(lag_days, int):
-        msg = "lag_days needs to be an integer."
-        raise TypeError(msg)
+    lags = list(lag_days) if isinstance(lag_days, list | tuple) else [lag_days]
+    for lag in lags:
+        if not isinstance(lag, int):
+            msg = "lag_days needs to be an integer."
+            raise TypeError(msg)
 
-    if lag_days < 1:
-        msg = "lag_days needs to be a positive integer."
-        raise ValueError(msg)
+        if lag < 1:
+            msg = "lag_days needs to be a positive integer."
+            raise ValueError(msg)
 
-    suffix = f"_lag_{lag_days}d"
-    lagged = (
-        df[col_names]
-        .shift(freq=pd.Timedelta(days=lag_days))
-        .rename(columns=lambda name: f"{name}{suffix}")
-    )
-    result = df.join(lagged)
+    names = [f"{name}_lag_{lag}d" for name in col_names for lag in lags]
+    steps_per_day = _get_steps_per_day(df.index, full_days=False)
+    if steps_per_day is None:
+        lagged = pd.concat(
+            [
+                df[col_names]
+                .shift(freq=pd.Timedelta(days=lag))
+                .add_suffix(f"_lag_{lag}d")
+                for lag in lags
+            ],
+            axis=1,
+        )
+        result = df.join(lagged[names])
+    else:
+        values = df[col_names].to_numpy(dtype=float)
+        shifted = np.full((len(df), len(names)), np.nan)
+        for i, lag in enumerate(lags):
+            offset = lag * steps_per_day
+            if offset < len(df):
+                shifted[offset:, i :: len(lags)] = values[:-offset]
+        result = pd.concat(
+            [df, pd.DataFrame(shifted, index=df.index, columns=names)],
+            axis=1,
+        )
     if drop_origin:
         result = result.drop(columns=col_names)
     return result
@@ -54,21 +90,24 @@ def add_lags(
 
 def add_weekday_dummies(
     df: pd.DataFrame,
+    encoding: WeekdayEncoding = WeekdayEncoding.DUMMIES,
+    dtype: type = int,
 ) -> pd.DataFrame:
     """Adds dummy variables for weekdays.
 
+    The dummies are rows of an identity matrix indexed by the weekday.
+
     Args:
         df: The input DataFrame.
+        encoding: Encoding of the weekday.
+        dtype: Data type of the weekday columns.
     """
-    weekdays = df.index.weekday + 1
-    dummies = pd.get_dummies(weekdays, prefix="weekday")
-    # Ensure all expected columns are present.
-    expected_cols = [f"weekday_{i}" for i in range(1, 8)]
-    dummies = dummies.reindex(columns=expected_cols, fill_value=0)
-    dummies.index = df.index
-    dummies = dummies.astype(int)
-    result = pd.concat([df, dummies], axis=1)
-    return result[df.columns.tolist() + expected_cols]
+    weekday = df.index.weekday
+    if encoding == WeekdayEncoding.CATEGORICAL:
+        return df.assign(weekday=(weekday + 1).astype(dtype))
+    dummies = np.eye(7, dtype=dtype)[weekday]
+    block = pd.DataFrame(dummies, index=df.index, columns=_WEEKDAY_COLS)
+    return pd.concat([df, block], axis=1)
 
 
 def add_daily_min_max_obs(
@@ -76,11 +115,302 @@ def add_daily_min_max_obs(
 ) -> pd.DataFrame:
     """Add daily min. and max. values for the 'obs' column.
 
+    On a regular grid of complete days, as produced by
+    ``account_for_dst``, the values are reshaped to one row per day.
+    Otherwise, they are grouped by date.
+
     Args:
         df: The input DataFrame.
     """
-    grouped = df.groupby(df.index.date)["obs"]
+    steps_per_day = _get_steps_per_day(df.index, full_days=True)
+    if steps_per_day is None:
+        grouped = df.groupby(df.index.date)["obs"]
+        return df.assign(
+            obs_min=grouped.transform("min"),
+            obs_max=grouped.transform("max"),
+        )
+    daily = df["obs"].to_numpy().reshape(-1, steps_per_day)
+    # fmin and fmax ignore NaN values like the groupby aggregation.
+    return df.assign(
+        obs_min=np.repeat(np.fmin.reduce(daily, axis=1), steps_per_day),
+        obs_max=np.repeat(np.fmax.reduce(daily, axis=1), steps_per_day),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class FeatureStats:
+    """Statistics of building the features.
+
+    Args:
+        stage_seconds: Wall-clock time of every stage in seconds.
+        design_bytes: Size of the design matrix in bytes.
+    """
+
+    stage_seconds: dict[str, float]
+    design_bytes: int
+
+
+def build_features(
+    df: pd.DataFrame,
+    lag_cols: list[str],
+    lag_days: list[int],
+    weekday_encoding: WeekdayEncoding = WeekdayEncoding.DUMMIES,
+) -> tuple[pd.DataFrame, FeatureStats]:
+    """Build all features into one preallocated design matrix.
+
+    The result equals chaining ``add_lags``, ``add_daily_min_max_obs``,
+    ``add_lags`` of the daily min. and max., dropping the rows with
+    missing lags, ``add_weekday_dummies`` and adding the hour and
+    minute, except that all columns are floats. On a regular grid, the
+    rows that are kept are determined first, and every feature block
+    is written into its columns of a single float array.
+    Irregular input falls back to the chained functions.
+
+    Args:
+        df: DataFrame with a DatetimeIndex without time zone.
+        lag_cols: Columns to lag.
+        lag_days: Lags in days.
+        weekday_encoding: Encoding of the weekday.
+    """
+    stage_seconds: dict[str, float] = {}
+    start = time.perf_counter()
+    steps_per_day = _get_steps_per_day(df.index, full_days=False)
+    if steps_per_day is None:
+        df = _chain_features(df, lag_cols, lag_days, weekday_encoding)
+        stage_seconds["chained"] = time.perf_counter() - start
+        return df, FeatureStats(stage_seconds, df.to_numpy().nbytes)
+
+    n_rows = len(df)
+    first = df.index[0]
+    step = pd.Timedelta(days=1) / steps_per_day
+    first_pos = int((first - first.normalize()) // step)
+    day = (np.arange(n_rows) + first_pos) // steps_per_day
+    columns = {c: df[c].to_numpy(dtype=float) for c in df.columns}
+
+    padded = np.full((day[-1] + 1) * steps_per_day, np.nan)
+    padded[first_pos : first_pos + n_rows] = columns["obs"]
+    daily = padded.reshape(-1, steps_per_day)
+    # fmin and fmax ignore NaN values like the groupby aggregation.
+    daily_min = np.concatenate([[np.nan], np.fmin.reduce(daily, axis=1)])
+    daily_max = np.concatenate([[np.nan], np.fmax.reduce(daily, axis=1)])
+    start = _lap(stage_seconds, "min_max", start)
+
+    keep = _get_rows_with_lags(columns, lag_cols, lag_days, steps_per_day)
+    keep &= ~np.isnan(daily_min[day])
+    rows = np.flatnonzero(keep)
+    start = _lap(stage_seconds, "filter", start)
+
+    lag_names = [f"{c}_lag_{lag}d" for c in lag_cols for lag in lag_days]
+    names = [
+        *df.columns,
+        *lag_names,
+        "obs_min_lag_1d",
+        "obs_max_lag_1d",
+        *_get_weekday_cols(weekday_encoding),
+        "hour",
+        "minute",
+    ]
+    design = np.empty((len(rows), len(names)))
+    for j, name in enumerate(df.columns):
+        np.take(columns[name], rows, out=design[:, j])
+    j = len(df.columns)
+    for name in lag_cols:
+        for lag in lag_days:
+            offset = lag * steps_per_day
+            np.take(columns[name], rows - offset, out=design[:, j])
+            j += 1
+    np.take(daily_min, day[rows], out=design[:, j])
+    np.take(daily_max, day[rows], out=design[:, j + 1])
+    start = _lap(stage_seconds, "lags", start)
+
+    if len(rows) and rows[-1] - rows[0] + 1 == len(rows):
+        # Slicing keeps the frequency of the index.
+        index = df.index[rows[0] : rows[-1] + 1]
+    else:
+        index = df.index[rows]
+    _write_calendar(design[:, j + 2 :], index, weekday_encoding)
+    start = _lap(stage_seconds, "calendar", start)
+
+    result = pd.DataFrame(design, index=index, columns=names, copy=False)
+    _lap(stage_seconds, "frame", start)
+    return result, FeatureStats(stage_seconds, design.nbytes)
+
+
+def build_day_features(
+    fit_cols: list[str],
+    columns: dict[str, np.ndarray],
+    previous_obs: np.ndarray,
+    weekday: int,
+) -> np.ndarray:
+    """Build the features of a single day from arrays.
+
+    The result equals the rows of the day built by ``build_features``
+    if the only lagged values are the observations of the previous day.
+
+    Args:
+        fit_cols: Feature columns.
+        columns: Values of the columns of the day, e.g. ``fcast``, with
+            one value per step of the day.
+        previous_obs: Observations of the previous day.
+        weekday: Weekday of the day, 0 for Monday.
+
+    Returns:
+        Features with shape (n_steps, n_features).
+    """
+    design = np.empty((len(previous_obs), len(fit_cols)))
+    for j, name in enumerate(fit_cols):
+        if name in columns:
+            design[:, j] = columns[name]
+        elif name == "obs_lag_1d":
+            design[:, j] = previous_obs
+        elif name == "obs_min_lag_1d":
+            # fmin and fmax ignore NaN values like build_features.
+            design[:, j] = np.fmin.reduce(previous_obs)
+        elif name == "obs_max_lag_1d":
+            design[:, j] = np.fmax.reduce(previous_obs)
+        elif name in _WEEKDAY_COLS:
+            design[:, j] = float(name == _WEEKDAY_COLS[weekday])
+        elif name == "weekday":
+            design[:, j] = weekday + 1
+        else:
+            msg = f"The feature {name!r} cannot be built from the arrays."
+            raise ValueError(msg)
+    return design
+
+
+def _get_rows_with_lags(
+    columns: dict[str, np.ndarray],
+    lag_cols: list[str],
+    lag_days: list[int],
+    steps_per_day: int,
+) -> np.ndarray:
+    """Get the rows without missing lags on a regular grid.
+
+    This includes the lag of a day of the daily min. and max. and the
+    columns that already contain lags.
+
+    Args:
+        columns: Values of the columns.
+        lag_cols: Columns to lag.
+        lag_days: Lags in days.
+        steps_per_day: Number of steps per day.
+    """
+    keep = np.ones(len(columns["obs"]), dtype=bool)
+    keep[:steps_per_day] = False
+    for name, values in columns.items():
+        if "lag" in name:
+            keep &= ~np.isnan(values)
+    for name in lag_cols:
+        missing = np.isnan(columns[name])
+        for lag in lag_days:
+            offset = lag * steps_per_day
+            keep[:offset] = False
+            keep[offset:] &= ~missing[:-offset]
+    return keep
+
+
+def _write_calendar(
+    block: np.ndarray,
+    index: pd.DatetimeIndex,
+    weekday_encoding: WeekdayEncoding,
+) -> None:
+    """Write the weekday columns, hour and minute into a block.
+
+    Args:
+        block: Columns of the design matrix.
+        index: Index of the rows.
+        weekday_encoding: Encoding of the weekday.
+    """
+    if weekday_encoding == WeekdayEncoding.DUMMIES:
+        block[:, :-2] = 0.0
+        block[np.arange(len(index)), index.weekday] = 1.0
+    elif weekday_encoding == WeekdayEncoding.CATEGORICAL:
+        block[:, 0] = index.weekday + 1
+    block[:, -2] = index.hour
+    block[:, -1] = index.minute
+
+
+def _get_weekday_cols(encoding: WeekdayEncoding) -> list[str]:
+    """Get the weekday columns of the design matrix.
+
+    Args:
+        encoding: Encoding of the weekday.
+    """
+    match encoding:
+        case WeekdayEncoding.DUMMIES:
+            return _WEEKDAY_COLS
+        case WeekdayEncoding.CATEGORICAL:
+            return ["weekday"]
+
+
+def _chain_features(
+    df: pd.DataFrame,
+    lag_cols: list[str],
+    lag_days: list[int],
+    weekday_encoding: WeekdayEncoding = WeekdayEncoding.DUMMIES,
+) -> pd.DataFrame:
+    """Build all features by chaining the feature functions.
+
+    Args:
+        df: DataFrame with a DatetimeIndex without time zone.
+        lag_cols: Columns to lag.
+        lag_days: Lags in days.
+        weekday_encoding: Encoding of the weekday.
+    """
+    df = add_lags(df.astype(float), lag_cols, lag_days=lag_days)
+    df = add_daily_min_max_obs(df)
+    df = add_lags(df, ["obs_min", "obs_max"], lag_days=1, drop_origin=True)
+    # Remove null values that come from adding lags.
+    df = df.dropna(subset=[c for c in df.columns if "lag" in c])
+    df = add_weekday_dummies(df, weekday_encoding, dtype=float)
     return df.assign(
-        obs_min=grouped.transform("min"),
-        obs_max=grouped.transform("max"),
+        hour=df.index.hour.astype(float),
+        minute=df.index.minute.astype(float),
     )
+
+
+def _lap(stage_seconds: dict[str, float], stage: str, start: float) -> float:
+    """Record the time of a stage and return the start of the next one.
+
+    Args:
+        stage_seconds: Wall-clock time of every stage in seconds.
+        stage: Name of the stage.
+        start: Start time of the stage.
+    """
+    now = time.perf_counter()
+    stage_seconds[stage] = now - start
+    return now
+
+
+def _get_steps_per_day(
+    index: pd.Index,
+    *,
+    full_days: bool,
+) -> int | None:
+    """Get the number of steps per day of a regular grid.
+
+    Args:
+        index: The index of the DataFrame.
+        full_days: Whether the grid must start at midnight and cover
+            complete days.
+
+    Returns:
+        Number of steps per day, or None if the index is not such a
+        grid.
+    """
+    if (
+        not isinstance(index, pd.DatetimeIndex)
+        or index.tz is not None
+        or len(index) < 2  # noqa: PLR2004
+    ):
+        return None
+    values = index.asi8
+    step = values[1] - values[0]
+    day = pd.Timedelta(days=1).value // pd.Timedelta(1, unit=index.unit).value
+    if step <= 0 or day % step or (np.diff(values) != step).any():
+        return None
+    if full_days and (
+        len(index) % (day // step) or index[0] != index[0].normalize()
+    ):
+        return None
+    return int(day // step)
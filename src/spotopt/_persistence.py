@@ -0,0 +1,149 @@
+"""Saving and loading of fitted models."""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+import spotopt._constants as const
+from spotopt._compiled import CompiledModels, LinearStack, TreeStack
+from spotopt._exceptions import ModelFormatError
+from spotopt._types import SpotOptConfig
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_logger = logging.getLogger("spotopt")
+
+_METADATA_FILE = "metadata.json"
+_COMPILED_DIR = "compiled"
+_ARRAYS_DIR = "arrays"
+_COMPILED_TYPES: dict[str, type[CompiledModels]] = {
+    "LinearStack": LinearStack,
+    "TreeStack": TreeStack,
+}
+
+
+def get_config_fingerprint(config: dict[str, Any]) -> str:
+    """Get a fingerprint of a configuration.
+
+    Args:
+        config: spotopt configuration as a dictionary.
+    """
+    raw = json.dumps(config, sort_keys=True)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def save_model(
+    path: Path,
+    config: SpotOptConfig,
+    fit_cols: list[str],
+    compiled: CompiledModels,
+    arrays: dict[str, np.ndarray] | None = None,
+) -> None:
+    """Save a compiled model to a directory.
+
+    Every array is stored as a separate ``.npy`` file, so that it can be
+    memory-mapped when loading. Everything else is stored in a json
+    metadata file.
+
+    Args:
+        path: Target directory.
+        config: spotopt configuration.
+        fit_cols: Columns used for fitting.
+        compiled: Compiled models.
+        arrays: Further model arrays, e.g. residual offsets.
+    """
+    arrays = arrays or {}
+    arrays_dir = path / _ARRAYS_DIR
+    arrays_dir.mkdir(parents=True, exist_ok=True)
+    for name, array in arrays.items():
+        np.save(arrays_dir / f"{name}.npy", array)
+    compiled_dir = path / _COMPILED_DIR
+    compiled_dir.mkdir(parents=True, exist_ok=True)
+    attributes = {}
+    for field in dataclasses.fields(compiled):
+        value = getattr(compiled, field.name)
+        if isinstance(value, np.ndarray):
+            np.save(compiled_dir / f"{field.name}.npy", value)
+        else:
+            attributes[field.name] = value
+    metadata = {
+        "format_version": const.MODEL_FORMAT_VERSION,
+        "config": config.to_dict(),
+        "config_fingerprint": get_config_fingerprint(config.to_dict()),
+        "fit_cols": fit_cols,
+        "compiled": {
+            "type": type(compiled).__name__,
+            "attributes": attributes,
+        },
+        "arrays": sorted(arrays),
+    }
+    (path / _METADATA_FILE).write_text(
+        json.dumps(metadata, indent=2),
+        encoding="utf-8",
+    )
+    _logger.info("Saved model to %s.", path)
+
+
+def load_model(
+    path: Path,
+    *,
+    mmap: bool = True,
+) -> tuple[SpotOptConfig, list[str], CompiledModels, dict[str, np.ndarray]]:
+    """Load a compiled model from a directory.
+
+    Args:
+        path: Directory of the saved model.
+        mmap: Whether to memory-map the arrays. Memory-mapped arrays are
+            read-only and shared between processes.
+    """
+    metadata = json.loads((path / _METADATA_FILE).read_text(encoding="utf-8"))
+    if metadata.get("format_version") != const.MODEL_FORMAT_VERSION:
+        msg = (
+            f"Unsupported model format version "
+            f"{metadata.get('format_version')}, expected "
+            f"{const.MODEL_FORMAT_VERSION}."
+        )
+        raise ModelFormatError(msg)
+    # The fingerprint is checked on the stored dictionary, so that it
+    # does not depend on options added to the configuration later.
+    if (
+        get_config_fingerprint(metadata["config"])
+        != metadata["config_fingerprint"]
+    ):
+        msg = "The configuration does not match its fingerprint."
+        raise ModelFormatError(msg)
+    config = SpotOptConfig.from_dict(metadata["config"])
+
+    compiled_type = _COMPILED_TYPES[metadata["compiled"]["type"]]
+    attributes = metadata["compiled"]["attributes"]
+    kwargs = {}
+    for field in dataclasses.fields(compiled_type):
+        if field.name in attributes:
+            value = attributes[field.name]
+            kwargs[field.name] = (
+                tuple(value) if isinstance(value, list) else value
+            )
+        elif (path / _COMPILED_DIR / f"{field.name}.npy").exists():
+            kwargs[field.name] = np.load(
+                path / _COMPILED_DIR / f"{field.name}.npy",
+                mmap_mode="r" if mmap else None,
+            )
+        elif field.default is dataclasses.MISSING:
+            msg = f"The compiled models are missing {field.name!r}."
+            raise ModelFormatError(msg)
+    arrays = {
+        name: np.load(
+            path / _ARRAYS_DIR / f"{name}.npy",
+            mmap_mode="r" if mmap else None,
+        )
+        for name in metadata["arrays"]
+    }
+    _logger.info("Loaded model from %s.", path)
+    return config, metadata["fit_cols"], compiled_type(**kwargs), arrays
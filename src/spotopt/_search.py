@@ -0,0 +1,237 @@
+"""Hyperparameter search."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import numpy as np
+from sklearn.base import clone
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.metrics import mean_pinball_loss
+from sklearn.model_selection import (
+    GridSearchCV,
+    HalvingGridSearchCV,
+    ParameterGrid,
+    RandomizedSearchCV,
+    check_cv,
+)
+
+from spotopt._types import SearchStrategy
+
+if TYPE_CHECKING:
+    from scipy import sparse
+    from sklearn.base import RegressorMixin
+    from sklearn.ensemble import GradientBoostingRegressor
+    from sklearn.linear_model import QuantileRegressor
+    from sklearn.model_selection._search import BaseSearchCV
+
+    from spotopt._cv import Splits
+    from spotopt._types import SpotOptConfig
+
+    Boosting = GradientBoostingRegressor | HistGradientBoostingRegressor
+
+_logger = logging.getLogger("spotopt")
+
+
+def get_search_cv(
+    mdl: RegressorMixin,
+    config: SpotOptConfig,
+    cv: int | Splits,
+) -> BaseSearchCV:
+    """Get the hyperparameter search of a single model.
+
+    The candidates of the randomized and halving searches are drawn
+    reproducibly.
+
+    Args:
+        mdl: Unfitted model.
+        config: spotopt configuration with a grid, randomized or halving
+            search strategy.
+        cv: Number of folds, or the training and test rows of every
+            fold.
+    """
+    space = dict(config.search_params)
+    match config.search_strategy:
+        case SearchStrategy.RANDOM:
+            return RandomizedSearchCV(
+                mdl,
+                space,
+                n_iter=10 if config.n_iter is None else config.n_iter,
+                cv=cv,
+                random_state=0,
+            )
+        case SearchStrategy.HALVING:
+            resource = config.search_resource or "n_samples"
+            kwargs = {}
+            if resource != "n_samples":
+                # The first iteration is chosen so that the last one
+                # uses the largest number of stages. Starting at the
+                # smallest one stops early with few candidates.
+                kwargs = {
+                    "min_resources": "exhaust",
+                    "max_resources": max(space.pop(resource)),
+                }
+            return HalvingGridSearchCV(
+                mdl,
+                space,
+                resource=resource,
+                cv=cv,
+                random_state=0,
+                **kwargs,
+            )
+    return GridSearchCV(mdl, space, refit=True, cv=cv)
+
+
+def search_lasso_path(
+    mdls: list[QuantileRegressor],
+    X: np.ndarray | sparse.csr_array,  # noqa: N803
+    y: np.ndarray,
+    alphas: list[float],
+    cv: int | Splits,
+) -> tuple[list[QuantileRegressor], float]:
+    """Select one alpha for the quantile models of a slot and fit them.
+
+    All quantiles share the folds. The alphas are solved in increasing
+    order per fold and quantile. Once all coefficients are zero, they
+    stay zero for every larger alpha, so the remaining solves are
+    skipped. The alpha with the lowest pinball loss summed over the
+    folds and quantiles is used to refit the models on all rows.
+
+    Args:
+        mdls: Unfitted quantile models, one per quantile.
+        X: Features.
+        y: Target.
+        alphas: Candidate alphas.
+        cv: Number of folds, or the training and test rows of every
+            fold.
+
+    Returns:
+        Fitted models and the selected alpha.
+    """
+    alphas = sorted(alphas)
+    losses = np.zeros((len(alphas), len(mdls)))
+    for train, test in check_cv(cv).split(X):
+        for k, mdl in enumerate(mdls):
+            for i, alpha in enumerate(alphas):
+                fold_mdl = clone(mdl).set_params(alpha=alpha)
+                fold_mdl.fit(X[train], y[train])
+                loss = mean_pinball_loss(
+                    y[test],
+                    fold_mdl.predict(X[test]),
+                    alpha=mdl.quantile,
+                )
+                if not fold_mdl.coef_.any():
+                    losses[i:, k] += loss
+                    break
+                losses[i, k] += loss
+    best = alphas[int(np.argmin(losses.sum(axis=1)))]
+    _logger.debug("Selected alpha %s from the losses %s.", best, losses)
+    fitted = [clone(mdl).set_params(alpha=best).fit(X, y) for mdl in mdls]
+    return fitted, best
+
+
+def search_boosting_stages(
+    mdls: list[Boosting],
+    X: np.ndarray,  # noqa: N803
+    y: np.ndarray,
+    param_grid: dict[str, list],
+    cv: int | Splits,
+) -> list[Boosting]:
+    """Select the parameters of gradient boosting models and fit them.
+
+    Per fold and combination of the other parameters, only the model
+    with the largest number of stages is fitted. Every candidate number
+    of estimators is scored on its staged predictions, since the first
+    stages of a boosting ensemble do not depend on the later ones. The
+    parameters with the lowest pinball loss summed over the folds are
+    selected per model, and the model is refitted with them on all
+    rows.
+
+    Args:
+        mdls: Unfitted quantile models, one per quantile.
+        X: Features.
+        y: Target.
+        param_grid: Candidate parameters, including the number of
+            stages, i.e. ``n_estimators`` or ``max_iter`` of the
+            histogram-based models.
+        cv: Number of folds, or the training and test rows of every
+            fold.
+    """
+    stages = _get_stages_param(mdls[0])
+    counts = sorted(param_grid[stages])
+    others = list(
+        ParameterGrid({k: v for k, v in param_grid.items() if k != stages}),
+    )
+    losses = np.zeros((len(mdls), len(others), len(counts)))
+    for train, test in check_cv(cv).split(X):
+        for k, mdl in enumerate(mdls):
+            for i, params in enumerate(others):
+                fold_mdl = clone(mdl).set_params(
+                    **params,
+                    **{stages: counts[-1]},
+                )
+                fold_mdl.fit(X[train], y[train])
+                losses[k, i] += _score_stages(
+                    fold_mdl,
+                    X[test],
+                    y[test],
+                    counts,
+                )
+    fitted = []
+    for k, mdl in enumerate(mdls):
+        i, j = np.unravel_index(np.argmin(losses[k]), losses[k].shape)
+        params = {**others[i], stages: counts[j]}
+        _logger.debug("Selected %s from the losses %s.", params, losses[k])
+        fitted.append(clone(mdl).set_params(**params).fit(X, y))
+    return fitted
+
+
+def _get_stages_param(mdl: Boosting) -> str:
+    """Get the name of the number of stages of a boosting model.
+
+    Args:
+        mdl: Gradient boosting quantile model.
+    """
+    if isinstance(mdl, HistGradientBoostingRegressor):
+        return "max_iter"
+    return "n_estimators"
+
+
+def _score_stages(
+    mdl: Boosting,
+    X: np.ndarray,  # noqa: N803
+    y: np.ndarray,
+    counts: list[int],
+) -> np.ndarray:
+    """Score a gradient boosting model truncated to several lengths.
+
+    Counts beyond the number of fitted stages, e.g. after early
+    stopping, are scored with all stages.
+
+    Args:
+        mdl: Fitted quantile model.
+        X: Features.
+        y: Target.
+        counts: Sorted numbers of estimators.
+
+    Returns:
+        Pinball loss of every number of estimators.
+    """
+    quantile = (
+        mdl.quantile
+        if isinstance(mdl, HistGradientBoostingRegressor)
+        else mdl.alpha
+    )
+    losses = np.empty(len(counts))
+    j = 0
+    for stage, predictions in enumerate(mdl.staged_predict(X), start=1):
+        loss = mean_pinball_loss(y, predictions, alpha=quantile)
+        while j < len(counts) and counts[j] == stage:
+            losses[j] = loss
+            j += 1
+        if j == len(counts):
+            break
+    losses[j:] = loss
+    return losses
@@ -0,0 +1,348 @@
+"""Slot-partitioned data layout."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from spotopt._types import SearchScope, SlotEncoding
+
+if TYPE_CHECKING:
+    from spotopt._types import Frequency, SpotOptConfig
+
+
+@dataclass(frozen=True, slots=True)
+class SlotData:
+    """Prepared data partitioned by look-ahead slot.
+
+    A slot is a look-ahead time of the day, e.g. slot 5 is 01:15 for
+    quarter-hourly data.
+
+    Args:
+        X: Features with shape (n_days, n_slots, n_features).
+        y: Observations with shape (n_days, n_slots).
+        valid: Availability of the rows with shape (n_days, n_slots).
+        day_pos: Day position of every prepared row.
+        slot_pos: Slot position of every prepared row.
+        frequency: Frequency of the data.
+        first_day: Day of the first day position, without time zone.
+    """
+
+    X: np.ndarray
+    y: np.ndarray
+    valid: np.ndarray
+    day_pos: np.ndarray
+    slot_pos: np.ndarray
+    frequency: Frequency
+    first_day: pd.Timestamp
+
+    @property
+    def slots(self) -> list[int]:
+        """Get the slots with at least one available row."""
+        return np.flatnonzero(self.valid.any(axis=0)).tolist()
+
+    def slot(self, slot: int) -> tuple[np.ndarray, np.ndarray]:
+        """Get features and observations of a slot.
+
+        Rows are returned in chronological order. Without missing days,
+        the arrays are views into the partitioned data.
+
+        Args:
+            slot: Slot position.
+        """
+        mask = self.valid[:, slot]
+        if mask.all():
+            return self.X[:, slot], self.y[:, slot]
+        return self.X[mask, slot], self.y[mask, slot]
+
+    def rows(
+        self,
+        slots: np.ndarray,
+        slot_features: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Get features and observations of several slots.
+
+        Rows are returned in chronological order.
+
+        Args:
+            slots: Slot positions.
+            slot_features: Features of every slot with shape
+                (n_slots, n_slot_features), which are appended to the
+                features of the rows.
+
+        Returns:
+            Features, observations and the day and slot position of
+            every row.
+        """
+        days, pos = np.nonzero(self.valid[:, slots])
+        row_slots = slots[pos]
+        if len(slots) == 1:
+            X, y = self.slot(int(slots[0]))  # noqa: N806
+        else:
+            X = self.X[days, row_slots]  # noqa: N806
+            y = self.y[days, row_slots]
+        if slot_features is not None:
+            X = np.hstack([X, slot_features[row_slots]])  # noqa: N806
+        return X, y, days, row_slots
+
+    def last_days(self, n_days: int | None) -> SlotData:
+        """Get the latest days as views into the partitioned data.
+
+        Args:
+            n_days: Number of latest days. All days if None.
+        """
+        drop = 0 if n_days is None else max(self.valid.shape[0] - n_days, 0)
+        if drop == 0:
+            return self
+        valid = self.valid[drop:]
+        day_pos, slot_pos = np.nonzero(valid)
+        return SlotData(
+            X=self.X[drop:],
+            y=self.y[drop:],
+            valid=valid,
+            day_pos=day_pos,
+            slot_pos=slot_pos,
+            frequency=self.frequency,
+            first_day=self.first_day + pd.Timedelta(days=drop),
+        )
+
+    def look_ahead_time(self, slot: int) -> tuple[int, int]:
+        """Get hour and minute of a slot.
+
+        Args:
+            slot: Slot position.
+        """
+        hour, minute = divmod(slot * self.frequency.value, 60)
+        return hour, minute
+
+    def slot_position(self, hour: int, minute: int) -> int:
+        """Get the slot position of a look-ahead time.
+
+        Args:
+            hour: Hour of the look-ahead time.
+            minute: Minute of the look-ahead time.
+        """
+        return (hour * 60 + minute) // self.frequency.value
+
+
+class SlotStore:
+    """Sliding window of the latest days of slot-partitioned data.
+
+    The days are kept in preallocated buffers. New days are written
+    after the last day, and the days that leave the window are evicted
+    by moving its start. Once the buffers are full, the window is moved
+    to their beginning, which happens at most every ``max_days`` days,
+    so that moving the window forward costs amortized O(new days).
+    The buffers of a window therefore hold twice ``max_days`` days.
+    Without a window, the buffers start with the stored days and grow
+    by doubling.
+    """
+
+    def __init__(self, data: SlotData, max_days: int | None = None) -> None:
+        """Initialize the store.
+
+        Args:
+            data: Prepared data partitioned by look-ahead slot.
+            max_days: Number of latest days kept. All days are kept if
+                None.
+        """
+        self._max_days = max_days
+        self._frequency = data.frequency
+        data = data.last_days(max_days)
+        n_days = data.valid.shape[0]
+        capacity = n_days if max_days is None else 2 * max_days
+        self._X = _pad(data.X, capacity, fill=np.nan)
+        self._y = _pad(data.y, capacity, fill=np.nan)
+        self._valid = _pad(data.valid, capacity, fill=False)
+        self._start = 0
+        self._n_days = n_days
+        self._first_day = data.first_day
+
+    @property
+    def data(self) -> SlotData:
+        """Get the days of the window as views into the buffers."""
+        window = slice(self._start, self._start + self._n_days)
+        valid = self._valid[window]
+        day_pos, slot_pos = np.nonzero(valid)
+        return SlotData(
+            X=self._X[window],
+            y=self._y[window],
+            valid=valid,
+            day_pos=day_pos,
+            slot_pos=slot_pos,
+            frequency=self._frequency,
+            first_day=self._first_day,
+        )
+
+    def append(self, data: SlotData) -> None:
+        """Append the prepared data of later days.
+
+        Days between the stored and the appended days have no available
+        rows.
+
+        Args:
+            data: Prepared data whose first day is after the last
+                stored day.
+        """
+        offset = (data.first_day - self._first_day).days
+        if offset < self._n_days:
+            msg = "The appended days must follow the last stored day."
+            raise ValueError(msg)
+        n_total = offset + data.valid.shape[0]
+        drop = (
+            0 if self._max_days is None else max(n_total - self._max_days, 0)
+        )
+        if self._start + n_total > len(self._valid):
+            self._move(drop, n_total - drop)
+        # Days are counted from the current first day, and the gap and
+        # the appended days are written after the kept days.
+        gap = slice(
+            self._start + max(self._n_days, drop),
+            self._start + max(offset, drop),
+        )
+        self._X[gap] = np.nan
+        self._y[gap] = np.nan
+        self._valid[gap] = False
+        skip = max(drop - offset, 0)
+        new = slice(self._start + offset + skip, self._start + n_total)
+        self._X[new] = data.X[skip:]
+        self._y[new] = data.y[skip:]
+        self._valid[new] = data.valid[skip:]
+        self._start += drop
+        self._n_days = n_total - drop
+        self._first_day += pd.Timedelta(days=drop)
+
+    def _move(self, drop: int, n_days: int) -> None:
+        """Move the kept days to the beginning of the buffers.
+
+        Args:
+            drop: Number of evicted days at the start of the window.
+            n_days: Number of days in the window after appending.
+        """
+        capacity = max(len(self._valid), 2 * n_days)
+        kept = slice(self._start + drop, self._start + self._n_days)
+        self._X = _pad(self._X[kept], capacity, fill=np.nan)
+        self._y = _pad(self._y[kept], capacity, fill=np.nan)
+        self._valid = _pad(self._valid[kept], capacity, fill=False)
+        # The start may be negative, so that the evicted days are
+        # counted before the beginning of the buffers.
+        self._start = -drop
+
+
+def _pad(array: np.ndarray, n_days: int, fill: float) -> np.ndarray:
+    """Pad an array of days to a number of days.
+
+    Args:
+        array: Array with the days along the first axis.
+        n_days: Number of days of the padded array.
+        fill: Value of the padded days.
+    """
+    padded = np.full((n_days, *array.shape[1:]), fill, dtype=array.dtype)
+    padded[: len(array)] = array
+    return padded
+
+
+def get_slot_features(
+    frequency: Frequency,
+    encoding: SlotEncoding,
+) -> np.ndarray:
+    """Get features that identify the look-ahead slots.
+
+    Args:
+        frequency: Frequency of the data.
+        encoding: Encoding of the slots.
+
+    Returns:
+        Features with shape (n_slots, 2).
+    """
+    n_slots = 24 * 60 // frequency.value
+    minutes = np.arange(n_slots) * frequency.value
+    if encoding == SlotEncoding.CYCLIC:
+        angle = 2 * np.pi * minutes / (24 * 60)
+        return np.column_stack([np.sin(angle), np.cos(angle)])
+    return np.column_stack(np.divmod(minutes, 60)).astype(float)
+
+
+def get_slot_groups(config: SpotOptConfig) -> np.ndarray:
+    """Get the group of every look-ahead slot.
+
+    The slots of a group share their models. A group is identified by
+    its first slot.
+
+    Args:
+        config: spotopt configuration.
+
+    Returns:
+        First slot of the group of every slot.
+    """
+    n_slots = 24 * 60 // config.frequency.value
+    slots = np.arange(n_slots, dtype=np.intp)
+    if config.pooled:
+        return np.zeros(n_slots, dtype=np.intp)
+    if config.slot_group_size is not None:
+        return slots // config.slot_group_size * config.slot_group_size
+    return slots
+
+
+def get_search_groups(config: SpotOptConfig) -> np.ndarray:
+    """Get the hyperparameter search group of every look-ahead slot.
+
+    The models of the slots of a group share their hyperparameters. A
+    group is identified by its first slot.
+
+    Args:
+        config: spotopt configuration.
+
+    Returns:
+        First slot of the search group of every slot.
+    """
+    n_slots = 24 * 60 // config.frequency.value
+    slots = np.arange(n_slots, dtype=np.intp)
+    match config.search_scope:
+        case SearchScope.PER_QUANTILE:
+            return np.zeros(n_slots, dtype=np.intp)
+        case SearchScope.PER_SLOT_GROUP:
+            size = config.search_slot_group_size
+            return slots // size * size
+    return get_slot_groups(config)
+
+
+def partition_slots(
+    df: pd.DataFrame,
+    fit_cols: list[str],
+    frequency: Frequency,
+) -> SlotData:
+    """Partition prepared data by look-ahead slot in a single pass.
+
+    Args:
+        df: Prepared DataFrame with a DatetimeIndex without time zone.
+        fit_cols: Feature columns.
+        frequency: Frequency of the data.
+    """
+    n_slots = 24 * 60 // frequency.value
+    days = df.index.normalize()
+    day_pos = np.asarray((days - days[0]).days)
+    slot_pos = np.asarray(
+        (df.index.hour * 60 + df.index.minute) // frequency.value,
+    )
+    n_days = int(day_pos[-1]) + 1
+
+    X = np.full((n_days, n_slots, len(fit_cols)), np.nan)  # noqa: N806
+    y = np.full((n_days, n_slots), np.nan)
+    valid = np.zeros((n_days, n_slots), dtype=bool)
+    X[day_pos, slot_pos] = df[fit_cols].to_numpy(dtype=float)
+    y[day_pos, slot_pos] = df["obs"].to_numpy(dtype=float)
+    valid[day_pos, slot_pos] = True
+
+    return SlotData(
+        X=X,
+        y=y,
+        valid=valid,
+        day_pos=day_pos,
+        slot_pos=slot_pos,
+        frequency=frequency,
+        first_day=days[0],
+    )
@@ -7,24 +7,31 @@ from dataclasses import dataclass
 from enum import IntEnum, StrEnum
 from typing import TYPE_CHECKING, Any
 
-from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.ensemble import (
+    GradientBoostingRegressor,
+    HistGradientBoostingRegressor,
+)
 from sklearn.linear_model import QuantileRegressor
 
 import spotopt._constants as const
 from spotopt._exceptions import (
     ForbiddenKeyWordError,
+    InvalidConfigValueError,
     ParameterCombinationError,
 )
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    import numpy as np
+
 
 class ModelName(StrEnum):
     """Enum for allowed models."""
 
     LASSO = "Lasso"
     GBR = "GBR"
+    HGB = "HGB"
 
 
 class Frequency(IntEnum):
@@ -34,6 +41,91 @@ class Frequency(IntEnum):
     H = 60
 
 
+class QuantileMode(StrEnum):
+    """Enum for how the quantiles are modelled.
+
+    ``DIRECT`` fits one model per quantile. ``RESIDUAL`` fits only the
+    median model and derives the other quantiles from the empirical
+    quantiles of its residuals.
+    """
+
+    DIRECT = "direct"
+    RESIDUAL = "residual"
+
+
+class SlotEncoding(StrEnum):
+    """Enum for the features that identify look-ahead slots.
+
+    ``IDENTIFIER`` uses the hour and minute, ``CYCLIC`` the sine and
+    cosine of the time of day.
+    """
+
+    IDENTIFIER = "identifier"
+    CYCLIC = "cyclic"
+
+
+class SearchStrategy(StrEnum):
+    """Enum for the hyperparameter search strategy.
+
+    ``GRID`` runs a grid search per look-ahead time and quantile.
+    ``RANDOM`` samples ``n_iter`` candidates of the search space.
+    ``HALVING`` runs a successive halving grid search, which evaluates
+    all candidates on few resources and only the best ones on more.
+    The resource is either the number of rows or the number of stages
+    of the gradient boosting models.
+    ``PATH`` searches along the path of the models on folds shared by
+    all quantiles of a look-ahead time, scored by the pinball loss. The
+    Lasso models select one alpha per look-ahead time along the
+    regularization path. The gradient boosting models score every
+    candidate ``n_estimators`` (``max_iter`` of the histogram-based
+    models) on the staged predictions of the largest one.
+    """
+
+    GRID = "grid"
+    PATH = "path"
+    RANDOM = "random"
+    HALVING = "halving"
+
+
+class CVStrategy(StrEnum):
+    """Enum for the folds of the hyperparameter search.
+
+    ``KFOLD`` uses consecutive, unshuffled folds of the rows of a model.
+    ``FORWARD`` uses forward-chaining folds of whole days, which only
+    train on days before their test days. They are built once from
+    the prepared data and shared by all models.
+    """
+
+    KFOLD = "kfold"
+    FORWARD = "forward"
+
+
+class SearchScope(StrEnum):
+    """Enum for the models that share a hyperparameter search.
+
+    ``PER_KEY`` searches the parameters of every look-ahead time and
+    quantile separately. ``PER_QUANTILE`` runs one search per quantile
+    on the rows of all look-ahead times and fits every look-ahead time
+    with the winner. ``PER_SLOT_GROUP`` does the same per group of
+    consecutive look-ahead times.
+    """
+
+    PER_KEY = "per_key"
+    PER_QUANTILE = "per_quantile"
+    PER_SLOT_GROUP = "per_slot_group"
+
+
+class WeekdayEncoding(StrEnum):
+    """Enum for the features that identify the weekday.
+
+    ``DUMMIES`` uses seven dummy columns and ``CATEGORICAL`` a single
+    column with the weekday code from 1 (Monday) to 7 (Sunday).
+    """
+
+    DUMMIES = "dummies"
+    CATEGORICAL = "categorical"
+
+
 @dataclass(frozen=True, slots=True)
 class SpotOptConfig:
     """SpotOpt configuration.
@@ -45,6 +137,95 @@ class SpotOptConfig:
         run_hyperparam_search: Whether to run hyperparameter search.
             Default is False.
         cv: Number of folds for cross-validation. Default is 4.
+        search_strategy: Strategy of the hyperparameter search. Default
+            is ``SearchStrategy.GRID``.
+        cv_strategy: Folds of the hyperparameter search. Default is
+            ``CVStrategy.KFOLD``.
+        cv_gap_days: Number of days between the training and test days
+            of the ``CVStrategy.FORWARD`` folds. Default is 0.
+        cv_train_days: Maximum number of training days of the
+            ``CVStrategy.FORWARD`` folds, which bounds the cost of the
+            search as the history grows. All previous days if None.
+            Default is None.
+        search_space: Candidate values per hyperparameter. Defaults to
+            ``const.CV_PARAMS`` of the model if None.
+        n_iter: Number of candidates sampled by
+            ``SearchStrategy.RANDOM``. Uses the scikit-learn default if
+            None. Default is None.
+        search_resource: Resource of ``SearchStrategy.HALVING``, either
+            ``"n_samples"`` or the number of stages of the gradient
+            boosting models, i.e. ``"n_estimators"`` or ``"max_iter"``.
+            The last iteration uses the largest number of stages in the
+            search space. Uses the rows if None.
+            Default is None.
+        search_scope: Models that share a hyperparameter search. Default
+            is ``SearchScope.PER_KEY``.
+        search_group_size: Number of consecutive look-ahead times that
+            share a search in ``SearchScope.PER_SLOT_GROUP``. Must be a
+            divisor of the look-ahead times of a day and a multiple of
+            ``slot_group_size``. Defaults to the look-ahead times of an
+            hour if None.
+        search_sample_slots: Number of evenly spaced look-ahead times
+            whose rows a shared search runs on. Uses all look-ahead
+            times of the search if None. Default is None.
+        early_stopping_rounds: Number of stages without an improvement
+            of the pinball loss on a holdout of the latest rows, after
+            which the gradient boosting models stop. No early stopping
+            if None. Default is None.
+        validation_fraction: Fraction of the rows in the holdout of the
+            early stopping. Default is 0.1.
+        time_budget_seconds: Wall-clock budget of fitting the gradient
+            boosting models in seconds. The budget left is spread over
+            the models still to fit, whose boosting stops once they
+            have used their share. No limit if None. Default is None.
+        n_jobs: Number of worker processes used to fit the models of
+            the individual look-ahead times and quantiles. Negative
+            values are counted from the number of CPUs, i.e. -1 uses
+            all of them. Default is 1.
+        quantile_mode: How the quantiles are modelled. Default is
+            ``QuantileMode.DIRECT``.
+        residual_halflife_days: Half-life in days of the recency
+            weights of the residuals in ``QuantileMode.RESIDUAL``. All
+            residuals are weighted equally if None. Default is None.
+        fit_quantiles: Quantiles in percent with a fitted model.
+            Defaults to ``const.QUANTILES`` if None.
+        output_quantiles: Quantiles in percent that are predicted.
+            Quantiles without a fitted model are interpolated between
+            the fitted ones. Defaults to the fitted quantiles if None.
+        pooled: Whether to fit one model per quantile on the rows of
+            all look-ahead times, with the look-ahead time as a
+            feature. Default is False.
+        slot_encoding: Encoding of the look-ahead time in pooled
+            models. Default is ``SlotEncoding.IDENTIFIER``.
+        slot_group_size: Number of consecutive look-ahead times that
+            share one model per quantile, fitted on the rows of all of
+            them, e.g. 4 for hourly models on quarter-hourly data. Must
+            divide the number of look-ahead times of a day. One model
+            per look-ahead time if None. Default is None.
+        lag_cols: Columns whose values of previous days are added as
+            features. Defaults to ``const.DEFAULT_LAG_COLS`` if None.
+        lag_days: Lags in days of the lagged columns. Predictions need
+            the data of the largest lag before the delivery day.
+            Defaults to ``const.DEFAULT_LAG_DAYS`` if None.
+        weekday_encoding: Encoding of the weekday. Default is
+            ``WeekdayEncoding.DUMMIES``.
+        solver: Linear programming solver of the Lasso models, one of
+            ``const.LASSO_SOLVERS``. Uses the scikit-learn default if
+            None. Default is None.
+        sparse_threshold: Share of zeros in the features of a Lasso
+            model above which they are passed to the solver as a sparse
+            CSR matrix. Features are always dense if None. Default is
+            None.
+        max_training_days: Number of latest prepared days the models
+            are fitted on. The window moves forward with every update.
+            All days are used if None. Default is None.
+        recency_halflife_days: Half-life in days of the recency weights
+            of the training rows, passed as ``sample_weight`` to the
+            models. All rows are weighted equally if None. Default is
+            None.
+        trace_memory: Whether to log the peak memory of preparing the
+            data, traced by ``tracemalloc``, with debug logging.
+            Tracing slows down preparing. Default is False.
 
     """
 
@@ -53,6 +234,35 @@ class SpotOptConfig:
     mdl_kwargs: dict[str, object] | None = None
     run_hyperparam_search: bool = False
     cv: int = const.DEFAULT_NR_CV
+    n_jobs: int = const.DEFAULT_N_JOBS
+    quantile_mode: QuantileMode = QuantileMode.DIRECT
+    residual_halflife_days: float | None = None
+    fit_quantiles: list[int] | None = None
+    output_quantiles: list[int] | None = None
+    pooled: bool = False
+    slot_encoding: SlotEncoding = SlotEncoding.IDENTIFIER
+    slot_group_size: int | None = None
+    lag_cols: list[str] | None = None
+    lag_days: list[int] | None = None
+    weekday_encoding: WeekdayEncoding = WeekdayEncoding.DUMMIES
+    solver: str | None = None
+    sparse_threshold: float | None = None
+    search_strategy: SearchStrategy = SearchStrategy.GRID
+    early_stopping_rounds: int | None = None
+    validation_fraction: float = const.DEFAULT_VALIDATION_FRACTION
+    time_budget_seconds: float | None = None
+    search_space: dict[str, list] | None = None
+    n_iter: int | None = None
+    search_resource: str | None = None
+    search_scope: SearchScope = SearchScope.PER_KEY
+    search_group_size: int | None = None
+    search_sample_slots: int | None = None
+    cv_strategy: CVStrategy = CVStrategy.KFOLD
+    cv_gap_days: int = 0
+    cv_train_days: int | None = None
+    max_training_days: int | None = None
+    recency_halflife_days: float | None = None
+    trace_memory: bool = False
 
     def __post_init__(self) -> None:
         """Post-initialization checks."""
@@ -74,6 +284,322 @@ class SpotOptConfig:
             )
             raise ParameterCombinationError(msg)
 
+        if self.n_jobs == 0:
+            msg = "n_jobs must not be 0."
+            raise InvalidConfigValueError(msg)
+
+        if self.residual_halflife_days is not None:
+            if self.quantile_mode != QuantileMode.RESIDUAL:
+                msg = (
+                    "residual_halflife_days requires quantile_mode "
+                    f"'{QuantileMode.RESIDUAL.value}'."
+                )
+                raise ParameterCombinationError(msg)
+            if self.residual_halflife_days <= 0:
+                msg = "residual_halflife_days must be positive."
+                raise InvalidConfigValueError(msg)
+
+        self._check_quantiles()
+        self._check_slot_groups()
+        self._check_solver()
+        self._check_stopping()
+        self._check_search()
+        self._check_search_space()
+        self._check_search_scope()
+        self._check_cv()
+        self._check_training_window()
+
+        if self.lag_cols is not None and (
+            not self.lag_cols
+            or not all(isinstance(c, str) for c in self.lag_cols)
+            or len(set(self.lag_cols)) != len(self.lag_cols)
+        ):
+            msg = "lag_cols must be a non-empty list of distinct column names."
+            raise InvalidConfigValueError(msg)
+
+        if self.lag_days is not None and (
+            not self.lag_days
+            or sorted(set(self.lag_days)) != list(self.lag_days)
+            or self.lag_days[0] < 1
+        ):
+            msg = (
+                "lag_days must be a non-empty, strictly increasing list "
+                "of positive integers."
+            )
+            raise InvalidConfigValueError(msg)
+
+    def _check_quantiles(self) -> None:
+        """Check the fitted and output quantiles."""
+        if (
+            self.fit_quantiles is not None
+            and self.quantile_mode == QuantileMode.RESIDUAL
+        ):
+            msg = (
+                "fit_quantiles cannot be combined with quantile_mode "
+                f"'{QuantileMode.RESIDUAL.value}', which fits only the "
+                "median."
+            )
+            raise ParameterCombinationError(msg)
+        for name in ("fit_quantiles", "output_quantiles"):
+            quantiles = getattr(self, name)
+            if quantiles is None:
+                continue
+            if (
+                not quantiles
+                or sorted(set(quantiles)) != list(quantiles)
+                or not all(0 < q < 100 for q in quantiles)  # noqa: PLR2004
+            ):
+                msg = (
+                    f"{name} must be a non-empty, strictly increasing "
+                    "list of percentages between 0 and 100."
+                )
+                raise InvalidConfigValueError(msg)
+
+    def _check_slot_groups(self) -> None:
+        """Check the grouping of the look-ahead times."""
+        if self.slot_group_size is None:
+            return
+        if self.pooled:
+            msg = "Choose either pooled or slot_group_size, not both."
+            raise ParameterCombinationError(msg)
+        n_slots = 24 * 60 // self.frequency.value
+        if self.slot_group_size <= 0 or n_slots % self.slot_group_size:
+            msg = (
+                "slot_group_size must be a positive divisor of the "
+                f"{n_slots} look-ahead times of a day."
+            )
+            raise InvalidConfigValueError(msg)
+
+    def _check_solver(self) -> None:
+        """Check the options of the Lasso solver."""
+        for name in ("solver", "sparse_threshold"):
+            if (
+                getattr(self, name) is not None
+                and self.model_name != ModelName.LASSO
+            ):
+                msg = f"{name} requires model_name '{ModelName.LASSO.value}'."
+                raise ParameterCombinationError(msg)
+        if self.solver is not None:
+            if self.solver not in const.LASSO_SOLVERS:
+                msg = (
+                    f"solver must be one of {sorted(const.LASSO_SOLVERS)}, "
+                    f"got '{self.solver}'."
+                )
+                raise InvalidConfigValueError(msg)
+            if "solver" in (self.mdl_kwargs or {}):
+                msg = "Choose either solver or a solver in mdl_kwargs."
+                raise ParameterCombinationError(msg)
+        if self.sparse_threshold is not None and not (
+            0 <= self.sparse_threshold <= 1
+        ):
+            msg = "sparse_threshold must be between 0 and 1."
+            raise InvalidConfigValueError(msg)
+
+    def _check_stopping(self) -> None:
+        """Check the early stopping and time budget options."""
+        for name in ("early_stopping_rounds", "time_budget_seconds"):
+            value = getattr(self, name)
+            if value is None:
+                continue
+            if self.model_name != ModelName.GBR:
+                msg = f"{name} requires model_name '{ModelName.GBR.value}'."
+                raise ParameterCombinationError(msg)
+            if self.run_hyperparam_search:
+                msg = f"Choose either {name} or hyperparameter search."
+                raise ParameterCombinationError(msg)
+            if value <= 0:
+                msg = f"{name} must be positive."
+                raise InvalidConfigValueError(msg)
+        if not 0 < self.validation_fraction < 1:
+            msg = "validation_fraction must be between 0 and 1."
+            raise InvalidConfigValueError(msg)
+        if self.early_stopping_rounds is not None and (
+            {"n_iter_no_change", "validation_fraction"}
+            & set(self.mdl_kwargs or {})
+        ):
+            msg = (
+                "Choose either early_stopping_rounds or early stopping "
+                "in mdl_kwargs."
+            )
+            raise ParameterCombinationError(msg)
+
+    def _check_search(self) -> None:
+        """Check the options of the hyperparameter search strategy."""
+        if (
+            self.search_strategy != SearchStrategy.GRID
+            and not self.run_hyperparam_search
+        ):
+            msg = (
+                f"search_strategy '{self.search_strategy.value}' requires "
+                "run_hyperparam_search."
+            )
+            raise ParameterCombinationError(msg)
+        if self.n_iter is not None:
+            if self.search_strategy != SearchStrategy.RANDOM:
+                msg = (
+                    "n_iter requires search_strategy "
+                    f"'{SearchStrategy.RANDOM.value}'."
+                )
+                raise ParameterCombinationError(msg)
+            if self.n_iter <= 0:
+                msg = "n_iter must be positive."
+                raise InvalidConfigValueError(msg)
+        if self.search_resource is None:
+            return
+        if self.search_strategy != SearchStrategy.HALVING:
+            msg = (
+                "search_resource requires search_strategy "
+                f"'{SearchStrategy.HALVING.value}'."
+            )
+            raise ParameterCombinationError(msg)
+        resources = {"n_samples"}
+        if self.model_name.value in const.STAGES_PARAMS:
+            resources.add(const.STAGES_PARAMS[self.model_name.value])
+        if self.search_resource not in resources:
+            msg = f"search_resource must be one of {sorted(resources)}."
+            raise InvalidConfigValueError(msg)
+        if (
+            self.search_resource != "n_samples"
+            and self.search_resource not in self.search_params
+        ):
+            msg = f"The search space must contain {self.search_resource}."
+            raise ParameterCombinationError(msg)
+
+    def _check_search_space(self) -> None:
+        """Check the user-supplied search space."""
+        if self.search_space is not None:
+            if not self.run_hyperparam_search:
+                msg = "search_space requires run_hyperparam_search."
+                raise ParameterCombinationError(msg)
+            if not self.search_space or not all(
+                isinstance(values, list) and values
+                for values in self.search_space.values()
+            ):
+                msg = (
+                    "search_space must map parameter names to non-empty "
+                    "lists of candidates."
+                )
+                raise InvalidConfigValueError(msg)
+            forbidden_keys = (
+                const.FORBIDDEN_KEYWORDS[self.model_name.value]
+                & self.search_space.keys()
+            )
+            if forbidden_keys:
+                msg = (
+                    f"Model {self.model_name} does not accept the following "
+                    f"keywords: {forbidden_keys}"
+                )
+                raise ForbiddenKeyWordError(msg)
+        if self.search_strategy != SearchStrategy.PATH:
+            return
+        # The path search walks along the regularization path or the
+        # boosting stages.
+        required = const.STAGES_PARAMS.get(self.model_name.value, "alpha")
+        if required not in self.search_params:
+            msg = (
+                f"search_strategy '{SearchStrategy.PATH.value}' requires "
+                f"{required} in the search space."
+            )
+            raise ParameterCombinationError(msg)
+        if self.model_name == ModelName.LASSO and len(self.search_params) > 1:
+            msg = (
+                f"search_strategy '{SearchStrategy.PATH.value}' searches "
+                "only alpha of the Lasso models."
+            )
+            raise ParameterCombinationError(msg)
+
+    def _check_search_scope(self) -> None:
+        """Check the options of a search shared by several models."""
+        if self.search_scope == SearchScope.PER_KEY:
+            for name in ("search_group_size", "search_sample_slots"):
+                if getattr(self, name) is not None:
+                    msg = (
+                        f"{name} requires a search_scope other than "
+                        f"'{SearchScope.PER_KEY.value}'."
+                    )
+                    raise ParameterCombinationError(msg)
+            return
+        if not self.run_hyperparam_search:
+            msg = "search_scope requires run_hyperparam_search."
+            raise ParameterCombinationError(msg)
+        if self.pooled or self.search_strategy == SearchStrategy.PATH:
+            msg = (
+                "Pooled models and the path search share their search "
+                f"already, use search_scope '{SearchScope.PER_KEY.value}'."
+            )
+            raise ParameterCombinationError(msg)
+        if (
+            self.search_sample_slots is not None
+            and self.search_sample_slots <= 0
+        ):
+            msg = "search_sample_slots must be positive."
+            raise InvalidConfigValueError(msg)
+        if self.search_scope != SearchScope.PER_SLOT_GROUP:
+            if self.search_group_size is not None:
+                msg = (
+                    "search_group_size requires search_scope "
+                    f"'{SearchScope.PER_SLOT_GROUP.value}'."
+                )
+                raise ParameterCombinationError(msg)
+            return
+        n_slots = 24 * 60 // self.frequency.value
+        size = self.search_slot_group_size
+        if size <= 0 or n_slots % size or size % (self.slot_group_size or 1):
+            msg = (
+                "search_group_size must be a positive divisor of the "
+                f"{n_slots} look-ahead times of a day and a multiple of "
+                "slot_group_size."
+            )
+            raise InvalidConfigValueError(msg)
+
+    def _check_cv(self) -> None:
+        """Check the folds of the hyperparameter search."""
+        if self.cv_strategy != CVStrategy.FORWARD and (
+            self.cv_gap_days != 0 or self.cv_train_days is not None
+        ):
+            msg = (
+                "cv_gap_days and cv_train_days require cv_strategy "
+                f"'{CVStrategy.FORWARD.value}'."
+            )
+            raise ParameterCombinationError(msg)
+        if self.cv_gap_days < 0:
+            msg = "cv_gap_days must not be negative."
+            raise InvalidConfigValueError(msg)
+        if self.cv_train_days is not None and self.cv_train_days <= 0:
+            msg = "cv_train_days must be positive."
+            raise InvalidConfigValueError(msg)
+
+    def _check_training_window(self) -> None:
+        """Check the window and the recency weights of the training."""
+        min_days = max(const.MIN_NR_DAYS_TRAIN, 1)
+        if (
+            self.max_training_days is not None
+            and self.max_training_days < min_days
+        ):
+            msg = (
+                "max_training_days must be positive and at least "
+                f"{const.MIN_NR_DAYS_TRAIN}."
+            )
+            raise InvalidConfigValueError(msg)
+        if self.recency_halflife_days is None:
+            return
+        if self.recency_halflife_days <= 0:
+            msg = "recency_halflife_days must be positive."
+            raise InvalidConfigValueError(msg)
+        # The path searches and the early stopping fit their models
+        # without sample weights.
+        if (
+            self.search_strategy == SearchStrategy.PATH
+            or self.early_stopping_rounds is not None
+            or self.time_budget_seconds is not None
+        ):
+            msg = (
+                "recency_halflife_days cannot be combined with search "
+                f"strategy '{SearchStrategy.PATH.value}', "
+                "early_stopping_rounds or time_budget_seconds."
+            )
+            raise ParameterCombinationError(msg)
+
     @classmethod
     def from_json(cls, path: Path) -> SpotOptConfig:
         """Create a SpotOptConfig from a json file."""
@@ -91,8 +617,173 @@ class SpotOptConfig:
             mdl_kwargs=config.get("mdl_kwargs"),
             run_hyperparam_search=config.get("run_hyperparam_search", False),
             cv=int(config.get("cv", const.DEFAULT_NR_CV)),
+            n_jobs=int(config.get("n_jobs", const.DEFAULT_N_JOBS)),
+            quantile_mode=QuantileMode(
+                config.get("quantile_mode", QuantileMode.DIRECT),
+            ),
+            residual_halflife_days=(
+                None
+                if config.get("residual_halflife_days") is None
+                else float(config["residual_halflife_days"])
+            ),
+            fit_quantiles=_get_quantiles(config, "fit_quantiles"),
+            output_quantiles=_get_quantiles(config, "output_quantiles"),
+            pooled=config.get("pooled", False),
+            slot_encoding=SlotEncoding(
+                config.get("slot_encoding", SlotEncoding.IDENTIFIER),
+            ),
+            slot_group_size=(
+                None
+                if config.get("slot_group_size") is None
+                else int(config["slot_group_size"])
+            ),
+            lag_cols=config.get("lag_cols"),
+            lag_days=(
+                None
+                if config.get("lag_days") is None
+                else [int(lag) for lag in config["lag_days"]]
+            ),
+            weekday_encoding=WeekdayEncoding(
+                config.get("weekday_encoding", WeekdayEncoding.DUMMIES),
+            ),
+            solver=config.get("solver"),
+            sparse_threshold=(
+                None
+                if config.get("sparse_threshold") is None
+                else float(config["sparse_threshold"])
+            ),
+            search_strategy=SearchStrategy(
+                config.get("search_strategy", SearchStrategy.GRID),
+            ),
+            early_stopping_rounds=config.get("early_stopping_rounds"),
+            validation_fraction=float(
+                config.get(
+                    "validation_fraction",
+                    const.DEFAULT_VALIDATION_FRACTION,
+                ),
+            ),
+            time_budget_seconds=(
+                None
+                if config.get("time_budget_seconds") is None
+                else float(config["time_budget_seconds"])
+            ),
+            search_space=config.get("search_space"),
+            n_iter=(
+                None if config.get("n_iter") is None else int(config["n_iter"])
+            ),
+            search_resource=config.get("search_resource"),
+            search_scope=SearchScope(
+                config.get("search_scope", SearchScope.PER_KEY),
+            ),
+            search_group_size=(
+                None
+                if config.get("search_group_size") is None
+                else int(config["search_group_size"])
+            ),
+            search_sample_slots=(
+                None
+                if config.get("search_sample_slots") is None
+                else int(config["search_sample_slots"])
+            ),
+            cv_strategy=CVStrategy(
+                config.get("cv_strategy", CVStrategy.KFOLD),
+            ),
+            cv_gap_days=int(config.get("cv_gap_days", 0)),
+            cv_train_days=(
+                None
+                if config.get("cv_train_days") is None
+                else int(config["cv_train_days"])
+            ),
+            max_training_days=(
+                None
+                if config.get("max_training_days") is None
+                else int(config["max_training_days"])
+            ),
+            recency_halflife_days=(
+                None
+                if config.get("recency_halflife_days") is None
+                else float(config["recency_halflife_days"])
+            ),
+            trace_memory=config.get("trace_memory", False),
         )
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the SpotOptConfig to a dictionary."""
+        return {
+            "model_name": self.model_name.value,
+            "frequency": self.frequency.value,
+            "mdl_kwargs": self.mdl_kwargs,
+            "run_hyperparam_search": self.run_hyperparam_search,
+            "cv": self.cv,
+            "n_jobs": self.n_jobs,
+            "quantile_mode": self.quantile_mode.value,
+            "residual_halflife_days": self.residual_halflife_days,
+            "fit_quantiles": self.fit_quantiles,
+            "output_quantiles": self.output_quantiles,
+            "pooled": self.pooled,
+            "slot_encoding": self.slot_encoding.value,
+            "slot_group_size": self.slot_group_size,
+            "lag_cols": self.lag_cols,
+            "lag_days": self.lag_days,
+            "weekday_encoding": self.weekday_encoding.value,
+            "solver": self.solver,
+            "sparse_threshold": self.sparse_threshold,
+            "search_strategy": self.search_strategy.value,
+            "early_stopping_rounds": self.early_stopping_rounds,
+            "validation_fraction": self.validation_fraction,
+            "time_budget_seconds": self.time_budget_seconds,
+            "search_space": self.search_space,
+            "n_iter": self.n_iter,
+            "search_resource": self.search_resource,
+            "search_scope": self.search_scope.value,
+            "search_group_size": self.search_group_size,
+            "search_sample_slots": self.search_sample_slots,
+            "cv_strategy": self.cv_strategy.value,
+            "cv_gap_days": self.cv_gap_days,
+            "cv_train_days": self.cv_train_days,
+            "max_training_days": self.max_training_days,
+            "recency_halflife_days": self.recency_halflife_days,
+            "trace_memory": self.trace_memory,
+        }
+
+    @property
+    def search_params(self) -> dict[str, list]:
+        """Get the search space of the hyperparameter search."""
+        return self.search_space or const.CV_PARAMS[self.model_name.value]
+
+    @property
+    def search_slot_group_size(self) -> int:
+        """Get the number of look-ahead times that share a search.
+
+        Only used in ``SearchScope.PER_SLOT_GROUP``.
+        """
+        if self.search_group_size is not None:
+            return self.search_group_size
+        return 60 // self.frequency.value
+
+    @property
+    def fitted_quantiles(self) -> list[int]:
+        """Get the quantiles with a fitted model."""
+        if self.quantile_mode == QuantileMode.RESIDUAL:
+            return [const.RESIDUAL_BASE_QUANTILE]
+        return self.fit_quantiles or const.QUANTILES
+
+    @property
+    def quantiles(self) -> list[int]:
+        """Get the predicted quantiles."""
+        return self.output_quantiles or self.fit_quantiles or const.QUANTILES
+
+
+def _get_quantiles(config: dict[str, Any], key: str) -> list[int] | None:
+    """Get a list of quantiles from a configuration dictionary.
+
+    Args:
+        config: Configuration dictionary.
+        key: Key of the quantiles.
+    """
+    quantiles = config.get(key)
+    return None if quantiles is None else [int(q) for q in quantiles]
+
 
 LookAheadHour = int
 LookAheadMinute = int
@@ -100,5 +791,30 @@ Quantile = int
 
 QRs = dict[
     tuple[LookAheadHour, LookAheadMinute, Quantile],
-    QuantileRegressor | GradientBoostingRegressor | None,
+    QuantileRegressor
+    | GradientBoostingRegressor
+    | HistGradientBoostingRegressor
+    | None,
 ]
+
+
+@dataclass(frozen=True, slots=True)
+class FitResult:
+    """Result of fitting the quantile models.
+
+    Args:
+        fit_cols: Columns used for fitting.
+        qrs: Fitted quantile models.
+        residual_offsets: Residual quantiles of the median models for
+            the predicted quantiles with shape (n_slots, n_quantiles)
+            in ``QuantileMode.RESIDUAL``.
+        fit_seconds: Wall-clock seconds used to fit every model.
+        best_params: Hyperparameters selected by the search for every
+            model. None without hyperparameter search.
+    """
+
+    fit_cols: list[str]
+    qrs: QRs
+    residual_offsets: np.ndarray | None = None
+    fit_seconds: dict[tuple[int, int, int], float] | None = None
+    best_params: dict[tuple[int, int, int], dict[str, Any]] | None = None
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 from pytz.exceptions import AmbiguousTimeError, NonExistentTimeError
 
@@ -82,6 +83,112 @@ def convert_from_none_time_zone(
         return df
 
 
+def localize_delivery_positions(
+    index: pd.DatetimeIndex,
+    frequency: Frequency,
+) -> tuple[pd.DatetimeIndex, np.ndarray]:
+    """Localize a delivery index without time zone to CET positionally.
+
+    This is the array counterpart of ``convert_from_none_time_zone``:
+    instead of a DataFrame, it returns the CET index together with the
+    row positions that have to be taken from the data.
+
+    Args:
+        index: DatetimeIndex without time zone.
+        frequency: Frequency of the index.
+    """
+    positions = np.arange(len(index))
+    try:
+        localized = index.tz_localize(const.TZ_STR)
+    except NonExistentTimeError:
+        # The last Sunday of March has a only 23 hours.
+        localized = index.tz_localize(const.TZ_STR, nonexistent="NaT")
+        keep = localized.notna()
+        return localized[keep], positions[keep]
+    except AmbiguousTimeError:
+        # The last Sunday of October has 25 hours, the ambiguous rows
+        # are repeated.
+        index_with_nat = index.tz_localize(const.TZ_STR, ambiguous="NaT")
+        positions = np.sort(
+            np.concatenate([positions, np.flatnonzero(index_with_nat.isna())]),
+        )
+        localized = pd.date_range(
+            start=index.min(),
+            end=index.max(),
+            freq=f"{frequency.value}min",
+            tz=const.TZ_STR,
+        )
+        return localized, positions
+    else:
+        return localized, positions
+
+
+def get_weighted_quantiles(
+    values: np.ndarray,
+    quantiles: np.ndarray,
+    weights: np.ndarray | None = None,
+) -> np.ndarray:
+    """Get the empirical quantiles of weighted values.
+
+    The quantile ``q`` is the smallest value whose cumulative weight
+    reaches ``q`` of the total weight (inverted CDF).
+
+    Args:
+        values: One-dimensional values.
+        quantiles: Quantiles between 0 and 1.
+        weights: Non-negative weights of the values. Equal weights if
+            None.
+    """
+    order = np.argsort(values, kind="stable")
+    cum_weights = np.cumsum(
+        np.ones(len(values)) if weights is None else weights[order],
+    )
+    positions = np.searchsorted(
+        cum_weights,
+        quantiles * cum_weights[-1],
+        side="left",
+    )
+    return values[order][np.minimum(positions, len(values) - 1)]
+
+
+def interpolate_quantiles(
+    predictions: np.ndarray,
+    quantiles: list[int],
+    target_quantiles: list[int],
+) -> np.ndarray:
+    """Interpolate quantile predictions to other quantiles.
+
+    The predictions are sorted along the quantile axis first, so that
+    the interpolation is monotone even if fitted quantiles cross. Target
+    quantiles outside the fitted range take the nearest fitted quantile.
+
+    Args:
+        predictions: Predictions with the quantiles along the last axis.
+        quantiles: Increasing quantiles of the predictions.
+        target_quantiles: Quantiles to interpolate.
+    """
+    predictions = np.sort(predictions, axis=-1)
+    if len(quantiles) == 1:
+        return np.repeat(predictions, len(target_quantiles), axis=-1)
+    fitted = np.asarray(quantiles, dtype=float)
+    target = np.asarray(target_quantiles, dtype=float)
+    upper = np.clip(
+        np.searchsorted(fitted, target, side="right"),
+        1,
+        len(fitted) - 1,
+    )
+    lower = upper - 1
+    weight = np.clip(
+        (target - fitted[lower]) / (fitted[upper] - fitted[lower]),
+        0.0,
+        1.0,
+    )
+    return (
+        predictions[..., lower] * (1.0 - weight)
+        + predictions[..., upper] * weight
+    )
+
+
 def get_quantile_column_name(quantile: int) -> str:
     """Get the column name for a quantile.
 
@@ -2,130 +2,978 @@
 
 from __future__ import annotations
 
+import contextlib
+import dataclasses
 import itertools
 import logging
+import os
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
+import numpy as np
 import pandas as pd
-from sklearn.ensemble import GradientBoostingRegressor
+from scipy import sparse
+from sklearn.base import clone
+from sklearn.ensemble import (
+    GradientBoostingRegressor,
+    HistGradientBoostingRegressor,
+)
 from sklearn.linear_model import QuantileRegressor
-from sklearn.model_selection import GridSearchCV
 
 import spotopt._constants as const
 import spotopt._features as features
 import spotopt._utils as utils
 import spotopt._validation as validation
-from spotopt._exceptions import ModelNotFittedError
-from spotopt._types import Frequency, QRs, SpotOptConfig
+from spotopt._boosting import TimeBudget, fit_boosting
+from spotopt._compiled import CompiledModels, compile_linear, compile_trees
+from spotopt._cv import Splits, get_day_splits, get_row_splits
+from spotopt._exceptions import MissingColumnsError, ModelNotFittedError
+from spotopt._persistence import load_model, save_model
+from spotopt._search import (
+    get_search_cv,
+    search_boosting_stages,
+    search_lasso_path,
+)
+from spotopt._slots import (
+    SlotData,
+    SlotStore,
+    get_search_groups,
+    get_slot_features,
+    get_slot_groups,
+    partition_slots,
+)
+from spotopt._types import (
+    CVStrategy,
+    FitResult,
+    Frequency,
+    ModelName,
+    QRs,
+    QuantileMode,
+    SearchScope,
+    SearchStrategy,
+    SpotOptConfig,
+    WeekdayEncoding,
+)
+
+if TYPE_CHECKING:
+    import datetime as dt
+    from collections.abc import Iterator, Mapping
+    from pathlib import Path
+
+    from numpy.typing import ArrayLike
+    from sklearn.base import RegressorMixin
 
 _logger = logging.getLogger("spotopt")
 
 
-def _prepare_data(df: pd.DataFrame, frequency: Frequency) -> pd.DataFrame:
+@contextlib.contextmanager
+def _trace_memory(stage: str, *, enabled: bool) -> Iterator[None]:
+    """Log the peak memory allocated during a stage with debug logging.
+
+    The memory is traced by ``tracemalloc``, which slows down every
+    allocation, so it is only traced if enabled. A running trace is
+    kept, and its peak is reset at the start of the stage.
+
+    Args:
+        stage: Name of the stage in the log message.
+        enabled: Whether to trace the memory.
+    """
+    if not enabled or not _logger.isEnabledFor(logging.DEBUG):
+        yield
+        return
+    start_tracing = not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    start_memory = tracemalloc.get_traced_memory()[0]
+    try:
+        yield
+        _logger.debug(
+            "Peak traced memory of %s: %s bytes.",
+            stage,
+            tracemalloc.get_traced_memory()[1] - start_memory,
+        )
+    finally:
+        if start_tracing:
+            tracemalloc.stop()
+
+
+def _prepare_data(
+    df: pd.DataFrame,
+    frequency: Frequency,
+    lag_cols: list[str] | None = None,
+    lag_days: list[int] | None = None,
+    weekday_encoding: WeekdayEncoding = WeekdayEncoding.DUMMIES,
+) -> pd.DataFrame:
     """Prepare the model for training or prediction.
 
+    With debug logging, the time of every stage is logged.
+
     Args:
         df: DataFrame with the data.
         frequency: Frequency of the data.
+        lag_cols: Columns to lag. Defaults to
+            ``const.DEFAULT_LAG_COLS``.
+        lag_days: Lags in days. Defaults to ``const.DEFAULT_LAG_DAYS``.
+        weekday_encoding: Encoding of the weekday.
     """
+    start = time.perf_counter()
     df = utils.account_for_dst(df, frequency)
-    df = features.add_lags(df, ["obs"], lag_days=1)
-    df = features.add_daily_min_max_obs(df)
-    df = features.add_lags(
+    dst_seconds = time.perf_counter() - start
+    lag_cols = lag_cols or const.DEFAULT_LAG_COLS
+    missing_cols = set(lag_cols) - set(df.columns)
+    if missing_cols:
+        msg = f"Missing lag columns: {missing_cols}"
+        raise MissingColumnsError(msg)
+    df, stats = features.build_features(
         df,
-        ["obs_min", "obs_max"],
-        lag_days=1,
-        drop_origin=True,
+        lag_cols,
+        lag_days=lag_days or const.DEFAULT_LAG_DAYS,
+        weekday_encoding=weekday_encoding,
+    )
+    if _logger.isEnabledFor(logging.DEBUG):
+        stage_seconds = {"dst": dst_seconds, **stats.stage_seconds}
+        _logger.debug(
+            "Prepared %s x %s design matrix (%s bytes) with stage times %s.",
+            *df.shape,
+            stats.design_bytes,
+            {k: round(v, 6) for k, v in stage_seconds.items()},
+        )
+    return df
+
+
+def _resolve_n_jobs(n_jobs: int) -> int:
+    """Resolve the number of worker processes.
+
+    Args:
+        n_jobs: Number of workers. Negative values are counted from the
+            number of CPUs, i.e. -1 uses all of them.
+    """
+    if n_jobs > 0:
+        return n_jobs
+    return max((os.cpu_count() or 1) + 1 + n_jobs, 1)
+
+
+def _fit_key(mdl: RegressorMixin, task: _FitTask) -> RegressorMixin:
+    """Fit the model of a single look-ahead time and quantile.
+
+    Args:
+        mdl: Unfitted model.
+        task: Data of the task. The hyperparameters are searched if
+            ``task.config.run_hyperparam_search``.
+    """
+    if task.config.run_hyperparam_search:
+        search = get_search_cv(mdl, task.config, task.cv)
+        search.fit(task.X, task.y, sample_weight=task.sample_weight)
+        return search.best_estimator_
+    return mdl.fit(task.X, task.y, sample_weight=task.sample_weight)
+
+
+@dataclass(frozen=True, slots=True)
+class _FitTask:
+    """Models of a look-ahead time or slot group fitted in one task.
+
+    Args:
+        mdls: Unfitted models, one per quantile.
+        X: Features.
+        y: Target.
+        config: spotopt configuration.
+        cv: Number of folds, or the training and test rows of every
+            fold of the hyperparameter search.
+        budget: Time budget of the task. No limit if None.
+        sample_weight: Weights of the rows. All rows are weighted
+            equally if None.
+    """
+
+    mdls: list[RegressorMixin]
+    X: np.ndarray | sparse.csr_array
+    y: np.ndarray
+    config: SpotOptConfig
+    cv: int | Splits
+    budget: TimeBudget | None = None
+    sample_weight: np.ndarray | None = None
+
+
+def _fit_group(task: _FitTask) -> tuple[list[RegressorMixin], float]:
+    """Fit the models of a look-ahead time or slot group.
+
+    Args:
+        task: Models and data of the task.
+
+    Returns:
+        Fitted models and the wall-clock seconds used to fit them.
+    """
+    start = time.perf_counter()
+    fitted = _fit_models(task)
+    return fitted, time.perf_counter() - start
+
+
+def _fit_models(task: _FitTask) -> list[RegressorMixin]:
+    """Fit models with the configured search or stopping rules.
+
+    Args:
+        task: Models and data of the task.
+    """
+    mdls, X, y, config = task.mdls, task.X, task.y, task.config  # noqa: N806
+    if config.search_strategy == SearchStrategy.PATH:
+        match config.model_name:
+            case "Lasso":
+                fitted, _ = search_lasso_path(
+                    mdls,
+                    X,
+                    y,
+                    alphas=config.search_params["alpha"],
+                    cv=task.cv,
+                )
+                return fitted
+            case "GBR" | "HGB":
+                return search_boosting_stages(
+                    mdls,
+                    X,
+                    y,
+                    param_grid=config.search_params,
+                    cv=task.cv,
+                )
+    if config.model_name == ModelName.GBR and (
+        config.early_stopping_rounds is not None or task.budget is not None
+    ):
+        early_stopping = (
+            None
+            if config.early_stopping_rounds is None
+            else (config.early_stopping_rounds, config.validation_fraction)
+        )
+        return [
+            fit_boosting(mdl, X, y, early_stopping, task.budget)
+            for mdl in mdls
+        ]
+    return [_fit_key(mdl, task) for mdl in mdls]
+
+
+def _get_cv(
+    day_splits: Splits | None,
+    days: np.ndarray,
+    config: SpotOptConfig,
+) -> int | Splits:
+    """Get the folds of the hyperparameter search of a model.
+
+    Args:
+        day_splits: Training and test days of the forward folds. The
+            rows are split into ``config.cv`` folds if None.
+        days: Day position of every row of the model.
+        config: spotopt configuration.
+    """
+    if day_splits is None:
+        return config.cv
+    return get_row_splits(day_splits, days)
+
+
+def _get_recency_weights(
+    days: np.ndarray,
+    n_days: int,
+    config: SpotOptConfig,
+) -> np.ndarray | None:
+    """Get the recency weights of training rows.
+
+    Args:
+        days: Day position of every row.
+        n_days: Number of days of the training data.
+        config: spotopt configuration.
+
+    Returns:
+        Weight of every row, which halves every
+        ``config.recency_halflife_days`` days before the last day. None
+        without recency weights.
+    """
+    if config.recency_halflife_days is None:
+        return None
+    return 0.5 ** ((n_days - 1 - days) / config.recency_halflife_days)
+
+
+def _run_tasks(
+    tasks: list[_FitTask],
+    n_jobs: int,
+) -> list[tuple[list[RegressorMixin], float]]:
+    """Run fitting tasks serially or in worker processes.
+
+    Args:
+        tasks: Fitting tasks.
+        n_jobs: Number of worker processes.
+
+    Returns:
+        Fitted models and seconds of every task, in the order of the
+        tasks.
+    """
+    if n_jobs == 1:
+        return [_fit_group(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        # map() yields the results in the order of the tasks, so the
+        # keys are assigned independently of the completion order.
+        return list(executor.map(_fit_group, tasks))
+
+
+def _get_searched_params(
+    mdl: RegressorMixin,
+    config: SpotOptConfig,
+) -> dict[str, Any]:
+    """Get the values of the searched hyperparameters of a model.
+
+    Args:
+        mdl: Fitted model.
+        config: spotopt configuration.
+    """
+    params = mdl.get_params()
+    return {name: params[name] for name in config.search_params}
+
+
+def _search_shared_params(
+    data: SlotData,
+    mdl_kwargs: dict[str, object],
+    config: SpotOptConfig,
+    n_jobs: int,
+    day_splits: Splits | None,
+) -> dict[tuple[int, int], dict[str, Any]]:
+    """Search the hyperparameters shared by the slots of a search group.
+
+    Every search runs on the rows of the look-ahead times of its group,
+    or of ``config.search_sample_slots`` evenly spaced ones.
+
+    Args:
+        data: Prepared data partitioned by look-ahead slot.
+        mdl_kwargs: Keyword arguments of the models.
+        config: spotopt configuration.
+        n_jobs: Number of worker processes.
+        day_splits: Training and test days of the forward folds. The
+            rows are split into ``config.cv`` folds if None.
+
+    Returns:
+        Selected hyperparameters per search group and quantile.
+    """
+    search_groups = get_search_groups(config)
+    tasks = []
+    keys = []
+    for group in np.unique(search_groups[data.slots]).tolist():
+        slots = np.intersect1d(
+            np.flatnonzero(search_groups == group),
+            data.slots,
+        )
+        n_sample = config.search_sample_slots
+        if n_sample is not None and len(slots) > n_sample:
+            slots = slots[
+                np.linspace(0, len(slots) - 1, n_sample)
+                .round()
+                .astype(np.intp)
+            ]
+        X, y, days, _ = data.rows(slots)  # noqa: N806
+        if config.model_name == ModelName.LASSO:
+            X = _as_sparse_if_mostly_zero(X, config.sparse_threshold)  # noqa: N806
+        cv = _get_cv(day_splits, days, config)
+        weights = _get_recency_weights(days, data.valid.shape[0], config)
+        for q in config.fitted_quantiles:
+            mdl = _get_model(config.model_name, q, mdl_kwargs)
+            tasks.append(
+                _FitTask([mdl], X, y, config, cv, sample_weight=weights),
+            )
+            keys.append((group, q))
+    _logger.info("Running %s shared hyperparameter searches.", len(tasks))
+    fitted = _run_tasks(tasks, n_jobs)
+    return {
+        key: _get_searched_params(mdls[0], config)
+        for key, (mdls, _) in zip(keys, fitted, strict=True)
+    }
+
+
+def _without_search(config: SpotOptConfig) -> SpotOptConfig:
+    """Get the configuration of fitting with fixed hyperparameters.
+
+    Args:
+        config: spotopt configuration with a hyperparameter search.
+    """
+    return dataclasses.replace(
+        config,
+        run_hyperparam_search=False,
+        search_strategy=SearchStrategy.GRID,
+        search_space=None,
+        n_iter=None,
+        search_resource=None,
+        search_scope=SearchScope.PER_KEY,
+        search_group_size=None,
+        search_sample_slots=None,
     )
-    # Remove null values that come from adding lags.
-    df = df.dropna(subset=[c for c in df.columns if "lag" in c])
-    df = features.add_weekday_dummies(df)
-    # Add look-ahead identifiers.
-    return df.assign(hour=df.index.hour, minute=df.index.minute)
+
+
+def _get_model(
+    model_name: ModelName,
+    q: int,
+    mdl_kwargs: dict[str, object],
+) -> (
+    QuantileRegressor
+    | GradientBoostingRegressor
+    | HistGradientBoostingRegressor
+):
+    """Get an unfitted quantile model.
+
+    Args:
+        model_name: Name of the model.
+        q: Quantile in percent.
+        mdl_kwargs: Keyword arguments of the model.
+    """
+    match model_name:
+        case "Lasso":
+            return QuantileRegressor(quantile=q / 100, **mdl_kwargs)
+        case "GBR":
+            return GradientBoostingRegressor(
+                loss="quantile",
+                alpha=q / 100,
+                **mdl_kwargs,
+            )
+        case "HGB":
+            # The automatic early stopping of large fits holds out
+            # shuffled rows with a random seed, so it is only used if
+            # requested.
+            return HistGradientBoostingRegressor(
+                loss="quantile",
+                quantile=q / 100,
+                **{"early_stopping": False, **mdl_kwargs},
+            )
+
+
+def _get_slot_features(config: SpotOptConfig) -> np.ndarray | None:
+    """Get the slot features of the pooled models.
+
+    Args:
+        config: spotopt configuration.
+    """
+    if not config.pooled:
+        return None
+    return get_slot_features(config.frequency, config.slot_encoding)
+
+
+def _predict_models(
+    data: SlotData,
+    qrs: QRs,
+    config: SpotOptConfig,
+) -> np.ndarray:
+    """Predict the fitted quantiles of all slots.
+
+    Args:
+        data: Slot-partitioned data.
+        qrs: Fitted quantile models.
+        config: spotopt configuration.
+
+    Returns:
+        Predictions with shape (n_days, n_slots, n_fitted_quantiles).
+    """
+    slot_groups = get_slot_groups(config)
+    slot_features = _get_slot_features(config)
+    quantile_pos = {q: i for i, q in enumerate(config.fitted_quantiles)}
+    predictions = np.full((*data.valid.shape, len(quantile_pos)), np.nan)
+    for (h, m, q), mdl in qrs.items():
+        group = data.slot_position(h, m)
+        X, _, days, slots = data.rows(  # noqa: N806
+            np.flatnonzero(slot_groups == group),
+            slot_features,
+        )
+        predictions[days, slots, quantile_pos[q]] = mdl.predict(X)
+    return predictions
+
+
+def _get_holdout_residuals(
+    data: SlotData,
+    qrs: QRs,
+    config: SpotOptConfig,
+    n_jobs: int,
+) -> np.ndarray:
+    """Get the residuals of the median models on held-out days.
+
+    Clones of the fitted median models keep their hyperparameters and
+    are fitted on the days before every test block of forward splits,
+    like ``config.cv`` forward folds of the search. The in-sample
+    residuals of flexible models such as gradient boosting are far
+    smaller than their errors on new days.
+
+    Args:
+        data: Slot-partitioned training data.
+        qrs: Fitted median models.
+        config: spotopt configuration.
+        n_jobs: Number of worker processes.
+
+    Returns:
+        Residuals with shape (n_days, n_slots), NaN on the days of the
+        first training block and on missing slots.
+    """
+    n_days = data.valid.shape[0]
+    day_splits = get_day_splits(
+        n_days,
+        max(min(config.cv, n_days - 1 - config.cv_gap_days), 1),
+        gap_days=config.cv_gap_days,
+        max_train_days=config.cv_train_days,
+    )
+    # The clones are fitted as they are, without stopping rules.
+    fold_config = dataclasses.replace(
+        _without_search(config),
+        early_stopping_rounds=None,
+    )
+    slot_groups = get_slot_groups(config)
+    slot_features = _get_slot_features(config)
+    tasks = []
+    tests = []
+    for (h, m, _), mdl in qrs.items():
+        X, y, days, slots = data.rows(  # noqa: N806
+            np.flatnonzero(slot_groups == data.slot_position(h, m)),
+            slot_features,
+        )
+        if config.model_name == ModelName.LASSO:
+            X = _as_sparse_if_mostly_zero(X, config.sparse_threshold)  # noqa: N806
+        for train, test in get_row_splits(day_splits, days):
+            if len(train) == 0 or len(test) == 0:
+                continue
+            weights = _get_recency_weights(
+                days[train],
+                int(days[train[-1]]) + 1,
+                config,
+            )
+            tasks.append(
+                _FitTask(
+                    [clone(mdl)],
+                    X[train],
+                    y[train],
+                    fold_config,
+                    config.cv,
+                    sample_weight=weights,
+                ),
+            )
+            tests.append((X[test], y[test], days[test], slots[test]))
+    residuals = np.full(data.valid.shape, np.nan)
+    fitted = _run_tasks(tasks, n_jobs)
+    for (mdls, _), (X, y, days, slots) in zip(fitted, tests, strict=True):  # noqa: N806
+        residuals[days, slots] = y - mdls[0].predict(X)
+    return residuals
+
+
+def _fit_residual_offsets(
+    data: SlotData,
+    qrs: QRs,
+    config: SpotOptConfig,
+    n_jobs: int = 1,
+) -> np.ndarray:
+    """Fit the residual quantiles of the median models per slot.
+
+    The quantiles are taken from the residuals on held-out days, see
+    ``_get_holdout_residuals``, while the median models stay fitted on
+    all days.
+
+    Args:
+        data: Slot-partitioned training data.
+        qrs: Fitted median models.
+        config: spotopt configuration.
+        n_jobs: Number of worker processes.
+    """
+    quantiles = np.array(config.quantiles) / 100
+    n_days, n_slots = data.valid.shape
+    residuals = _get_holdout_residuals(data, qrs, config, n_jobs)
+    offsets = np.full((n_slots, len(quantiles)), np.nan)
+    for slot in data.slots:
+        days = np.flatnonzero(~np.isnan(residuals[:, slot]))
+        if len(days) == 0:
+            continue
+        weights = None
+        if config.residual_halflife_days is not None:
+            weights = 0.5 ** (
+                (n_days - 1 - days) / config.residual_halflife_days
+            )
+        offsets[slot] = utils.get_weighted_quantiles(
+            residuals[days, slot],
+            quantiles,
+            weights,
+        )
+    return offsets
+
+
+def _as_sparse_if_mostly_zero(
+    X: np.ndarray,  # noqa: N803
+    sparse_threshold: float | None,
+) -> np.ndarray | sparse.csr_array:
+    """Convert features to a CSR matrix if most of them are zero.
+
+    Args:
+        X: Features.
+        sparse_threshold: Share of zeros above which the features are
+            converted. The features stay dense if None.
+    """
+    if sparse_threshold is None or X.size == 0:
+        return X
+    if 1 - np.count_nonzero(X) / X.size <= sparse_threshold:
+        return X
+    return sparse.csr_array(X)
+
+
+def _prepare_slots(
+    df: pd.DataFrame,
+    config: SpotOptConfig,
+    start: pd.Timestamp | None = None,
+) -> tuple[list[str], SlotData]:
+    """Prepare validated data and partition it by look-ahead slot.
+
+    Args:
+        df: Validated DataFrame.
+        config: spotopt configuration.
+        start: First delivery time without time zone of the prepared
+            rows that are kept. All rows are kept if None.
+
+    Returns:
+        Columns used for fitting and the partitioned data.
+    """
+    with _trace_memory("preparing data", enabled=config.trace_memory):
+        df = _prepare_data(
+            df,
+            frequency=config.frequency,
+            lag_cols=config.lag_cols,
+            lag_days=config.lag_days,
+            weekday_encoding=config.weekday_encoding,
+        )
+    if start is not None:
+        df = df[df.index >= start]
+    fit_cols = [c for c in df.columns if c not in {"obs", "hour", "minute"}]
+    return fit_cols, partition_slots(df, fit_cols, frequency=config.frequency)
+
+
+def _get_tail(df: pd.DataFrame, config: SpotOptConfig) -> pd.DataFrame:
+    """Get the last days of validated data that later days lag.
+
+    Args:
+        df: Validated DataFrame.
+        config: spotopt configuration.
+    """
+    n_days = max(config.lag_days or const.DEFAULT_LAG_DAYS)
+    days = df.index.normalize()
+    return df[days >= days[-1] - pd.DateOffset(days=n_days - 1)]
+
+
+def _get_group_models(
+    data: SlotData,
+    group: int,
+    config: SpotOptConfig,
+    mdl_kwargs: dict[str, object],
+    init_mdls: QRs | None,
+) -> list[RegressorMixin]:
+    """Get the models of a look-ahead time or slot group to fit.
+
+    Args:
+        data: Prepared data partitioned by look-ahead slot.
+        group: First slot of the group.
+        config: spotopt configuration.
+        mdl_kwargs: Keyword arguments of new models.
+        init_mdls: Models that are fitted again instead of new ones.
+    """
+    mdls = []
+    for q in config.fitted_quantiles:
+        key = (*data.look_ahead_time(group), int(q))
+        if init_mdls is not None and key in init_mdls:
+            mdls.append(init_mdls[key])
+        else:
+            mdls.append(_get_model(config.model_name, q, mdl_kwargs))
+    return mdls
 
 
 def _fit(
     df: pd.DataFrame,
     config: SpotOptConfig,
-) -> tuple[list[str], QRs]:
+) -> FitResult:
     """Fit models.
 
     Args:
         df: DataFrame for fitting.
         config: spotopt configuration.
     """
+    result, _, _ = _fit_with_cache(df, config, keep_data=False)
+    return result
+
+
+def _fit_with_cache(
+    df: pd.DataFrame,
+    config: SpotOptConfig,
+    *,
+    keep_data: bool,
+) -> tuple[FitResult, SlotStore | None, pd.DataFrame | None]:
+    """Fit models and optionally keep the data that later updates need.
+
+    Args:
+        df: DataFrame for fitting.
+        config: spotopt configuration.
+        keep_data: Whether to keep the prepared data of the training
+            window and the last validated days.
+
+    Returns:
+        Result of fitting, the prepared data of the training window and
+        the last validated days that the lags of new days need. The
+        data are None if not kept.
+    """
     df = validation.convert_and_validate(df, frequency=config.frequency)
     validation.check_min_training_data_length(df, frequency=config.frequency)
-    df = _prepare_data(df, frequency=config.frequency)
-    look_ahead_times = df[["hour", "minute"]].drop_duplicates().to_numpy()
-    fit_cols = [c for c in df.columns if c not in {"obs", "hour", "minute"}]
+    # The tail is taken first, since preparing removes the time zone of
+    # the index in place.
+    tail = _get_tail(df, config) if keep_data else None
+    fit_cols, data = _prepare_slots(df, config)
+    if not keep_data:
+        data = data.last_days(config.max_training_days)
+        return _fit_slots(data, fit_cols, config), None, tail
+    store = SlotStore(data, max_days=config.max_training_days)
+    return _fit_slots(store.data, fit_cols, config), store, tail
+
+
+def _fit_slots(
+    data: SlotData,
+    fit_cols: list[str],
+    config: SpotOptConfig,
+    init_mdls: QRs | None = None,
+) -> FitResult:
+    """Fit models on prepared data.
+
+    Args:
+        data: Prepared data partitioned by look-ahead slot.
+        fit_cols: Columns used for fitting.
+        config: spotopt configuration.
+        init_mdls: Models that are fitted again instead of new ones,
+            e.g. clones with the selected hyperparameters or fitted
+            models with a warm start.
+    """
+    deadline = (
+        None
+        if config.time_budget_seconds is None
+        else time.time() + config.time_budget_seconds
+    )
+    slot_groups = get_slot_groups(config)
+    slot_features = _get_slot_features(config)
+    groups = np.unique(slot_groups[data.slots]).tolist()
     keys = [
-        (int(h), int(m), int(q))
-        for (h, m), q in itertools.product(look_ahead_times, const.QUANTILES)
+        (*data.look_ahead_time(group), int(q))
+        for group, q in itertools.product(groups, config.fitted_quantiles)
     ]
     mdl_kwargs = config.mdl_kwargs or {}
-    qrs: QRs = dict.fromkeys(keys)
-    for h, m, q in qrs:
-        X = df.query(f"hour=={h} and minute=={m}")[fit_cols].to_numpy()  # noqa: N806
-        y = df.query(f"hour=={h} and minute=={m}")["obs"].to_numpy().ravel()
-        # Fitting.
-        match config.model_name:
-            case "Lasso":
-                mdl = QuantileRegressor(
-                    quantile=q / 100,
-                    **mdl_kwargs,
-                )
-            case "GBR":
-                mdl = GradientBoostingRegressor(
-                    loss="quantile",
-                    alpha=q / 100,
-                    **mdl_kwargs,
-                )
-        if config.run_hyperparam_search:
-            cv = GridSearchCV(
-                mdl,
-                const.CV_PARAMS[config.model_name.value],
-                refit=True,
-                cv=config.cv,
-            )
-            cv.fit(X, y)
-            qrs[(h, m, q)] = cv.best_estimator_
+    if config.solver is not None:
+        mdl_kwargs = {"solver": config.solver, **mdl_kwargs}
+    n_jobs = _resolve_n_jobs(config.n_jobs)
+    # The forward folds are built once from the prepared days and
+    # shared by all models with a row on every day.
+    day_splits = (
+        get_day_splits(
+            data.valid.shape[0],
+            config.cv,
+            gap_days=config.cv_gap_days,
+            max_train_days=config.cv_train_days,
+        )
+        if config.run_hyperparam_search
+        and config.cv_strategy == CVStrategy.FORWARD
+        else None
+    )
+    shared_params = None
+    fit_config = config
+    if (
+        config.run_hyperparam_search
+        and config.search_scope != SearchScope.PER_KEY
+    ):
+        shared_params = _search_shared_params(
+            data,
+            mdl_kwargs,
+            config,
+            n_jobs,
+            day_splits,
+        )
+        fit_config = _without_search(config)
+    search_groups = get_search_groups(config)
+    # The path search fits all quantiles of a group in one task, since
+    # they share the folds and the selected alpha.
+    per_group = config.search_strategy == SearchStrategy.PATH
+    tasks = []
+    for group in groups:
+        X, y, days, _ = data.rows(  # noqa: N806
+            np.intersect1d(np.flatnonzero(slot_groups == group), data.slots),
+            slot_features,
+        )
+        cv = _get_cv(day_splits, days, fit_config)
+        mdls = _get_group_models(data, group, config, mdl_kwargs, init_mdls)
+        if shared_params is not None:
+            for mdl, q in zip(mdls, config.fitted_quantiles, strict=True):
+                mdl.set_params(**shared_params[search_groups[group], q])
+        if config.model_name == ModelName.LASSO:
+            X = _as_sparse_if_mostly_zero(X, config.sparse_threshold)  # noqa: N806
+        weights = _get_recency_weights(days, data.valid.shape[0], config)
+        if per_group:
+            tasks.append(_FitTask(mdls, X, y, fit_config, cv))
         else:
-            qrs[(h, m, q)] = mdl.fit(X, y)
+            tasks.extend(
+                _FitTask([mdl], X, y, fit_config, cv, sample_weight=weights)
+                for mdl in mdls
+            )
+
+    if deadline is not None:
+        # Every task gets an equal share of the budget left when it
+        # starts, assuming that the workers process the tasks in order.
+        tasks = [
+            dataclasses.replace(
+                task,
+                budget=TimeBudget(deadline, max((len(tasks) - i) / n_jobs, 1)),
+            )
+            for i, task in enumerate(tasks)
+        ]
+    if n_jobs > 1:
+        _logger.info("Fitting %s models with %s workers.", len(keys), n_jobs)
+    fitted = _run_tasks(tasks, n_jobs)
+    qrs: QRs = dict(
+        zip(keys, itertools.chain(*(mdls for mdls, _ in fitted)), strict=True),
+    )
+    # The time of a task is split evenly between its models.
+    fit_seconds = dict(
+        zip(
+            keys,
+            itertools.chain(
+                *(
+                    [seconds / len(mdls)] * len(mdls)
+                    for mdls, seconds in fitted
+                ),
+            ),
+            strict=True,
+        ),
+    )
+
+    return FitResult(
+        fit_cols=fit_cols,
+        qrs=qrs,
+        residual_offsets=(
+            _fit_residual_offsets(data, qrs, config, n_jobs)
+            if config.quantile_mode == QuantileMode.RESIDUAL
+            else None
+        ),
+        fit_seconds=fit_seconds,
+        best_params=(
+            {
+                key: _get_searched_params(mdl, config)
+                for key, mdl in qrs.items()
+            }
+            if config.run_hyperparam_search
+            else None
+        ),
+    )
+
+
+def _get_warm_start_models(
+    qrs: QRs,
+    model_name: ModelName,
+    n_stages: int,
+) -> QRs:
+    """Prepare fitted gradient boosting models to add stages.
+
+    Args:
+        qrs: Fitted gradient boosting models, which are modified.
+        model_name: Name of the models.
+        n_stages: Number of stages to add to every model.
+    """
+    param = const.STAGES_PARAMS[model_name.value]
+    for mdl in qrs.values():
+        n_fitted = (
+            mdl.n_estimators_ if model_name == ModelName.GBR else mdl.n_iter_
+        )
+        mdl.set_params(warm_start=True, **{param: n_fitted + n_stages})
+    return qrs
+
+
+def _predict_grid(
+    df: pd.DataFrame,
+    fitted: FitResult,
+    config: SpotOptConfig,
+    compiled: CompiledModels | None = None,
+) -> tuple[np.ndarray, pd.DatetimeIndex]:
+    """Predict the quantiles on the delivery index without time zone.
+
+    Returns a float array with one column per predicted quantile and
+    the corresponding delivery index. The compiled models are used
+    instead of the fitted models if given.
+    """
+    df = validation.convert_and_validate(df, frequency=config.frequency)
+    with _trace_memory("preparing data", enabled=config.trace_memory):
+        df = _prepare_data(
+            df,
+            frequency=config.frequency,
+            lag_cols=config.lag_cols,
+            lag_days=config.lag_days,
+            weekday_encoding=config.weekday_encoding,
+        )
+    data = partition_slots(df, fitted.fit_cols, frequency=config.frequency)
+    predictions = _predict_slots(data, fitted, config, compiled)
+    return predictions[data.day_pos, data.slot_pos], df.index
+
+
+def _predict_slots(
+    data: SlotData,
+    fitted: FitResult,
+    config: SpotOptConfig,
+    compiled: CompiledModels | None = None,
+) -> np.ndarray:
+    """Predict the quantiles of all slots.
 
-    return fit_cols, qrs
+    Args:
+        data: Slot-partitioned data.
+        fitted: Fitted state of the model.
+        config: spotopt configuration.
+        compiled: Compiled models, which are used instead of the fitted
+            models if given.
+
+    Returns:
+        Predictions with shape (n_days, n_slots, n_quantiles).
+    """
+    if compiled is not None:
+        predictions = compiled.predict(data.X)
+    else:
+        predictions = _predict_models(data, fitted.qrs, config)
+    if fitted.residual_offsets is not None:
+        return predictions[..., :1] + fitted.residual_offsets
+    if config.quantiles != config.fitted_quantiles:
+        return utils.interpolate_quantiles(
+            predictions,
+            config.fitted_quantiles,
+            config.quantiles,
+        )
+    return predictions
 
 
 def _predict(
     df: pd.DataFrame,
-    fit_cols: list[str],
-    qrs: QRs,
+    fitted: FitResult,
     config: SpotOptConfig,
+    compiled: CompiledModels | None = None,
 ) -> pd.DataFrame:
     """Predict using the fitted quantile regressors."""
-    df = validation.convert_and_validate(df, frequency=config.frequency)
-    df = _prepare_data(df, frequency=config.frequency)
+    values, index = _predict_grid(df, fitted, config, compiled)
     predictions = pd.DataFrame(
-        index=df.index,
+        values,
+        index=index,
         columns=pd.Index(
-            [utils.get_quantile_column_name(c) for c in const.QUANTILES],
+            [utils.get_quantile_column_name(c) for c in config.quantiles],
         ),
     )
-    delivery_masks = {
-        (h, m): (predictions.index.hour == h) & (predictions.index.minute == m)
-        for h, m in {key[:2] for key in qrs}
-    }
-    for (h, m, q), mdl in qrs.items():
-        prediction = mdl.predict(
-            df.query(f"hour=={h} and minute=={m}")[fit_cols].to_numpy(),
-        )
-        predictions.loc[
-            delivery_masks[(h, m)],
-            utils.get_quantile_column_name(q),
-        ] = prediction
     # The delivery index has no time zone yet, so we need to set it.
     return utils.convert_from_none_time_zone(predictions)
 
 
+def _predict_array(
+    df: pd.DataFrame,
+    fitted: FitResult,
+    config: SpotOptConfig,
+    compiled: CompiledModels | None = None,
+) -> tuple[np.ndarray, pd.DatetimeIndex]:
+    """Predict using the fitted quantile regressors as an array."""
+    values, index = _predict_grid(df, fitted, config, compiled)
+    # The delivery index has no time zone yet, so we need to set it.
+    index, positions = utils.localize_delivery_positions(
+        index,
+        frequency=config.frequency,
+    )
+    return values[positions], index
+
+
 class SpotOptModel:
     """spotopt model."""
 
@@ -133,6 +981,16 @@ class SpotOptModel:
         """Initialize the model."""
         self.config = config
         self.ran_fitting = False
+        self.compiled: CompiledModels | None = None
+        self.residual_offsets: np.ndarray | None = None
+        self.fit_seconds: dict[tuple[int, int, int], float] | None = None
+        self.best_params: dict[tuple[int, int, int], dict[str, Any]] | None = (
+            None
+        )
+        # Prepared data of the training window and the last validated
+        # days that the lags of new days need, kept for .update().
+        self._store: SlotStore | None = None
+        self._tail: pd.DataFrame | None = None
 
     @property
     def config(self) -> SpotOptConfig:
@@ -156,6 +1014,13 @@ class SpotOptModel:
                 ),
                 value.cv,
             )
+        if value.n_jobs != 1:
+            _logger.info("Fitting in parallel with n_jobs=%s.", value.n_jobs)
+        if value.time_budget_seconds is not None:
+            _logger.info(
+                "Fitting within a budget of %s seconds.",
+                value.time_budget_seconds,
+            )
         self._config = value
 
     @property
@@ -173,11 +1038,204 @@ class SpotOptModel:
             raise TypeError(msg)
         self._fit_cols = value
 
-    def fit(self, df: pd.DataFrame) -> None:
-        """Fit the quantil models."""
+    def fit(self, df: pd.DataFrame, *, keep_data: bool = False) -> None:
+        """Fit the quantil models.
+
+        Args:
+            df: DataFrame for fitting.
+            keep_data: Whether to keep the prepared features of the
+                training window for ``.update()``. They take as much
+                memory as the training data, or twice as much with
+                ``config.max_training_days``, and are pickled with the
+                model.
+        """
         _logger.info("Start fitting.")
-        self.fit_cols, self.qrs = _fit(df, self.config)
+        result, self._store, self._tail = _fit_with_cache(
+            df,
+            self.config,
+            keep_data=keep_data,
+        )
+        self._set_fit_result(result)
+
+    def update(
+        self,
+        df: pd.DataFrame,
+        *,
+        warm_start_stages: int | None = None,
+    ) -> None:
+        """Update the fitted quantil models with the data of new days.
+
+        The prepared features of the fitted days, which
+        ``.fit(df, keep_data=True)`` keeps, are reused, so only the
+        features of the new days are built, from the new days and the
+        last fitted days that their lags need. The new days are added
+        to the training window, which moves forward with
+        ``config.max_training_days``. The models are fitted again on
+        the window with the hyperparameters selected when fitting,
+        without a new search. Compiled models are compiled again.
+
+        Args:
+            df: DataFrame with the new days, which start right after
+                the last fitted time step.
+            warm_start_stages: Number of stages added to the fitted
+                gradient boosting models instead of fitting them again.
+                The new stages are fitted on the training window.
+        """
+        if self._store is None or self._tail is None:
+            msg = "Call .fit() with keep_data=True before .update()."
+            raise ModelNotFittedError(msg)
+        if warm_start_stages is not None and (
+            self.config.model_name.value not in const.STAGES_PARAMS
+            or warm_start_stages < 1
+        ):
+            msg = (
+                "warm_start_stages must be a positive number of stages of "
+                "a gradient boosting model."
+            )
+            raise ValueError(msg)
+        if set(df.columns) != set(self._tail.columns):
+            msg = "The new data must have the columns of the fitted data."
+            raise ValueError(msg)
+        df = validation.convert_and_validate(
+            df,
+            frequency=self.config.frequency,
+        )
+        step = pd.Timedelta(minutes=self.config.frequency.value)
+        if df.index[0] != self._tail.index[-1] + step:
+            msg = "The new data must start right after the last time step."
+            raise ValueError(msg)
+        _logger.info("Start updating.")
+        start = df.index[0].tz_localize(None)
+        df = pd.concat([self._tail, df])
+        self._tail = _get_tail(df, self.config)
+        _, data = _prepare_slots(df, self.config, start=start)
+        self._store.append(data)
+
+        if warm_start_stages is not None:
+            config = dataclasses.replace(
+                _without_search(self.config),
+                early_stopping_rounds=None,
+                time_budget_seconds=None,
+            )
+            init_mdls = _get_warm_start_models(
+                self.qrs,
+                self.config.model_name,
+                warm_start_stages,
+            )
+        elif self.config.run_hyperparam_search:
+            config = _without_search(self.config)
+            init_mdls = {key: clone(mdl) for key, mdl in self.qrs.items()}
+        else:
+            config = self.config
+            init_mdls = None
+        best_params = self.best_params
+        compiled = self.compiled is not None
+        self._set_fit_result(
+            _fit_slots(self._store.data, self.fit_cols, config, init_mdls),
+        )
+        self.best_params = best_params
+        if compiled and self.compiled is None:
+            self.compile()
+
+    def _set_fit_result(self, result: FitResult) -> None:
+        """Set the fitted state of the model.
+
+        Args:
+            result: Result of fitting.
+        """
+        self.fit_cols = result.fit_cols
+        self.qrs = result.qrs
+        self.residual_offsets = result.residual_offsets
+        self.fit_seconds = result.fit_seconds
+        self.best_params = result.best_params
         self.ran_fitting = True
+        self.compiled = None
+        if self.config.model_name == ModelName.LASSO:
+            self.compile()
+
+    def compile(self) -> None:
+        """Compile the fitted quantil models for fast prediction.
+
+        The Lasso models are stacked into one coefficient tensor, which
+        is done automatically after fitting. The trees of the exact and
+        histogram-based gradient boosting models are flattened into
+        contiguous node arrays. Once
+        compiled, the predictions use the compiled models. Loaded models
+        have no estimators and keep their compiled models.
+        """
+        if not self.ran_fitting:
+            msg = "Call .fit() before .compile()."
+            raise ModelNotFittedError(msg)
+        if not self.qrs:
+            if self.compiled is None:
+                msg = "The model has no estimators to compile."
+                raise ModelNotFittedError(msg)
+            return
+        match self.config.model_name:
+            case "Lasso":
+                self.compiled = compile_linear(
+                    self.qrs,
+                    frequency=self.config.frequency,
+                    quantiles=self.config.fitted_quantiles,
+                    slot_groups=get_slot_groups(self.config),
+                    slot_features=_get_slot_features(self.config),
+                )
+            case "GBR" | "HGB":
+                self.compiled = compile_trees(
+                    self.qrs,
+                    frequency=self.config.frequency,
+                    quantiles=self.config.fitted_quantiles,
+                    slot_groups=get_slot_groups(self.config),
+                    slot_features=_get_slot_features(self.config),
+                )
+
+    def _get_fit_result(self) -> FitResult:
+        """Get the fitted state of the model."""
+        return FitResult(
+            fit_cols=self.fit_cols,
+            qrs=self.qrs,
+            residual_offsets=self.residual_offsets,
+        )
+
+    def save(self, path: Path) -> None:
+        """Save the fitted model to a directory.
+
+        The model is compiled first if necessary. Only the compiled
+        models are stored, not the scikit-learn estimators.
+
+        Args:
+            path: Target directory.
+        """
+        if not self.ran_fitting:
+            msg = "Call .fit() before .save()."
+            raise ModelNotFittedError(msg)
+        if self.compiled is None:
+            self.compile()
+        arrays = {}
+        if self.residual_offsets is not None:
+            arrays["residual_offsets"] = self.residual_offsets
+        save_model(path, self.config, self.fit_cols, self.compiled, arrays)
+
+    @classmethod
+    def load(cls, path: Path, *, mmap: bool = True) -> SpotOptModel:
+        """Load a model saved with ``.save()``.
+
+        The loaded model predicts with the compiled models and has no
+        scikit-learn estimators.
+
+        Args:
+            path: Directory of the saved model.
+            mmap: Whether to memory-map the model arrays, so that they
+                are loaded lazily and shared between processes.
+        """
+        config, fit_cols, compiled, arrays = load_model(path, mmap=mmap)
+        model = cls(config)
+        model.fit_cols = fit_cols
+        model.qrs = {}
+        model.compiled = compiled
+        model.residual_offsets = arrays.get("residual_offsets")
+        model.ran_fitting = True
+        return model
 
     def predict(self, df: pd.DataFrame) -> pd.DataFrame:
         """Predict using the fitted quantil models."""
@@ -185,4 +1243,99 @@ class SpotOptModel:
             msg = "Call .fit() before .predict()."
             raise ModelNotFittedError(msg)
         _logger.info("Start prediction.")
-        return _predict(df, self.fit_cols, self.qrs, self.config)
+        return _predict(
+            df,
+            self._get_fit_result(),
+            self.config,
+            self.compiled,
+        )
+
+    def predict_next_day(
+        self,
+        previous_obs: ArrayLike,
+        fcast: ArrayLike,
+        *,
+        delivery_day: dt.date | str,
+        extra: Mapping[str, ArrayLike] | None = None,
+    ) -> np.ndarray:
+        """Predict the quantiles of a single delivery day from arrays.
+
+        The features are built directly from the arrays, without the
+        validation, DST handling and feature building of
+        ``.predict()``. This requires that the only lagged values are
+        the observations of the previous day, as with the default
+        ``lag_cols`` and ``lag_days``. Every array has one value per
+        look-ahead time of a regular day, i.e. 24 or 96 values. On the
+        days of a DST switch, they follow the regular day of
+        ``.predict()``, with the missing hour interpolated and the
+        repeated hour averaged.
+
+        Args:
+            previous_obs: Observations of the day before the delivery
+                day.
+            fcast: Forecasts of the delivery day.
+            delivery_day: Delivery day, which determines the weekday.
+            extra: Values of the additional columns of the delivery
+                day.
+
+        Returns:
+            Predictions with one row per look-ahead time and one column
+            per quantile.
+        """
+        if not self.ran_fitting:
+            msg = "Call .fit() before .predict_next_day()."
+            raise ModelNotFittedError(msg)
+        n_slots = 24 * 60 // self.config.frequency.value
+        columns = {
+            name: np.asarray(values, dtype=float)
+            for name, values in {"fcast": fcast, **(extra or {})}.items()
+        }
+        previous_obs = np.asarray(previous_obs, dtype=float)
+        if any(
+            values.shape != (n_slots,)
+            for values in (previous_obs, *columns.values())
+        ):
+            msg = f"Every array must have {n_slots} values."
+            raise ValueError(msg)
+        day = pd.Timestamp(delivery_day)
+        X = features.build_day_features(  # noqa: N806
+            self.fit_cols,
+            columns,
+            previous_obs,
+            day.weekday(),
+        )
+        data = SlotData(
+            X=X[np.newaxis],
+            y=np.full((1, n_slots), np.nan),
+            valid=np.ones((1, n_slots), dtype=bool),
+            day_pos=np.zeros(n_slots, dtype=np.intp),
+            slot_pos=np.arange(n_slots),
+            frequency=self.config.frequency,
+            first_day=day,
+        )
+        return _predict_slots(
+            data,
+            self._get_fit_result(),
+            self.config,
+            self.compiled,
+        )[0]
+
+    def predict_array(
+        self,
+        df: pd.DataFrame,
+    ) -> tuple[np.ndarray, pd.DatetimeIndex]:
+        """Predict using the fitted quantil models without a DataFrame.
+
+        Returns the float predictions with one column per quantile and
+        the CET delivery index of the rows.
+        """
+        if not self.ran_fitting:
+            msg = "Call .fit() before .predict_array()."
+            raise ModelNotFittedError(msg)
+        _logger.info("Start prediction.")
+        return _predict_array(
+            df,
+            self._get_fit_result(),
+            self.config,
+            self.compiled,
+        )
@@ -0,0 +1,83 @@
+"""Tests for _boosting.fit_boosting."""
+
+import time
+
+import numpy as np
+import pytest
+from sklearn.ensemble import GradientBoostingRegressor
+
+from spotopt._boosting import TimeBudget, fit_boosting
+
+
+def _get_data() -> tuple[np.ndarray, np.ndarray]:
+    """Get features and a noisy target."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 3))  # noqa: N806
+    return X, X[:, 0] + rng.normal(size=200)
+
+
+def test_early_stopping_refits_on_all_rows() -> None:
+    """Test that early stopping refits the found stages on all rows."""
+    X, y = _get_data()  # noqa: N806
+    mdl = GradientBoostingRegressor(
+        loss="quantile",
+        alpha=0.5,
+        n_estimators=1000,
+        random_state=0,
+    )
+
+    fitted = fit_boosting(mdl, X, y, early_stopping=(5, 0.2), budget=None)
+
+    n_stages = fitted.estimators_.shape[0]
+    assert n_stages < 1000  # noqa: PLR2004
+    expected = GradientBoostingRegressor(
+        loss="quantile",
+        alpha=0.5,
+        n_estimators=n_stages,
+        random_state=0,
+    ).fit(X, y)
+    np.testing.assert_array_equal(fitted.predict(X), expected.predict(X))
+
+
+def test_exhausted_budget_keeps_one_stage() -> None:
+    """Test that a model without time left keeps its first stage."""
+    X, y = _get_data()  # noqa: N806
+    mdl = GradientBoostingRegressor(loss="quantile", n_estimators=100)
+
+    fitted = fit_boosting(
+        mdl,
+        X,
+        y,
+        early_stopping=None,
+        budget=TimeBudget(deadline=time.time() - 1, n_remaining=1),
+    )
+
+    assert fitted.estimators_.shape[0] == 1
+
+
+def test_budget_is_split_with_early_stopping() -> None:
+    """Test that a binding budget leaves stages for both fits."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(3000, 10))  # noqa: N806
+    y = X[:, 0] + rng.normal(size=3000)
+    mdl = GradientBoostingRegressor(
+        loss="quantile",
+        n_estimators=5000,
+        random_state=0,
+    )
+
+    fitted = fit_boosting(
+        mdl,
+        X,
+        y,
+        early_stopping=(5000, 0.2),
+        budget=TimeBudget(deadline=time.time() + 0.5, n_remaining=1),
+    )
+
+    assert 1 < fitted.estimators_.shape[0] < 5000  # noqa: PLR2004
+
+
+def test_budget_allowance() -> None:
+    """Test that the budget left is shared by the remaining tasks."""
+    budget = TimeBudget(deadline=time.time() + 100, n_remaining=4)
+    assert budget.allowance() == pytest.approx(25, abs=0.1)
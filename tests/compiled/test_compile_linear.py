@@ -0,0 +1,48 @@
+"""Tests for _compiled.compile_linear."""
+
+import numpy as np
+from sklearn.linear_model import QuantileRegressor
+
+from spotopt._compiled import compile_linear
+from spotopt._types import Frequency
+
+
+def test_matches_individual_models() -> None:
+    """Test that the stack reproduces the individual predictions."""
+    rng = np.random.default_rng(0)
+    quantiles = [10, 50, 90]
+    X = rng.normal(size=(20, 24, 3))  # noqa: N806
+    y = X.sum(axis=2) + rng.normal(size=(20, 24))
+    qrs = {
+        (slot, 0, q): QuantileRegressor(quantile=q / 100, alpha=0.01).fit(
+            X[:, slot],
+            y[:, slot],
+        )
+        for slot in range(24)
+        for q in quantiles
+    }
+    stack = compile_linear(qrs, frequency=Frequency(60), quantiles=quantiles)
+    predictions = stack.predict(X)
+    assert predictions.shape == (20, 24, 3)
+    for (slot, _, q), mdl in qrs.items():
+        np.testing.assert_allclose(
+            predictions[:, slot, quantiles.index(q)],
+            mdl.predict(X[:, slot]),
+            rtol=1e-12,
+        )
+
+
+def test_missing_slots_are_nan() -> None:
+    """Test that slots without a model predict NaN."""
+    mdl = QuantileRegressor(quantile=0.5, alpha=0.0).fit(
+        [[0.0], [1.0]],
+        [0.0, 1.0],
+    )
+    stack = compile_linear(
+        {(6, 0, 50): mdl},
+        frequency=Frequency(15),
+        quantiles=[50],
+    )
+    predictions = stack.predict(np.ones((2, 96, 1)))
+    assert np.isnan(predictions[:, 0]).all()
+    assert not np.isnan(predictions[:, 24]).any()
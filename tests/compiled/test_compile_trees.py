@@ -0,0 +1,85 @@
+"""Tests for _compiled.compile_trees."""
+
+import numpy as np
+import pytest
+from sklearn.ensemble import (
+    GradientBoostingRegressor,
+    HistGradientBoostingRegressor,
+)
+from sklearn.linear_model import LinearRegression
+
+from spotopt._compiled import compile_trees
+from spotopt._types import Frequency
+
+
+def test_matches_individual_models() -> None:
+    """Test that the flat trees reproduce the individual predictions."""
+    rng = np.random.default_rng(0)
+    quantiles = [10, 50, 90]
+    X = rng.normal(size=(30, 24, 3))  # noqa: N806
+    y = 2 * X[..., 0] + rng.normal(size=(30, 24))
+    qrs = {
+        (slot, 0, q): GradientBoostingRegressor(
+            loss="quantile",
+            alpha=q / 100,
+            n_estimators=20,
+            max_depth=2 + slot % 3,
+            random_state=0,
+        ).fit(X[:, slot], y[:, slot])
+        for slot in range(24)
+        for q in quantiles
+    }
+    stack = compile_trees(qrs, frequency=Frequency(60), quantiles=quantiles)
+    predictions = stack.predict(X)
+    assert predictions.shape == (30, 24, 3)
+    for (slot, _, q), mdl in qrs.items():
+        np.testing.assert_array_equal(
+            predictions[:, slot, quantiles.index(q)],
+            mdl.predict(X[:, slot]),
+        )
+
+
+def test_matches_histogram_models() -> None:
+    """Test that histogram-based models are reproduced with NaN."""
+    rng = np.random.default_rng(0)
+    quantiles = [10, 50, 90]
+    X = rng.normal(size=(200, 24, 3))  # noqa: N806
+    y = 2 * X[..., 0] + rng.normal(size=(200, 24))
+    X[::7, :, 1] = np.nan
+    qrs = {
+        (slot, 0, q): HistGradientBoostingRegressor(
+            loss="quantile",
+            quantile=q / 100,
+            max_iter=15,
+            max_depth=2 + slot % 3,
+            random_state=0,
+        ).fit(X[:, slot], y[:, slot])
+        for slot in range(24)
+        for q in quantiles
+    }
+    stack = compile_trees(qrs, frequency=Frequency(60), quantiles=quantiles)
+    assert not stack.single_precision
+    X[::5, :, 0] = np.nan
+    predictions = stack.predict(X)
+    for (slot, _, q), mdl in qrs.items():
+        np.testing.assert_array_equal(
+            predictions[:, slot, quantiles.index(q)],
+            mdl.predict(X[:, slot]),
+        )
+
+
+def test_non_constant_init() -> None:
+    """Test that models with a non-constant init are rejected."""
+    X = np.arange(10.0).reshape(-1, 1)  # noqa: N806
+    mdl = GradientBoostingRegressor(
+        loss="quantile",
+        alpha=0.5,
+        n_estimators=2,
+        init=LinearRegression(),
+    ).fit(X, X.ravel())
+    with pytest.raises(ValueError, match="constant init estimator"):
+        compile_trees(
+            {(0, 0, 50): mdl},
+            frequency=Frequency(60),
+            quantiles=[50],
+        )
@@ -0,0 +1,37 @@
+"""Tests for _cv.get_day_splits."""
+
+import numpy as np
+import pytest
+from sklearn.model_selection import TimeSeriesSplit
+
+from spotopt._cv import get_day_splits
+
+
+@pytest.mark.parametrize("gap_days", [0, 2])
+@pytest.mark.parametrize("max_train_days", [None, 5])
+def test_matches_time_series_split(gap_days, max_train_days) -> None:
+    """Test that the days are split like a TimeSeriesSplit."""
+    splits = get_day_splits(
+        23,
+        n_splits=3,
+        gap_days=gap_days,
+        max_train_days=max_train_days,
+    )
+    expected = TimeSeriesSplit(
+        n_splits=3,
+        gap=gap_days,
+        max_train_size=max_train_days,
+    ).split(np.zeros(23))
+    for (train, test), (expected_train, expected_test) in zip(
+        splits,
+        expected,
+        strict=True,
+    ):
+        np.testing.assert_array_equal(train, expected_train)
+        np.testing.assert_array_equal(test, expected_test)
+
+
+def test_too_few_days() -> None:
+    """Test that every fold needs training and test days."""
+    with pytest.raises(ValueError, match="too few for 3 forward splits"):
+        get_day_splits(8, n_splits=3, gap_days=2)
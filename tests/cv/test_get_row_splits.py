@@ -0,0 +1,31 @@
+"""Tests for _cv.get_row_splits."""
+
+import numpy as np
+
+from spotopt._cv import get_day_splits, get_row_splits
+
+
+def test_one_row_per_day_shares_splits() -> None:
+    """Test that models with a row per day share the day splits."""
+    day_splits = get_day_splits(12, n_splits=2)
+    assert get_row_splits(day_splits, np.arange(12)) is day_splits
+
+
+def test_missing_and_repeated_days() -> None:
+    """Test that the rows follow the split of their day."""
+    day_splits = get_day_splits(6, n_splits=2)
+    days = np.array([0, 0, 1, 2, 2, 4, 5, 5])
+    row_splits = get_row_splits(day_splits, days)
+    for (train_days, test_days), (train, test) in zip(
+        day_splits,
+        row_splits,
+        strict=True,
+    ):
+        np.testing.assert_array_equal(
+            train,
+            np.flatnonzero(np.isin(days, train_days)),
+        )
+        np.testing.assert_array_equal(
+            test,
+            np.flatnonzero(np.isin(days, test_days)),
+        )
@@ -1,5 +1,6 @@
 """Tests for function add_daily_min_max_obs."""
 
+import numpy as np
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
@@ -60,3 +61,20 @@ def test_standard_use_cases(df_in: pd.DataFrame, df_expected: pd.DataFrame):
     """Test daily min and max aggregation for the 'obs' column."""
     df_out = add_daily_min_max_obs(df_in)
     assert_frame_equal(df_out, df_expected, check_like=False)
+
+
+@pytest.mark.parametrize("periods", [96 * 3, 96 * 3 - 1])
+def test_matches_groupby(periods: int) -> None:
+    """Test that the regular grid and the fallback match groupby."""
+    rng = np.random.default_rng(0)
+    df_in = pd.DataFrame(
+        {"obs": rng.normal(size=periods)},
+        index=pd.date_range("2025-01-01", periods=periods, freq="15min"),
+    )
+    df_in.iloc[[5, 100], 0] = np.nan
+    grouped = df_in.groupby(df_in.index.date)["obs"]
+    df_expected = df_in.assign(
+        obs_min=grouped.transform("min"),
+        obs_max=grouped.transform("max"),
+    )
+    assert_frame_equal(add_daily_min_max_obs(df_in), df_expected)
@@ -130,3 +130,44 @@ def test_drop_origin(case: tuple[bool, list[str]]) -> None:
     )
     df_out = add_lags(df_in, ["obs"], lag_days=1, drop_origin=drop_origin)
     assert list(df_out.columns) == expected_cols
+
+
+@pytest.mark.parametrize("periods", [24 * 10, 24 * 10 - 5])
+def test_positional_lags_match_shift(periods: int) -> None:
+    """Test that positional lags match the shift in time."""
+    index = pd.date_range("2025-01-01 05:00", periods=periods, freq="h")
+    df_in = pd.DataFrame(
+        {"obs": np.arange(periods, dtype=float), "fcast": -index.hour},
+        index=index,
+    )
+    lagged = [
+        df_in[["obs", "fcast"]]
+        .shift(freq=pd.Timedelta(days=lag))
+        .add_suffix(f"_lag_{lag}d")
+        for lag in (1, 2, 7)
+    ]
+    df_expected = df_in.join(pd.concat(lagged, axis=1)).astype(
+        {"fcast_lag_1d": float, "fcast_lag_2d": float, "fcast_lag_7d": float},
+    )
+    df_expected = df_expected[
+        ["obs", "fcast"]
+        + [f"{c}_lag_{lag}d" for c in ("obs", "fcast") for lag in (1, 2, 7)]
+    ]
+
+    df_out = add_lags(df_in, ["obs", "fcast"], lag_days=[1, 2, 7])
+    assert_frame_equal(df_out, df_expected)
+
+
+def test_irregular_index() -> None:
+    """Test lags on an index with a gap."""
+    index = pd.DatetimeIndex(
+        ["2025-01-01 01:00", "2025-01-02 01:00", "2025-01-02 03:00"],
+        name="delivery",
+    )
+    df_in = pd.DataFrame({"obs": [0.0, 1.0, 2.0]}, index=index)
+    df_out = add_lags(df_in, ["obs"], lag_days=[1, 2])
+    assert df_out.columns.to_list() == ["obs", "obs_lag_1d", "obs_lag_2d"]
+    assert_frame_equal(
+        df_out,
+        df_in.assign(obs_lag_1d=[np.nan, 0.0, np.nan], obs_lag_2d=np.nan),
+    )
@@ -1,9 +1,11 @@
 """Tests for function add_weekday_dummies."""
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from spotopt._features import add_weekday_dummies
+from spotopt._types import WeekdayEncoding
 
 REQUIRED_COLS = [f"weekday_{i}" for i in range(1, 8)]
 
@@ -67,3 +69,19 @@ def test_all_weekday_order(df_in: pd.DataFrame) -> None:
         "obs",
         *sorted(REQUIRED_COLS),
     ]
+
+
+def test_encodings() -> None:
+    """Test the dummy and categorical encodings."""
+    df_in = pd.DataFrame(
+        {"obs": np.arange(10.0)},
+        index=pd.date_range("2025-01-01", periods=10, freq="D"),
+    )
+    dense = add_weekday_dummies(df_in)
+    assert all(pd.api.types.is_integer_dtype(t) for t in dense.dtypes[1:])
+    assert (dense[REQUIRED_COLS].sum(axis=1) == 1).all()
+    assert (dense["weekday_3"].iloc[[0, 7]] == 1).all()
+
+    categorical = add_weekday_dummies(df_in, WeekdayEncoding.CATEGORICAL)
+    assert list(categorical.columns) == ["obs", "weekday"]
+    assert categorical["weekday"].to_list() == [3, 4, 5, 6, 7, 1, 2, 3, 4, 5]
@@ -0,0 +1,47 @@
+"""Tests for features.build_day_features."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from spotopt._features import build_day_features, build_features
+from spotopt._types import WeekdayEncoding
+
+
+@pytest.mark.parametrize("weekday_encoding", list(WeekdayEncoding))
+def test_matches_build_features(weekday_encoding: WeekdayEncoding) -> None:
+    """Test that the features match the rows of the last day."""
+    periods = 96 * 3
+    rng = np.random.default_rng(0)
+    df_in = pd.DataFrame(
+        {
+            "obs": rng.normal(size=periods),
+            "fcast": rng.normal(size=periods),
+        },
+        index=pd.date_range("2025-01-01", periods=periods, freq="15min"),
+    )
+    df_out, _ = build_features(df_in, ["obs"], [1], weekday_encoding)
+    fit_cols = [
+        c for c in df_out.columns if c not in {"obs", "hour", "minute"}
+    ]
+    design = build_day_features(
+        fit_cols,
+        {"fcast": df_in["fcast"].to_numpy()[-96:]},
+        df_in["obs"].to_numpy()[-192:-96],
+        df_in.index[-1].weekday(),
+    )
+    np.testing.assert_array_equal(
+        design,
+        df_out[fit_cols].iloc[-96:].to_numpy(dtype=float),
+    )
+
+
+def test_missing_lags() -> None:
+    """Test that lags of other days or columns are rejected."""
+    with pytest.raises(ValueError, match="fcast_lag_1d"):
+        build_day_features(
+            ["fcast", "fcast_lag_1d"],
+            {"fcast": np.zeros(24)},
+            np.zeros(24),
+            0,
+        )
@@ -0,0 +1,78 @@
+"""Tests for features.build_features."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from spotopt._features import _chain_features, build_features
+from spotopt._types import WeekdayEncoding
+
+
+@pytest.mark.parametrize(
+    ("start", "lag_cols", "lag_days"),
+    [
+        ("2025-01-01 00:00", ["obs"], [1]),
+        ("2025-01-01 05:15", ["obs", "fcast"], [1, 2, 7]),
+        ("2025-01-01 23:45", ["fcast"], [2]),
+    ],
+)
+def test_matches_chained_features(
+    start: str,
+    lag_cols: list[str],
+    lag_days: list[int],
+) -> None:
+    """Test that the design matrix matches the chained functions."""
+    periods = 96 * 12
+    rng = np.random.default_rng(0)
+    df_in = pd.DataFrame(
+        {
+            "obs": rng.normal(size=periods),
+            "fcast": rng.normal(size=periods),
+        },
+        index=pd.date_range(start, periods=periods, freq="15min"),
+    )
+    # The observations of the last day are unknown.
+    df_in.iloc[-96:, 0] = np.nan
+    df_out, stats = build_features(df_in, lag_cols, lag_days)
+    assert_frame_equal(df_out, _chain_features(df_in, lag_cols, lag_days))
+    assert df_out.index.freq == df_in.index.freq
+    assert stats.design_bytes == df_out.to_numpy().nbytes
+    assert set(stats.stage_seconds) == {
+        "min_max",
+        "filter",
+        "lags",
+        "calendar",
+        "frame",
+    }
+
+
+def test_irregular_index() -> None:
+    """Test that irregular input uses the chained functions."""
+    index = pd.date_range("2025-01-01", periods=24 * 5, freq="h").delete(50)
+    df_in = pd.DataFrame(
+        {"obs": np.arange(len(index), dtype=float), "fcast": 0.0},
+        index=index,
+    )
+    df_out, stats = build_features(df_in, ["obs"], [1])
+    assert_frame_equal(df_out, _chain_features(df_in, ["obs"], [1]))
+    assert list(stats.stage_seconds) == ["chained"]
+
+
+@pytest.mark.parametrize("weekday_encoding", list(WeekdayEncoding))
+def test_weekday_encodings(weekday_encoding: WeekdayEncoding) -> None:
+    """Test that the weekday encodings match the chained functions."""
+    periods = 24 * 9
+    df_in = pd.DataFrame(
+        {
+            "obs": np.arange(periods, dtype=float),
+            "fcast": np.ones(periods),
+        },
+        index=pd.date_range("2025-01-01 07:00", periods=periods, freq="h"),
+    )
+    df_out, _ = build_features(df_in, ["obs"], [1], weekday_encoding)
+    assert_frame_equal(
+        df_out,
+        _chain_features(df_in, ["obs"], [1], weekday_encoding),
+    )
+    assert df_out.columns[-2:].to_list() == ["hour", "minute"]
@@ -1,13 +1,25 @@
 """Tests for model._fit."""
 
+import dataclasses
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
+from scipy.sparse import issparse
+from sklearn.ensemble import HistGradientBoostingRegressor
 from sklearn.linear_model import QuantileRegressor
 
 from spotopt import ModelName, SpotOptConfig
-from spotopt._types import Frequency
+from spotopt._search import get_search_cv
+from spotopt._types import (
+    CVStrategy,
+    Frequency,
+    QuantileMode,
+    SearchScope,
+    SearchStrategy,
+    SlotEncoding,
+)
 from spotopt.model import _fit
 
 _QUANTILES = [5, 25, 50, 75, 95]
@@ -46,9 +58,486 @@ def test_standard_use_cases(frequency: Frequency) -> None:
         frequency=frequency,
         mdl_kwargs={"alpha": 0.1},
     )
-    fit_cols, qrs = _fit(df_in, config=config)
+    result = _fit(df_in, config=config)
+    fit_cols, qrs = result.fit_cols, result.qrs
     assert isinstance(fit_cols, list)
     assert isinstance(qrs, dict)
     assert len(qrs) == 24 * freq_multiplier * len(_QUANTILES)
     for mdl in qrs.values():
         assert isinstance(mdl, QuantileRegressor)
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+def test_parallel_matches_serial() -> None:
+    """Test that fitting in parallel yields the serial models."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 7) for i in range(72)],
+            "fcast": range(72, 144),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=72,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    configs = [
+        SpotOptConfig(
+            model_name=ModelName("Lasso"),
+            frequency=Frequency(60),
+            mdl_kwargs={"alpha": 0.1},
+            n_jobs=n_jobs,
+        )
+        for n_jobs in (1, 2)
+    ]
+    serial = _fit(df_in, config=configs[0])
+    parallel = _fit(df_in, config=configs[1])
+    assert serial.fit_cols == parallel.fit_cols
+    assert list(serial.qrs) == list(parallel.qrs)
+    for key, mdl in serial.qrs.items():
+        assert (mdl.coef_ == parallel.qrs[key].coef_).all()
+        assert mdl.intercept_ == parallel.qrs[key].intercept_
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+def test_residual_mode() -> None:
+    """Test that the residual mode fits only the median models."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 7) for i in range(120)],
+            "fcast": range(120, 240),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=120,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=ModelName("Lasso"),
+        frequency=Frequency(60),
+        mdl_kwargs={"alpha": 0.1},
+        quantile_mode=QuantileMode.RESIDUAL,
+        residual_halflife_days=2.0,
+    )
+    result = _fit(df_in, config=config)
+    assert len(result.qrs) == 24  # noqa: PLR2004
+    assert {q for _, _, q in result.qrs} == {50}
+    assert result.residual_offsets.shape == (24, len(_QUANTILES))
+    assert (result.residual_offsets[:, 0] <= 0).all()
+    assert (result.residual_offsets[:, -1] >= 0).all()
+    assert (np.diff(result.residual_offsets, axis=1) >= 0).all()
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+@pytest.mark.parametrize("slot_encoding", list(SlotEncoding))
+def test_pooled(slot_encoding: SlotEncoding) -> None:
+    """Test that the pooled mode fits one model per quantile."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 7) for i in range(120)],
+            "fcast": range(120, 240),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=120,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=ModelName("Lasso"),
+        frequency=Frequency(60),
+        mdl_kwargs={"alpha": 0.1},
+        pooled=True,
+        slot_encoding=slot_encoding,
+    )
+    result = _fit(df_in, config=config)
+    assert list(result.qrs) == [(0, 0, q) for q in _QUANTILES]
+    mdl = result.qrs[0, 0, 50]
+    assert mdl.coef_.shape == (len(result.fit_cols) + 2,)
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+def test_slot_groups() -> None:
+    """Test that grouped look-ahead times share one model."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 7) for i in range(480)],
+            "fcast": range(480, 960),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=480,
+            freq="15min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=ModelName("Lasso"),
+        frequency=Frequency(15),
+        mdl_kwargs={"alpha": 0.1},
+        slot_group_size=4,
+    )
+    result = _fit(df_in, config=config)
+    assert len(result.qrs) == 24 * len(_QUANTILES)
+    assert {m for _, m, _ in result.qrs} == {0}
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+def test_sparse_features_match_dense() -> None:
+    """Test that sparse Lasso features give the dense coefficients."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 7) for i in range(120)],
+            "fcast": range(120, 240),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=120,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=ModelName("Lasso"),
+        frequency=Frequency(60),
+        mdl_kwargs={"alpha": 0.1},
+        solver="highs-ds",
+    )
+    dense = _fit(df_in, config=config)
+    with patch(
+        "spotopt.model.QuantileRegressor.fit",
+        autospec=True,
+        side_effect=QuantileRegressor.fit,
+    ) as fit:
+        sparse = _fit(
+            df_in,
+            config=dataclasses.replace(config, sparse_threshold=0.1),
+        )
+    assert all(issparse(call.args[1]) for call in fit.call_args_list)
+    for key, mdl in dense.qrs.items():
+        assert mdl.solver == "highs-ds"
+        np.testing.assert_allclose(sparse.qrs[key].coef_, mdl.coef_)
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+def test_path_search_selects_alpha_per_slot() -> None:
+    """Test that the path search uses one alpha for all quantiles."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 7) for i in range(120)],
+            "fcast": range(120, 240),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=120,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=ModelName("Lasso"),
+        frequency=Frequency(60),
+        run_hyperparam_search=True,
+        cv=2,
+        search_strategy=SearchStrategy.PATH,
+        slot_group_size=6,
+    )
+    result = _fit(df_in, config=config)
+    assert len(result.qrs) == 4 * len(_QUANTILES)
+    for h in (0, 6, 12, 18):
+        alphas = {result.qrs[h, 0, q].alpha for q in _QUANTILES}
+        assert len(alphas) == 1
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+@patch(
+    "spotopt._constants.CV_PARAMS",
+    {"GBR": {"learning_rate": [0.1], "n_estimators": [2, 4]}},
+)
+def test_path_search_gbr() -> None:
+    """Test that the GBR path search selects a candidate count."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 7) for i in range(120)],
+            "fcast": range(120, 240),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=120,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=ModelName("GBR"),
+        frequency=Frequency(60),
+        run_hyperparam_search=True,
+        cv=2,
+        search_strategy=SearchStrategy.PATH,
+    )
+    result = _fit(df_in, config=config)
+    assert len(result.qrs) == 24 * len(_QUANTILES)
+    assert {len(mdl.estimators_) for mdl in result.qrs.values()} <= {2, 4}
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+@patch(
+    "spotopt._constants.CV_PARAMS",
+    {"HGB": {"learning_rate": [0.1], "max_iter": [2, 4]}},
+)
+@pytest.mark.parametrize("pooled", [False, True])
+def test_path_search_hgb(*, pooled: bool) -> None:
+    """Test the HGB path search per look-ahead time and pooled."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 7) for i in range(120)],
+            "fcast": range(120, 240),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=120,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=ModelName("HGB"),
+        frequency=Frequency(60),
+        run_hyperparam_search=True,
+        cv=2,
+        search_strategy=SearchStrategy.PATH,
+        pooled=pooled,
+    )
+    result = _fit(df_in, config=config)
+    assert len(result.qrs) == (1 if pooled else 24) * len(_QUANTILES)
+    for (_, _, q), mdl in result.qrs.items():
+        assert isinstance(mdl, HistGradientBoostingRegressor)
+        assert mdl.quantile == q / 100
+        assert mdl.n_iter_ in {2, 4}
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+@pytest.mark.parametrize(
+    ("mdl_kwargs", "early_stopping"),
+    [
+        ({"max_iter": 5}, False),
+        ({"max_iter": 5, "early_stopping": True}, True),
+    ],
+)
+def test_hgb_early_stopping(
+    mdl_kwargs: dict[str, object],
+    *,
+    early_stopping: bool,
+) -> None:
+    """Test that HGB stops early only if requested."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 7) for i in range(96)],
+            "fcast": range(96, 192),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=96,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=ModelName("HGB"),
+        frequency=Frequency(60),
+        mdl_kwargs=mdl_kwargs,
+        pooled=True,
+    )
+    result = _fit(df_in, config=config)
+    for mdl in result.qrs.values():
+        assert mdl.early_stopping is early_stopping
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+@pytest.mark.parametrize(
+    "search_kwargs",
+    [
+        {"search_strategy": SearchStrategy.RANDOM, "n_iter": 2},
+        {"search_strategy": SearchStrategy.HALVING},
+        {
+            "search_strategy": SearchStrategy.HALVING,
+            "search_resource": "n_estimators",
+        },
+    ],
+)
+def test_search_strategies(search_kwargs) -> None:
+    """Test the randomized and halving searches in a user space."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 7) for i in range(120)],
+            "fcast": range(120, 240),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=120,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    search_space = {"learning_rate": [0.1, 0.3, 0.5], "n_estimators": [2, 6]}
+    config = SpotOptConfig(
+        model_name=ModelName("GBR"),
+        frequency=Frequency(60),
+        run_hyperparam_search=True,
+        cv=2,
+        pooled=True,
+        search_space=search_space,
+        **search_kwargs,
+    )
+    result = _fit(df_in, config=config)
+    assert len(result.qrs) == len(_QUANTILES)
+    for mdl in result.qrs.values():
+        assert mdl.learning_rate in search_space["learning_rate"]
+        assert mdl.n_estimators in search_space["n_estimators"]
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+@patch(
+    "spotopt._constants.CV_PARAMS",
+    {"Lasso": {"alpha": [0.01, 0.1, 1.0]}},
+)
+@pytest.mark.parametrize(
+    ("search_kwargs", "n_search_groups"),
+    [
+        ({}, 24),
+        ({"search_scope": SearchScope.PER_QUANTILE}, 1),
+        (
+            {
+                "search_scope": SearchScope.PER_QUANTILE,
+                "search_sample_slots": 3,
+            },
+            1,
+        ),
+        (
+            {
+                "search_scope": SearchScope.PER_SLOT_GROUP,
+                "search_group_size": 6,
+            },
+            4,
+        ),
+    ],
+)
+def test_search_scope(search_kwargs, n_search_groups) -> None:
+    """Test that the slots of a search group share the parameters."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 7) for i in range(120)],
+            "fcast": range(120, 240),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=120,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=ModelName("Lasso"),
+        frequency=Frequency(60),
+        run_hyperparam_search=True,
+        cv=2,
+        **search_kwargs,
+    )
+    with patch(
+        "spotopt.model.get_search_cv",
+        side_effect=get_search_cv,
+    ) as search:
+        result = _fit(df_in, config=config)
+    assert search.call_count == n_search_groups * len(_QUANTILES)
+    assert result.best_params.keys() == result.qrs.keys()
+    for (h, _, q), params in result.best_params.items():
+        assert params == {"alpha": result.qrs[h, 0, q].alpha}
+        group = h // (24 // n_search_groups) * (24 // n_search_groups)
+        assert params == result.best_params[group, 0, q]
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+@patch(
+    "spotopt._constants.CV_PARAMS",
+    {"Lasso": {"alpha": [0.01, 0.1]}},
+)
+def test_forward_cv_shares_splits() -> None:
+    """Test that all models search on the same forward day splits."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 7) for i in range(240)],
+            "fcast": range(240, 480),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=240,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=ModelName("Lasso"),
+        frequency=Frequency(60),
+        run_hyperparam_search=True,
+        cv=2,
+        cv_strategy=CVStrategy.FORWARD,
+        cv_gap_days=1,
+        cv_train_days=4,
+    )
+    with patch(
+        "spotopt.model.get_search_cv",
+        side_effect=get_search_cv,
+    ) as search:
+        _fit(df_in, config=config)
+    splits = search.call_args_list[0].args[2]
+    assert all(call.args[2] is splits for call in search.call_args_list)
+    assert [(len(train), len(test)) for train, test in splits] == [
+        (2, 3),
+        (4, 3),
+    ]
+    for train, test in splits:
+        assert train[-1] + 1 < test[0]
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+def test_time_budget() -> None:
+    """Test that an exhausted budget stops boosting and is recorded."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 7) for i in range(120)],
+            "fcast": range(120, 240),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=120,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=ModelName("GBR"),
+        frequency=Frequency(60),
+        early_stopping_rounds=5,
+        time_budget_seconds=1e-6,
+    )
+    result = _fit(df_in, config=config)
+    assert {len(mdl.estimators_) for mdl in result.qrs.values()} == {1}
+    assert result.fit_seconds.keys() == result.qrs.keys()
+    assert all(seconds > 0 for seconds in result.fit_seconds.values())
@@ -1,8 +1,10 @@
 """Tests for model._prepare_data."""
 
 import pandas as pd
+import pytest
 
-from spotopt._types import Frequency
+from spotopt._exceptions import MissingColumnsError
+from spotopt._types import Frequency, WeekdayEncoding
 from spotopt.model import _prepare_data
 
 
@@ -42,3 +44,66 @@ def test_standard_use_cases():
         "minute",
     ]
     assert df_out.shape == (24, 14)
+
+
+def test_lags():
+    """Test configured lags of several columns."""
+    df_in = pd.DataFrame(
+        {
+            "obs": range(72),
+            "fcast": range(72, 144),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=72,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    df_out = _prepare_data(
+        df_in,
+        frequency=Frequency(60),
+        lag_cols=["obs", "fcast"],
+        lag_days=[1, 2],
+    )
+    assert df_out.shape == (24, 17)
+    assert df_out["obs_lag_2d"].to_list() == list(range(24))
+    assert df_out["fcast_lag_1d"].to_list() == list(range(96, 120))
+
+
+def test_missing_lag_cols():
+    """Test that lags of missing columns are rejected."""
+    df_in = pd.DataFrame(
+        {"obs": range(48), "fcast": range(48)},
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=48,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    with pytest.raises(MissingColumnsError, match="Missing lag columns"):
+        _prepare_data(df_in, frequency=Frequency(60), lag_cols=["wind"])
+
+
+def test_categorical_weekday():
+    """Test the categorical weekday encoding."""
+    df_in = pd.DataFrame(
+        {
+            "obs": range(48),
+            "fcast": range(48, 96),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=48,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    df_out = _prepare_data(
+        df_in,
+        frequency=Frequency(60),
+        weekday_encoding=WeekdayEncoding.CATEGORICAL,
+    )
+    assert df_out.shape == (24, 8)
+    assert (df_out["weekday"] == 5.0).all()  # noqa: PLR2004
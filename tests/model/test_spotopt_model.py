@@ -2,12 +2,25 @@
 
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from spotopt import ModelName, SpotOptConfig, SpotOptModel
-from spotopt._types import Frequency
+from spotopt._exceptions import ModelNotFittedError
+from spotopt._types import (
+    Frequency,
+    QuantileMode,
+    SearchStrategy,
+    SlotEncoding,
+)
 
 _QUANTILES = [5, 25, 50, 75, 95]
+_MDL_KWARGS = {
+    ModelName.LASSO: {"alpha": 0.1},
+    ModelName.GBR: {"n_estimators": 10},
+    ModelName.HGB: {"max_iter": 10, "min_samples_leaf": 5},
+}
 
 
 @patch("spotopt._constants.QUANTILES", _QUANTILES)
@@ -38,3 +51,513 @@ def test_standard_use_cases() -> None:
     predictions = spotopt_mdl.predict(df_in)
     assert isinstance(predictions, pd.DataFrame)
     assert predictions.shape == (24, len(_QUANTILES))
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+def test_predict_array() -> None:
+    """Test that predict_array matches the DataFrame predictions."""
+    # The range contains the switch from CEST to CET with 73 hours.
+    df_in = pd.DataFrame(
+        {
+            "obs": range(73),
+            "fcast": range(73, 146),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-10-25 00:00:00", tz="CET"),
+            end=pd.Timestamp("2025-10-27 23:00:00", tz="CET"),
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=ModelName("Lasso"),
+        frequency=Frequency(60),
+        mdl_kwargs={"alpha": 0.1},
+    )
+    spotopt_mdl = SpotOptModel(config)
+    spotopt_mdl.fit(df_in)
+    predictions = spotopt_mdl.predict(df_in)
+    values, index = spotopt_mdl.predict_array(df_in)
+    assert (predictions.dtypes == np.float64).all()
+    assert values.dtype == np.float64
+    assert values.shape == (49, len(_QUANTILES))
+    assert index.equals(predictions.index)
+    np.testing.assert_array_equal(values, predictions.to_numpy())
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+def test_compiled_lasso_matches_models() -> None:
+    """Test that the compiled Lasso models match the fitted models."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 5) for i in range(96)],
+            "fcast": range(96, 192),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=96,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=ModelName("Lasso"),
+        frequency=Frequency(60),
+        mdl_kwargs={"alpha": 0.1},
+    )
+    spotopt_mdl = SpotOptModel(config)
+    spotopt_mdl.fit(df_in)
+    assert spotopt_mdl.compiled is not None
+    predictions = spotopt_mdl.predict(df_in)
+    spotopt_mdl.compiled = None
+    np.testing.assert_allclose(
+        predictions.to_numpy(),
+        spotopt_mdl.predict(df_in).to_numpy(),
+        rtol=1e-12,
+    )
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+def test_compiled_gbr_matches_models() -> None:
+    """Test that the compiled GBR models match the fitted models."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 5) for i in range(96)],
+            "fcast": range(96, 192),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=96,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=ModelName("GBR"),
+        frequency=Frequency(60),
+        mdl_kwargs={"n_estimators": 10},
+    )
+    spotopt_mdl = SpotOptModel(config)
+    spotopt_mdl.fit(df_in)
+    assert spotopt_mdl.compiled is None
+    predictions = spotopt_mdl.predict(df_in)
+    spotopt_mdl.compile()
+    assert spotopt_mdl.compiled is not None
+    pd.testing.assert_frame_equal(spotopt_mdl.predict(df_in), predictions)
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+def test_residual_mode_predictions() -> None:
+    """Test that residual quantiles are added to the median."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 5) for i in range(96)],
+            "fcast": range(96, 192),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=96,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=ModelName("Lasso"),
+        frequency=Frequency(60),
+        mdl_kwargs={"alpha": 0.1},
+        quantile_mode=QuantileMode.RESIDUAL,
+    )
+    spotopt_mdl = SpotOptModel(config)
+    spotopt_mdl.fit(df_in)
+    predictions = spotopt_mdl.predict(df_in)
+    assert predictions.shape == (72, len(_QUANTILES))
+    offsets = spotopt_mdl.residual_offsets
+    first_hour = predictions[predictions.index.hour == 0].to_numpy()
+    np.testing.assert_allclose(
+        first_hour - first_hour[:, [2]],
+        np.tile(offsets[0] - offsets[0, 2], (3, 1)),
+    )
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+def test_residual_mode_coverage() -> None:
+    """Test that the residual quantiles cover new days of boosting."""
+    n_train, n_test = 30, 20
+    rng = np.random.default_rng(0)
+    fcast = rng.normal(size=24 * (n_train + n_test))
+    df_in = pd.DataFrame(
+        {"obs": fcast + rng.normal(size=len(fcast)), "fcast": fcast},
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=len(fcast),
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=ModelName.GBR,
+        frequency=Frequency(60),
+        mdl_kwargs={"n_estimators": 50, "learning_rate": 0.5},
+        quantile_mode=QuantileMode.RESIDUAL,
+        slot_group_size=3,
+    )
+    spotopt_mdl = SpotOptModel(config)
+    spotopt_mdl.fit(df_in.iloc[: 24 * n_train])
+    test = df_in.iloc[24 * (n_train - 1) :]
+    predictions = spotopt_mdl.predict(test)
+    obs = test["obs"].to_numpy()[24:]
+    coverage = np.mean(
+        (obs >= predictions["q_005"]) & (obs <= predictions["q_095"]),
+    )
+    assert coverage > 0.8  # noqa: PLR2004
+
+
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+def test_output_quantiles_are_interpolated() -> None:
+    """Test that output quantiles are interpolated from fitted ones."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 5) for i in range(96)],
+            "fcast": range(96, 192),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=96,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=ModelName("Lasso"),
+        frequency=Frequency(60),
+        mdl_kwargs={"alpha": 0.1},
+        fit_quantiles=[10, 50, 90],
+        output_quantiles=[10, 30, 50, 90],
+    )
+    spotopt_mdl = SpotOptModel(config)
+    spotopt_mdl.fit(df_in)
+    assert len(spotopt_mdl.qrs) == 24 * 3
+    predictions = spotopt_mdl.predict(df_in)
+    assert predictions.columns.to_list() == [
+        "q_010",
+        "q_030",
+        "q_050",
+        "q_090",
+    ]
+    assert (predictions.diff(axis=1).iloc[:, 1:] >= 0).all().all()
+    np.testing.assert_allclose(
+        predictions["q_030"],
+        (predictions["q_010"] + predictions["q_050"]) / 2,
+    )
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+@pytest.mark.parametrize("model_name", list(ModelName))
+def test_compiled_pooled_matches_models(model_name: ModelName) -> None:
+    """Test that compiled pooled models match the fitted models."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 5) for i in range(96)],
+            "fcast": range(96, 192),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=96,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=model_name,
+        frequency=Frequency(60),
+        mdl_kwargs=_MDL_KWARGS[model_name],
+        pooled=True,
+        slot_encoding=SlotEncoding.CYCLIC,
+    )
+    spotopt_mdl = SpotOptModel(config)
+    spotopt_mdl.fit(df_in)
+    spotopt_mdl.compiled = None
+    predictions = spotopt_mdl.predict(df_in)
+    assert not predictions.isna().any().any()
+    spotopt_mdl.compile()
+    pd.testing.assert_frame_equal(
+        spotopt_mdl.predict(df_in),
+        predictions,
+        rtol=1e-12,
+    )
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+@pytest.mark.parametrize("model_name", list(ModelName))
+def test_compiled_slot_groups_match_models(model_name: ModelName) -> None:
+    """Test that compiled grouped models match the fitted models."""
+    df_in = pd.DataFrame(
+        {
+            "obs": [float(i % 5) for i in range(96)],
+            "fcast": range(96, 192),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=96,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+    config = SpotOptConfig(
+        model_name=model_name,
+        frequency=Frequency(60),
+        mdl_kwargs=_MDL_KWARGS[model_name],
+        slot_group_size=3,
+    )
+    spotopt_mdl = SpotOptModel(config)
+    spotopt_mdl.fit(df_in)
+    assert len(spotopt_mdl.qrs) == 8 * len(_QUANTILES)
+    spotopt_mdl.compiled = None
+    predictions = spotopt_mdl.predict(df_in)
+    assert not predictions.isna().any().any()
+    spotopt_mdl.compile()
+    pd.testing.assert_frame_equal(
+        spotopt_mdl.predict(df_in),
+        predictions,
+        rtol=1e-12,
+    )
+
+
+def _get_daily_data(start: str, n_days: int) -> pd.DataFrame:
+    """Get hourly data of whole days with a daily pattern."""
+    index = pd.date_range(
+        start=pd.Timestamp(start, tz="CET"),
+        end=pd.Timestamp(start, tz="CET") + pd.DateOffset(days=n_days),
+        freq="60min",
+        inclusive="left",
+        name="delivery",
+    )
+    hours = np.arange(len(index))
+    return pd.DataFrame(
+        {
+            "obs": np.sin(hours / 24 * 2 * np.pi) + hours % 5 / 10,
+            "fcast": np.cos(hours / 12 * np.pi),
+        },
+        index=index,
+    )
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+def test_update_matches_fit() -> None:
+    """Test that an update matches fitting on all days."""
+    df_in = _get_daily_data("2025-03-25", 8)
+    config = SpotOptConfig(
+        model_name=ModelName("Lasso"),
+        frequency=Frequency(60),
+        mdl_kwargs={"alpha": 0.1},
+        lag_days=[1, 2],
+    )
+    updated = SpotOptModel(config)
+    updated.fit(df_in.iloc[: 24 * 5], keep_data=True)
+    # The new days contain the switch from CET to CEST.
+    updated.update(df_in.iloc[24 * 5 :])
+    fitted = SpotOptModel(config)
+    fitted.fit(df_in, keep_data=True)
+    np.testing.assert_array_equal(updated._store.data.X, fitted._store.data.X)
+    np.testing.assert_array_equal(updated._store.data.y, fitted._store.data.y)
+    np.testing.assert_array_equal(
+        updated._store.data.day_pos,
+        fitted._store.data.day_pos,
+    )
+    pd.testing.assert_frame_equal(
+        updated.predict(df_in),
+        fitted.predict(df_in),
+        rtol=1e-9,
+    )
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+@patch("spotopt._constants.CV_PARAMS", {"Lasso": {"alpha": [0.01, 1.0]}})
+def test_update_reuses_searched_params() -> None:
+    """Test that an update keeps the selected hyperparameters."""
+    df_in = _get_daily_data("2025-01-02", 6)
+    config = SpotOptConfig(
+        model_name=ModelName("Lasso"),
+        frequency=Frequency(60),
+        run_hyperparam_search=True,
+        cv=2,
+        search_strategy=SearchStrategy.PATH,
+    )
+    spotopt_mdl = SpotOptModel(config)
+    spotopt_mdl.fit(df_in.iloc[: 24 * 4], keep_data=True)
+    best_params = spotopt_mdl.best_params
+    spotopt_mdl.update(df_in.iloc[24 * 4 :])
+    assert spotopt_mdl.best_params == best_params
+    for key, mdl in spotopt_mdl.qrs.items():
+        assert mdl.alpha == best_params[key]["alpha"]
+    assert spotopt_mdl.compiled is not None
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+@pytest.mark.parametrize("model_name", [ModelName.GBR, ModelName.HGB])
+def test_update_warm_start_adds_stages(model_name: ModelName) -> None:
+    """Test that a warm start adds stages to the fitted models."""
+    df_in = _get_daily_data("2025-01-02", 6)
+    config = SpotOptConfig(
+        model_name=model_name,
+        frequency=Frequency(60),
+        mdl_kwargs=_MDL_KWARGS[model_name],
+    )
+    spotopt_mdl = SpotOptModel(config)
+    spotopt_mdl.fit(df_in.iloc[: 24 * 4], keep_data=True)
+    spotopt_mdl.compile()
+    spotopt_mdl.update(df_in.iloc[24 * 4 :], warm_start_stages=5)
+    assert spotopt_mdl.compiled is not None
+    for mdl in spotopt_mdl.qrs.values():
+        n_stages = (
+            mdl.n_estimators_ if model_name == ModelName.GBR else mdl.n_iter_
+        )
+        assert n_stages == 15  # noqa: PLR2004
+    assert len(spotopt_mdl._store.data.valid) == 5  # noqa: PLR2004
+    assert not spotopt_mdl.predict(df_in).isna().any().any()
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+def test_update_errors() -> None:
+    """Test that invalid updates are rejected."""
+    df_in = _get_daily_data("2025-01-02", 6)
+    config = SpotOptConfig(
+        model_name=ModelName("Lasso"),
+        frequency=Frequency(60),
+        mdl_kwargs={"alpha": 0.1},
+    )
+    spotopt_mdl = SpotOptModel(config)
+    with pytest.raises(ModelNotFittedError):
+        spotopt_mdl.update(df_in)
+    spotopt_mdl.fit(df_in.iloc[: 24 * 4])
+    with pytest.raises(ModelNotFittedError, match="keep_data"):
+        spotopt_mdl.update(df_in.iloc[24 * 4 :])
+    spotopt_mdl.fit(df_in.iloc[: 24 * 4], keep_data=True)
+    with pytest.raises(ValueError, match="right after"):
+        spotopt_mdl.update(df_in.iloc[24 * 5 :])
+    with pytest.raises(ValueError, match="right after"):
+        spotopt_mdl.update(df_in.iloc[24 * 3 :])
+    with pytest.raises(ValueError, match="columns"):
+        spotopt_mdl.update(df_in.iloc[24 * 4 :].assign(extra=1.0))
+    with pytest.raises(ValueError, match="warm_start_stages"):
+        spotopt_mdl.update(df_in.iloc[24 * 4 :], warm_start_stages=5)
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+def test_update_moves_training_window() -> None:
+    """Test that an update moves the training window forward."""
+    df_in = _get_daily_data("2025-01-02", 9)
+    config = SpotOptConfig(
+        model_name=ModelName("Lasso"),
+        frequency=Frequency(60),
+        mdl_kwargs={"alpha": 0.1},
+        max_training_days=3,
+    )
+    updated = SpotOptModel(config)
+    updated.fit(df_in.iloc[: 24 * 5], keep_data=True)
+    for day in range(5, 9):
+        updated.update(df_in.iloc[24 * day : 24 * (day + 1)])
+    fitted = SpotOptModel(config)
+    fitted.fit(df_in)
+    assert fitted._store is None
+    assert updated._store.data.valid.shape == (3, 24)
+    assert updated._store.data.first_day == pd.Timestamp("2025-01-08")
+    pd.testing.assert_frame_equal(
+        updated.predict(df_in),
+        fitted.predict(df_in),
+        rtol=1e-9,
+    )
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+@pytest.mark.parametrize("model_name", list(ModelName))
+def test_recency_weights(model_name: ModelName) -> None:
+    """Test that the recency weights are passed to the models."""
+    df_in = _get_daily_data("2025-01-02", 6)
+    predictions = []
+    for halflife in (None, 0.5):
+        config = SpotOptConfig(
+            model_name=model_name,
+            frequency=Frequency(60),
+            mdl_kwargs=_MDL_KWARGS[model_name],
+            recency_halflife_days=halflife,
+        )
+        spotopt_mdl = SpotOptModel(config)
+        spotopt_mdl.fit(df_in)
+        predictions.append(spotopt_mdl.predict(df_in).to_numpy())
+    assert not np.isnan(predictions[1]).any()
+    assert not np.allclose(predictions[0], predictions[1])
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+@pytest.mark.parametrize("model_name", list(ModelName))
+def test_predict_next_day(model_name: ModelName) -> None:
+    """Test that predict_next_day matches the predictions of the day."""
+    df_in = _get_daily_data("2025-01-02", 6)
+    df_in["wind"] = np.arange(len(df_in)) % 7
+    config = SpotOptConfig(
+        model_name=model_name,
+        frequency=Frequency(60),
+        mdl_kwargs=_MDL_KWARGS[model_name],
+        output_quantiles=[10, 50, 90],
+    )
+    spotopt_mdl = SpotOptModel(config)
+    spotopt_mdl.fit(df_in.iloc[: 24 * 5])
+    spotopt_mdl.compile()
+    expected = spotopt_mdl.predict(df_in.iloc[24 * 4 :])
+    previous, day = df_in.iloc[24 * 4 : 24 * 5], df_in.iloc[24 * 5 :]
+    predictions = spotopt_mdl.predict_next_day(
+        previous["obs"].to_numpy(),
+        day["fcast"].to_numpy(),
+        delivery_day="2025-01-07",
+        extra={"wind": day["wind"]},
+    )
+    assert predictions.shape == (24, 3)
+    np.testing.assert_allclose(predictions, expected.to_numpy(), rtol=1e-9)
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+def test_predict_next_day_errors() -> None:
+    """Test that predict_next_day rejects unsupported inputs."""
+    df_in = _get_daily_data("2025-01-02", 4)
+    config = SpotOptConfig(
+        model_name=ModelName("Lasso"),
+        frequency=Frequency(60),
+        mdl_kwargs={"alpha": 0.1},
+        lag_days=[1, 2],
+    )
+    spotopt_mdl = SpotOptModel(config)
+    with pytest.raises(ModelNotFittedError):
+        spotopt_mdl.predict_next_day(
+            np.zeros(24),
+            np.zeros(24),
+            delivery_day="2025-01-06",
+        )
+    spotopt_mdl.fit(df_in)
+    with pytest.raises(ValueError, match="24 values"):
+        spotopt_mdl.predict_next_day(
+            np.zeros(24),
+            np.zeros(23),
+            delivery_day="2025-01-06",
+        )
+    with pytest.raises(ValueError, match="obs_lag_2d"):
+        spotopt_mdl.predict_next_day(
+            np.zeros(24),
+            np.zeros(24),
+            delivery_day="2025-01-06",
+        )
@@ -0,0 +1,38 @@
+"""Tests for model._trace_memory."""
+
+import logging
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from spotopt.model import _trace_memory
+
+
+def test_standard_use_cases(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that the peak memory is logged only if enabled."""
+    with caplog.at_level(logging.DEBUG, logger="spotopt"):
+        with _trace_memory("stage", enabled=False):
+            pass
+        assert "Peak traced memory" not in caplog.text
+        with _trace_memory("stage", enabled=True):
+            np.ones(10_000)
+    assert "Peak traced memory of stage" in caplog.text
+    assert not tracemalloc.is_tracing()
+
+
+def test_running_trace(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that a running trace is kept and its peak is reset."""
+    tracemalloc.start()
+    try:
+        np.ones(1_000_000)
+        with (
+            caplog.at_level(logging.DEBUG, logger="spotopt"),
+            _trace_memory("stage", enabled=True),
+        ):
+            pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    peak = int(caplog.records[-1].args[1])
+    assert peak < 1_000_000  # noqa: PLR2004
@@ -0,0 +1,123 @@
+"""Tests for saving and loading models."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from spotopt import ModelName, SpotOptConfig, SpotOptModel
+from spotopt._exceptions import ModelFormatError
+from spotopt._types import Frequency, QuantileMode
+
+_QUANTILES = [5, 50, 95]
+
+
+def _get_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "obs": [float(i % 5) for i in range(96)],
+            "fcast": range(96, 192),
+        },
+        index=pd.date_range(
+            start=pd.Timestamp("2025-01-02 00:00:00", tz="CET"),
+            periods=96,
+            freq="60min",
+            name="delivery",
+        ),
+    )
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+@pytest.mark.parametrize(
+    ("config", "array_name"),
+    [
+        (
+            SpotOptConfig(
+                model_name=ModelName("Lasso"),
+                frequency=Frequency(60),
+                mdl_kwargs={"alpha": 0.1},
+            ),
+            "coef",
+        ),
+        (
+            SpotOptConfig(
+                model_name=ModelName("GBR"),
+                frequency=Frequency(60),
+                mdl_kwargs={"n_estimators": 5},
+            ),
+            "threshold",
+        ),
+        (
+            SpotOptConfig(
+                model_name=ModelName("GBR"),
+                frequency=Frequency(60),
+                mdl_kwargs={"n_estimators": 5},
+                quantile_mode=QuantileMode.RESIDUAL,
+            ),
+            "value",
+        ),
+    ],
+)
+@pytest.mark.parametrize("mmap", [True, False])
+def test_round_trip(
+    tmp_path: Path,
+    config: SpotOptConfig,
+    array_name: str,
+    mmap: bool,  # noqa: FBT001
+) -> None:
+    """Test that a loaded model predicts like the saved model."""
+    df_in = _get_df()
+    spotopt_mdl = SpotOptModel(config)
+    spotopt_mdl.fit(df_in)
+    spotopt_mdl.save(tmp_path)
+
+    loaded = SpotOptModel.load(tmp_path, mmap=mmap)
+    assert loaded.config == config
+    assert loaded.fit_cols == spotopt_mdl.fit_cols
+    assert isinstance(loaded.compiled.quantiles, tuple)
+    array = getattr(loaded.compiled, array_name)
+    assert isinstance(array, np.memmap) is mmap
+    pd.testing.assert_frame_equal(
+        loaded.predict(df_in),
+        spotopt_mdl.predict(df_in),
+    )
+    compiled = loaded.compiled
+    loaded.compile()
+    assert loaded.compiled is compiled
+
+
+@patch("spotopt._constants.QUANTILES", _QUANTILES)
+@patch("spotopt._constants.MIN_NR_DAYS_TRAIN", 0)
+@pytest.mark.parametrize(
+    ("key", "value", "match"),
+    [
+        ("format_version", 0, "Unsupported model format version"),
+        ("config_fingerprint", "0", "does not match its fingerprint"),
+    ],
+)
+def test_incompatible_metadata(
+    tmp_path: Path,
+    key: str,
+    value: object,
+    match: str,
+) -> None:
+    """Test that incompatible models are rejected."""
+    spotopt_mdl = SpotOptModel(
+        SpotOptConfig(
+            model_name=ModelName("Lasso"),
+            frequency=Frequency(60),
+            mdl_kwargs={"alpha": 0.1},
+        ),
+    )
+    spotopt_mdl.fit(_get_df())
+    spotopt_mdl.save(tmp_path)
+    metadata_path = tmp_path / "metadata.json"
+    metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+    metadata[key] = value
+    metadata_path.write_text(json.dumps(metadata), encoding="utf-8")
+    with pytest.raises(ModelFormatError, match=match):
+        SpotOptModel.load(tmp_path)
@@ -0,0 +1,91 @@
+"""Tests for _search.get_search_cv."""
+
+import numpy as np
+from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import (
+    GridSearchCV,
+    HalvingGridSearchCV,
+    RandomizedSearchCV,
+)
+
+from spotopt._search import get_search_cv
+from spotopt._types import Frequency, ModelName, SearchStrategy, SpotOptConfig
+
+_SPACE = {"learning_rate": [0.05, 0.1, 0.5], "n_estimators": [3, 9]}
+
+
+def _get_config(**kwargs: object) -> SpotOptConfig:
+    return SpotOptConfig(
+        model_name=ModelName.GBR,
+        frequency=Frequency.H,
+        run_hyperparam_search=True,
+        **{"search_space": _SPACE, **kwargs},
+    )
+
+
+def test_grid() -> None:
+    """Test that the grid search uses the user search space."""
+    search = get_search_cv(GradientBoostingRegressor(), _get_config(), cv=3)
+    assert isinstance(search, GridSearchCV)
+    assert search.param_grid == _SPACE
+
+
+def test_random() -> None:
+    """Test that the randomized search samples n_iter candidates."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(40, 2))  # noqa: N806
+    y = X[:, 0] + rng.normal(size=40)
+    config = _get_config(search_strategy=SearchStrategy.RANDOM, n_iter=4)
+    search = get_search_cv(GradientBoostingRegressor(), config, cv=3)
+    assert isinstance(search, RandomizedSearchCV)
+    search.fit(X, y)
+    assert len(search.cv_results_["params"]) == 4  # noqa: PLR2004
+
+
+def test_halving_on_stages() -> None:
+    """Test that the stages bound the resource of the halving search."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(60, 2))  # noqa: N806
+    y = X[:, 0] + rng.normal(size=60)
+    config = _get_config(
+        search_strategy=SearchStrategy.HALVING,
+        search_resource="n_estimators",
+    )
+    search = get_search_cv(GradientBoostingRegressor(), config, cv=3)
+    assert isinstance(search, HalvingGridSearchCV)
+    assert search.param_grid == {"learning_rate": [0.05, 0.1, 0.5]}
+    search.fit(X, y)
+    assert search.n_resources_ == [3, 9]
+    assert search.best_estimator_.n_estimators == 9  # noqa: PLR2004
+    assert config.search_space == _SPACE
+
+
+def test_halving_reaches_max_stages() -> None:
+    """Test that a halving search of few candidates uses all stages."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(60, 2))  # noqa: N806
+    y = X[:, 0] + rng.normal(size=60)
+    config = _get_config(
+        search_strategy=SearchStrategy.HALVING,
+        search_resource="n_estimators",
+        search_space={"learning_rate": [0.05, 0.1], "n_estimators": [10, 40]},
+    )
+    search = get_search_cv(GradientBoostingRegressor(), config, cv=3)
+    search.fit(X, y)
+    assert search.n_resources_[-1] == 40  # noqa: PLR2004
+    assert search.best_estimator_.n_estimators == 40  # noqa: PLR2004
+
+
+def test_precomputed_splits() -> None:
+    """Test that precomputed folds are used as they are."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(30, 2))  # noqa: N806
+    y = X[:, 0] + rng.normal(size=30)
+    splits = [
+        (np.arange(10), np.arange(10, 20)),
+        (np.arange(20), np.arange(20, 30)),
+    ]
+    search = get_search_cv(GradientBoostingRegressor(), _get_config(), splits)
+    search.fit(X, y)
+    assert search.n_splits_ == len(splits)
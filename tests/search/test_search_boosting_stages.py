@@ -0,0 +1,101 @@
+"""Tests for _search.search_boosting_stages."""
+
+import numpy as np
+from sklearn.ensemble import (
+    GradientBoostingRegressor,
+    HistGradientBoostingRegressor,
+)
+from sklearn.metrics import mean_pinball_loss
+from sklearn.model_selection import KFold, ParameterGrid
+
+from spotopt._search import _score_stages, search_boosting_stages
+
+_PARAM_GRID = {"learning_rate": [0.1, 0.5], "n_estimators": [20, 5, 10]}
+
+
+def test_matches_separate_fits() -> None:
+    """Test that the selection matches fitting every candidate."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(80, 3))  # noqa: N806
+    y = np.sin(X[:, 0]) + 0.3 * rng.normal(size=80)
+    mdls = [
+        GradientBoostingRegressor(loss="quantile", alpha=q, random_state=0)
+        for q in (0.1, 0.9)
+    ]
+
+    fitted = search_boosting_stages(mdls, X, y, _PARAM_GRID, cv=3)
+
+    for mdl, fitted_mdl in zip(mdls, fitted, strict=True):
+        losses = {}
+        for params in ParameterGrid(_PARAM_GRID):
+            key = (params["learning_rate"], params["n_estimators"])
+            losses[key] = 0.0
+            for train, test in KFold(n_splits=3).split(X):
+                fold_mdl = GradientBoostingRegressor(
+                    loss="quantile",
+                    alpha=mdl.alpha,
+                    random_state=0,
+                    **params,
+                ).fit(X[train], y[train])
+                losses[key] += mean_pinball_loss(
+                    y[test],
+                    fold_mdl.predict(X[test]),
+                    alpha=mdl.alpha,
+                )
+        learning_rate, n_estimators = min(losses, key=losses.get)
+        assert fitted_mdl.learning_rate == learning_rate
+        assert fitted_mdl.n_estimators == n_estimators
+        assert len(fitted_mdl.estimators_) == n_estimators
+
+
+def test_histogram_models() -> None:
+    """Test that histogram-based models select ``max_iter``."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(120, 3))  # noqa: N806
+    y = np.sin(X[:, 0]) + 0.3 * rng.normal(size=120)
+    param_grid = {"max_iter": [30, 3, 10]}
+    mdl = HistGradientBoostingRegressor(
+        loss="quantile",
+        quantile=0.9,
+        min_samples_leaf=5,
+    )
+
+    (fitted_mdl,) = search_boosting_stages([mdl], X, y, param_grid, cv=3)
+
+    losses = {}
+    for max_iter in param_grid["max_iter"]:
+        losses[max_iter] = 0.0
+        for train, test in KFold(n_splits=3).split(X):
+            fold_mdl = HistGradientBoostingRegressor(
+                loss="quantile",
+                quantile=0.9,
+                min_samples_leaf=5,
+                max_iter=max_iter,
+            ).fit(X[train], y[train])
+            losses[max_iter] += mean_pinball_loss(
+                y[test],
+                fold_mdl.predict(X[test]),
+                alpha=0.9,
+            )
+    assert fitted_mdl.max_iter == min(losses, key=losses.get)
+    assert fitted_mdl.n_iter_ == fitted_mdl.max_iter
+
+
+def test_score_stages_after_early_stopping() -> None:
+    """Test that counts beyond the fitted stages use all stages."""
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(100, 2))  # noqa: N806
+    y = rng.normal(size=100)
+    mdl = GradientBoostingRegressor(
+        loss="quantile",
+        alpha=0.5,
+        n_estimators=500,
+        n_iter_no_change=2,
+        random_state=0,
+    ).fit(X, y)
+    assert mdl.n_estimators_ < 400  # noqa: PLR2004
+
+    losses = _score_stages(mdl, X, y, counts=[1, 400, 500])
+    full = mean_pinball_loss(y, mdl.predict(X), alpha=0.5)
+    np.testing.assert_allclose(losses[1:], full)
+    assert losses[0] >= full
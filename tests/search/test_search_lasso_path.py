@@ -0,0 +1,69 @@
+"""Tests for _search.search_lasso_path."""
+
+from unittest.mock import patch
+
+import numpy as np
+from sklearn.linear_model import QuantileRegressor
+from sklearn.metrics import mean_pinball_loss
+from sklearn.model_selection import KFold
+
+from spotopt._search import search_lasso_path
+
+_ALPHAS = [0.001, 0.1, 10.0, 100.0]
+
+
+def test_matches_full_path() -> None:
+    """Test that the selected alpha matches solving every alpha."""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(60, 3))  # noqa: N806
+    y = X @ np.array([1.0, 0.0, -2.0]) + rng.normal(size=60)
+    mdls = [QuantileRegressor(quantile=q) for q in (0.1, 0.5, 0.9)]
+
+    fitted, alpha = search_lasso_path(mdls, X, y, alphas=_ALPHAS, cv=3)
+
+    losses = np.zeros(len(_ALPHAS))
+    for train, test in KFold(n_splits=3).split(X):
+        for i, a in enumerate(_ALPHAS):
+            for mdl in mdls:
+                fold_mdl = QuantileRegressor(quantile=mdl.quantile, alpha=a)
+                fold_mdl.fit(X[train], y[train])
+                losses[i] += mean_pinball_loss(
+                    y[test],
+                    fold_mdl.predict(X[test]),
+                    alpha=mdl.quantile,
+                )
+    assert alpha == _ALPHAS[int(np.argmin(losses))]
+    assert [mdl.quantile for mdl in fitted] == [0.1, 0.5, 0.9]
+    for mdl in fitted:
+        assert mdl.alpha == alpha
+        expected = QuantileRegressor(quantile=mdl.quantile, alpha=alpha)
+        np.testing.assert_allclose(mdl.coef_, expected.fit(X, y).coef_)
+
+
+def test_skips_alphas_after_zero_coefficients() -> None:
+    """Test that larger alphas are skipped after a zero solution."""
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(30, 2))  # noqa: N806
+    y = rng.normal(size=30)
+
+    with patch.object(
+        QuantileRegressor,
+        "fit",
+        autospec=True,
+        side_effect=QuantileRegressor.fit,
+    ) as fit:
+        _, alpha = search_lasso_path(
+            [QuantileRegressor(quantile=0.5)],
+            X,
+            y,
+            alphas=[1000.0, 100.0, 0.001],
+            cv=2,
+        )
+    # Per fold, 0.001 and 100 are solved, 1000 is skipped; then refit.
+    assert [call.args[0].alpha for call in fit.call_args_list] == [
+        0.001,
+        100.0,
+        0.001,
+        100.0,
+        alpha,
+    ]
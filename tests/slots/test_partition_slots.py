@@ -0,0 +1,57 @@
+"""Tests for _slots.partition_slots."""
+
+import numpy as np
+import pandas as pd
+
+from spotopt._slots import partition_slots
+from spotopt._types import Frequency
+
+
+def test_standard_use_cases() -> None:
+    """Test partitioning of complete days."""
+    df_in = pd.DataFrame(
+        {
+            "obs": np.arange(192.0),
+            "fcast": np.arange(192.0, 384.0),
+        },
+        index=pd.date_range(
+            start="2025-01-02 00:00:00",
+            periods=192,
+            freq="15min",
+            name="delivery",
+        ),
+    )
+    data = partition_slots(df_in, ["fcast"], frequency=Frequency(15))
+    assert data.X.shape == (2, 96, 1)
+    assert data.y.shape == (2, 96)
+    assert data.valid.all()
+    assert data.slots == list(range(96))
+    features, obs = data.slot(5)
+    assert features.ravel().tolist() == [197.0, 293.0]
+    assert obs.tolist() == [5.0, 101.0]
+    assert np.shares_memory(features, data.X)
+    assert data.look_ahead_time(5) == (1, 15)
+    assert data.slot_position(1, 15) == 5  # noqa: PLR2004
+
+
+def test_missing_rows() -> None:
+    """Test that missing rows are skipped for the affected slots."""
+    index = pd.date_range(
+        start="2025-01-02 00:00:00",
+        periods=72,
+        freq="60min",
+        name="delivery",
+    )
+    df_in = pd.DataFrame(
+        {"obs": np.arange(72.0), "fcast": np.arange(72.0)},
+        index=index,
+    ).drop(index=index[[1, 30]])
+    data = partition_slots(df_in, ["fcast"], frequency=Frequency(60))
+    assert data.X.shape == (3, 24, 1)
+    assert data.valid.sum() == 70  # noqa: PLR2004
+    _, y = data.slot(1)
+    assert y.tolist() == [25.0, 49.0]
+    _, y = data.slot(6)
+    assert y.tolist() == [6.0, 54.0]
+    _, y = data.slot(2)
+    assert y.tolist() == [2.0, 26.0, 50.0]
@@ -0,0 +1,84 @@
+"""Tests for _slots.SlotStore."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from spotopt._slots import SlotStore, partition_slots
+from spotopt._types import Frequency
+
+
+def _get_data(start: str, n_days: int) -> pd.DataFrame:
+    """Get hourly data of whole days without time zone."""
+    index = pd.date_range(
+        start=start,
+        periods=24 * n_days,
+        freq="60min",
+        name="delivery",
+    )
+    values = np.arange(len(index), dtype=float)
+    return pd.DataFrame({"obs": values, "fcast": -values}, index=index)
+
+
+def test_standard_use_cases() -> None:
+    """Test that the window moves forward day by day."""
+    df_in = _get_data("2025-01-02", 10)
+    store = SlotStore(
+        partition_slots(df_in.iloc[:72], ["fcast"], Frequency(60)),
+        max_days=2,
+    )
+    assert store.data.first_day == pd.Timestamp("2025-01-03")
+    for day in range(3, 10):
+        store.append(
+            partition_slots(
+                df_in.iloc[24 * day : 24 * (day + 1)],
+                ["fcast"],
+                Frequency(60),
+            ),
+        )
+        expected = partition_slots(
+            df_in.iloc[24 * (day - 1) : 24 * (day + 1)],
+            ["fcast"],
+            Frequency(60),
+        )
+        data = store.data
+        assert data.first_day == expected.first_day
+        np.testing.assert_array_equal(data.X, expected.X)
+        np.testing.assert_array_equal(data.y, expected.y)
+        np.testing.assert_array_equal(data.valid, expected.valid)
+        np.testing.assert_array_equal(data.day_pos, expected.day_pos)
+        np.testing.assert_array_equal(data.slot_pos, expected.slot_pos)
+
+
+def test_without_window() -> None:
+    """Test that all days are kept and missing days are skipped."""
+    df_in = _get_data("2025-01-02", 6)
+    store = SlotStore(
+        partition_slots(df_in.iloc[:24], ["fcast"], Frequency(60)),
+    )
+    store.append(
+        partition_slots(df_in.iloc[48:96], ["fcast"], Frequency(60)),
+    )
+    store.append(partition_slots(df_in.iloc[120:], ["fcast"], Frequency(60)))
+    data = store.data
+    assert data.valid.shape == (6, 24)
+    assert data.valid.any(axis=1).tolist() == [
+        True,
+        False,
+        True,
+        True,
+        False,
+        True,
+    ]
+    _, y = data.slot(0)
+    assert y.tolist() == [0.0, 48.0, 72.0, 120.0]
+
+
+def test_append_earlier_days() -> None:
+    """Test that appended days must follow the stored days."""
+    df_in = _get_data("2025-01-02", 3)
+    store = SlotStore(partition_slots(df_in, ["fcast"], Frequency(60)))
+    with pytest.raises(ValueError, match="must follow the last stored day"):
+        store.append(
+            partition_slots(df_in.iloc[48:], ["fcast"], Frequency(60)),
+        )
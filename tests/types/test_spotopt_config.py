@@ -9,9 +9,20 @@ import pytest
 
 from spotopt._exceptions import (
     ForbiddenKeyWordError,
+    InvalidConfigValueError,
     ParameterCombinationError,
 )
-from spotopt._types import Frequency, ModelName, SpotOptConfig
+from spotopt._types import (
+    CVStrategy,
+    Frequency,
+    ModelName,
+    QuantileMode,
+    SearchScope,
+    SearchStrategy,
+    SlotEncoding,
+    SpotOptConfig,
+    WeekdayEncoding,
+)
 
 does_not_raise = nullcontext
 
@@ -65,6 +76,19 @@ def test_spotopt_config_post_init(
         )
 
 
+def test_hgb_forbidden_keywords() -> None:
+    """Test that HGB models own their loss and quantile."""
+    with pytest.raises(
+        ForbiddenKeyWordError,
+        match="Model HGB does not accept the following keywords",
+    ):
+        SpotOptConfig(
+            model_name=ModelName("HGB"),
+            frequency=Frequency(60),
+            mdl_kwargs={"loss": "absolute_error", "quantile": 0.5},
+        )
+
+
 def test_from_json(tmp_path: Path) -> None:
     """Test that from_json returns an equivalent SpotOptConfig."""
     config_path = tmp_path / "config.json"
@@ -179,3 +203,644 @@ def test_from_dict_invalid_combination() -> None:
                 "run_hyperparam_search": True,
             },
         )
+
+
+def test_from_dict_n_jobs() -> None:
+    """Test that from_dict reads the number of jobs."""
+    cfg = SpotOptConfig.from_dict(
+        {
+            "model_name": "GBR",
+            "frequency": 15,
+            "n_jobs": "-1",
+        },
+    )
+
+    assert cfg.n_jobs == -1
+
+
+def test_n_jobs_zero() -> None:
+    """Test that n_jobs must not be zero."""
+    with pytest.raises(InvalidConfigValueError, match="n_jobs must not be 0"):
+        SpotOptConfig(
+            model_name=ModelName("Lasso"),
+            frequency=Frequency(60),
+            n_jobs=0,
+        )
+
+
+def test_to_dict_round_trip() -> None:
+    """Test that to_dict and from_dict are inverse."""
+    cfg = SpotOptConfig(
+        model_name=ModelName("GBR"),
+        frequency=Frequency(15),
+        run_hyperparam_search=True,
+        n_jobs=4,
+    )
+
+    assert SpotOptConfig.from_dict(cfg.to_dict()) == cfg
+
+
+def test_residual_halflife_requires_residual_mode() -> None:
+    """Test that the residual half-life needs the residual mode."""
+    with pytest.raises(
+        ParameterCombinationError,
+        match="residual_halflife_days requires quantile_mode 'residual'",
+    ):
+        SpotOptConfig(
+            model_name=ModelName("Lasso"),
+            frequency=Frequency(60),
+            residual_halflife_days=7.0,
+        )
+
+
+def test_from_dict_residual_mode() -> None:
+    """Test that from_dict reads the quantile mode."""
+    cfg = SpotOptConfig.from_dict(
+        {
+            "model_name": "GBR",
+            "frequency": 60,
+            "quantile_mode": "residual",
+            "residual_halflife_days": 30,
+        },
+    )
+
+    assert cfg.quantile_mode == QuantileMode.RESIDUAL
+    assert cfg.residual_halflife_days == 30.0  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    "quantiles",
+    [[], [50, 5], [5, 5, 50], [0, 50], [50, 100]],
+)
+def test_invalid_quantiles(quantiles: list[int]) -> None:
+    """Test that invalid quantile grids are rejected."""
+    with pytest.raises(
+        InvalidConfigValueError,
+        match="output_quantiles must be a non-empty, strictly increasing",
+    ):
+        SpotOptConfig(
+            model_name=ModelName("Lasso"),
+            frequency=Frequency(60),
+            output_quantiles=quantiles,
+        )
+
+
+def test_quantiles_defaults() -> None:
+    """Test the fitted and predicted quantiles."""
+    cfg = SpotOptConfig.from_dict(
+        {
+            "model_name": "Lasso",
+            "frequency": 60,
+            "fit_quantiles": [5, 50, 95],
+        },
+    )
+
+    assert cfg.fitted_quantiles == [5, 50, 95]
+    assert cfg.quantiles == [5, 50, 95]
+    cfg = SpotOptConfig(
+        model_name=ModelName("Lasso"),
+        frequency=Frequency(60),
+        output_quantiles=list(range(1, 100)),
+    )
+    assert cfg.quantiles == list(range(1, 100))
+
+
+def test_from_dict_pooled() -> None:
+    """Test that from_dict reads the pooled mode."""
+    cfg = SpotOptConfig.from_dict(
+        {
+            "model_name": "Lasso",
+            "frequency": 15,
+            "pooled": True,
+            "slot_encoding": "cyclic",
+        },
+    )
+
+    assert cfg.pooled
+    assert cfg.slot_encoding == SlotEncoding.CYCLIC
+    assert SpotOptConfig.from_dict(cfg.to_dict()) == cfg
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expectation"),
+    [
+        ({"slot_group_size": 4}, does_not_raise()),
+        (
+            {"slot_group_size": 5},
+            pytest.raises(
+                InvalidConfigValueError,
+                match="slot_group_size must be a positive divisor",
+            ),
+        ),
+        (
+            {"slot_group_size": 0},
+            pytest.raises(
+                InvalidConfigValueError,
+                match="slot_group_size must be a positive divisor",
+            ),
+        ),
+        (
+            {"slot_group_size": 4, "pooled": True},
+            pytest.raises(
+                ParameterCombinationError,
+                match="Choose either pooled or slot_group_size",
+            ),
+        ),
+    ],
+)
+def test_slot_group_size(kwargs, expectation) -> None:
+    """Test the checks of the slot group size."""
+    with expectation:
+        SpotOptConfig(
+            model_name=ModelName("Lasso"),
+            frequency=Frequency(15),
+            **kwargs,
+        )
+
+
+def test_from_dict_trace_memory() -> None:
+    """Test that from_dict reads the memory tracing."""
+    cfg = SpotOptConfig.from_dict(
+        {"model_name": "Lasso", "frequency": 15, "trace_memory": True},
+    )
+    assert cfg.trace_memory
+    assert SpotOptConfig.from_dict(cfg.to_dict()) == cfg
+
+
+def test_lag_days() -> None:
+    """Test the checks and serialization of the lags."""
+    cfg = SpotOptConfig.from_dict(
+        {
+            "model_name": "Lasso",
+            "frequency": 60,
+            "lag_cols": ["obs", "fcast"],
+            "lag_days": [1, 2, 7],
+        },
+    )
+    assert SpotOptConfig.from_dict(cfg.to_dict()) == cfg
+    with pytest.raises(
+        InvalidConfigValueError,
+        match="lag_days must be a non-empty, strictly increasing",
+    ):
+        SpotOptConfig(
+            model_name=ModelName("Lasso"),
+            frequency=Frequency(60),
+            lag_days=[0, 1],
+        )
+
+
+@pytest.mark.parametrize("lag_cols", [[], ["obs", "obs"], ["obs", 1]])
+def test_invalid_lag_cols(lag_cols: list) -> None:
+    """Test that empty, repeated or non-string lag columns fail."""
+    with pytest.raises(
+        InvalidConfigValueError,
+        match="lag_cols must be a non-empty list of distinct column names",
+    ):
+        SpotOptConfig(
+            model_name=ModelName("Lasso"),
+            frequency=Frequency(60),
+            lag_cols=lag_cols,
+        )
+
+
+def test_from_dict_weekday_encoding() -> None:
+    """Test that from_dict reads the weekday encoding."""
+    cfg = SpotOptConfig.from_dict(
+        {
+            "model_name": "GBR",
+            "frequency": 60,
+            "weekday_encoding": "categorical",
+        },
+    )
+
+    assert cfg.weekday_encoding == WeekdayEncoding.CATEGORICAL
+    assert SpotOptConfig.from_dict(cfg.to_dict()) == cfg
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expectation"),
+    [
+        ({"solver": "highs-ipm", "sparse_threshold": 0.5}, does_not_raise()),
+        (
+            {"solver": "simplex"},
+            pytest.raises(InvalidConfigValueError, match="solver must be"),
+        ),
+        (
+            {"sparse_threshold": 1.5},
+            pytest.raises(
+                InvalidConfigValueError,
+                match="sparse_threshold must be between 0 and 1",
+            ),
+        ),
+        (
+            {"solver": "highs", "mdl_kwargs": {"solver": "highs"}},
+            pytest.raises(
+                ParameterCombinationError,
+                match="Choose either solver or a solver in mdl_kwargs",
+            ),
+        ),
+        (
+            {"model_name": ModelName("GBR"), "sparse_threshold": 0.5},
+            pytest.raises(
+                ParameterCombinationError,
+                match="sparse_threshold requires model_name 'Lasso'",
+            ),
+        ),
+    ],
+)
+def test_solver_options(kwargs, expectation) -> None:
+    """Test the checks of the Lasso solver options."""
+    with expectation:
+        SpotOptConfig(
+            **{
+                "model_name": ModelName("Lasso"),
+                "frequency": Frequency(60),
+                **kwargs,
+            },
+        )
+
+
+def test_path_search_requires_search() -> None:
+    """Test that the path search needs a hyperparameter search."""
+    cfg = SpotOptConfig.from_dict(
+        {
+            "model_name": "Lasso",
+            "frequency": 60,
+            "run_hyperparam_search": True,
+            "search_strategy": "path",
+        },
+    )
+    assert cfg.search_strategy == SearchStrategy.PATH
+    assert SpotOptConfig.from_dict(cfg.to_dict()) == cfg
+    with pytest.raises(
+        ParameterCombinationError,
+        match="search_strategy 'path' requires run_hyperparam_search",
+    ):
+        SpotOptConfig(
+            model_name=ModelName("Lasso"),
+            frequency=Frequency(60),
+            search_strategy=SearchStrategy.PATH,
+        )
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expectation"),
+    [
+        (
+            {"early_stopping_rounds": 10, "time_budget_seconds": 60},
+            does_not_raise(),
+        ),
+        (
+            {"model_name": ModelName("Lasso"), "time_budget_seconds": 60},
+            pytest.raises(
+                ParameterCombinationError,
+                match="time_budget_seconds requires model_name 'GBR'",
+            ),
+        ),
+        (
+            {"early_stopping_rounds": 10, "run_hyperparam_search": True},
+            pytest.raises(
+                ParameterCombinationError,
+                match="Choose either early_stopping_rounds or hyperparameter",
+            ),
+        ),
+        (
+            {"early_stopping_rounds": 0},
+            pytest.raises(
+                InvalidConfigValueError,
+                match="early_stopping_rounds must be positive",
+            ),
+        ),
+        (
+            {"validation_fraction": 1.0},
+            pytest.raises(
+                InvalidConfigValueError,
+                match="validation_fraction must be between 0 and 1",
+            ),
+        ),
+        (
+            {
+                "early_stopping_rounds": 10,
+                "mdl_kwargs": {"n_iter_no_change": 5},
+            },
+            pytest.raises(
+                ParameterCombinationError,
+                match="Choose either early_stopping_rounds or early stopping",
+            ),
+        ),
+    ],
+)
+def test_stopping_options(kwargs, expectation) -> None:
+    """Test the checks of the early stopping and time budget."""
+    with expectation:
+        cfg = SpotOptConfig(
+            **{
+                "model_name": ModelName("GBR"),
+                "frequency": Frequency(60),
+                **kwargs,
+            },
+        )
+        assert SpotOptConfig.from_dict(cfg.to_dict()) == cfg
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expectation"),
+    [
+        (
+            {
+                "search_strategy": SearchStrategy.RANDOM,
+                "n_iter": 5,
+                "search_space": {"learning_rate": [0.05, 0.1, 0.2]},
+            },
+            does_not_raise(),
+        ),
+        (
+            {
+                "search_strategy": SearchStrategy.HALVING,
+                "search_resource": "n_estimators",
+            },
+            does_not_raise(),
+        ),
+        (
+            {"search_strategy": SearchStrategy.GRID, "n_iter": 5},
+            pytest.raises(
+                ParameterCombinationError,
+                match="n_iter requires search_strategy 'random'",
+            ),
+        ),
+        (
+            {"search_strategy": SearchStrategy.RANDOM, "n_iter": 0},
+            pytest.raises(
+                InvalidConfigValueError,
+                match="n_iter must be positive",
+            ),
+        ),
+        (
+            {
+                "search_strategy": SearchStrategy.HALVING,
+                "search_resource": "max_iter",
+            },
+            pytest.raises(
+                InvalidConfigValueError,
+                match=re.escape(
+                    "search_resource must be one of "
+                    "['n_estimators', 'n_samples']",
+                ),
+            ),
+        ),
+        (
+            {
+                "search_strategy": SearchStrategy.HALVING,
+                "search_resource": "n_estimators",
+                "search_space": {"learning_rate": [0.1]},
+            },
+            pytest.raises(
+                ParameterCombinationError,
+                match="The search space must contain n_estimators",
+            ),
+        ),
+        (
+            {"search_space": {"learning_rate": []}},
+            pytest.raises(
+                InvalidConfigValueError,
+                match="search_space must map parameter names to non-empty",
+            ),
+        ),
+        (
+            {"search_space": {"alpha": [0.5]}},
+            pytest.raises(
+                ForbiddenKeyWordError,
+                match="Model GBR does not accept the following keywords",
+            ),
+        ),
+        (
+            {
+                "search_strategy": SearchStrategy.PATH,
+                "search_space": {"learning_rate": [0.1]},
+            },
+            pytest.raises(
+                ParameterCombinationError,
+                match="'path' requires n_estimators in the search space",
+            ),
+        ),
+    ],
+)
+def test_search_options(kwargs, expectation) -> None:
+    """Test the checks of the hyperparameter search options."""
+    with expectation:
+        cfg = SpotOptConfig(
+            **{
+                "model_name": ModelName("GBR"),
+                "frequency": Frequency(60),
+                "run_hyperparam_search": True,
+                **kwargs,
+            },
+        )
+        assert SpotOptConfig.from_dict(cfg.to_dict()) == cfg
+
+
+def test_search_space_requires_search() -> None:
+    """Test that a search space needs a hyperparameter search."""
+    with pytest.raises(
+        ParameterCombinationError,
+        match="search_space requires run_hyperparam_search",
+    ):
+        SpotOptConfig(
+            model_name=ModelName("Lasso"),
+            frequency=Frequency(60),
+            search_space={"alpha": [0.1]},
+        )
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expectation"),
+    [
+        (
+            {
+                "search_scope": SearchScope.PER_QUANTILE,
+                "search_sample_slots": 8,
+            },
+            does_not_raise(),
+        ),
+        (
+            {
+                "search_scope": SearchScope.PER_SLOT_GROUP,
+                "slot_group_size": 2,
+                "search_group_size": 8,
+            },
+            does_not_raise(),
+        ),
+        (
+            {"search_sample_slots": 8},
+            pytest.raises(
+                ParameterCombinationError,
+                match="search_sample_slots requires a search_scope other",
+            ),
+        ),
+        (
+            {
+                "search_scope": SearchScope.PER_QUANTILE,
+                "run_hyperparam_search": False,
+            },
+            pytest.raises(
+                ParameterCombinationError,
+                match="search_scope requires run_hyperparam_search",
+            ),
+        ),
+        (
+            {"search_scope": SearchScope.PER_QUANTILE, "pooled": True},
+            pytest.raises(
+                ParameterCombinationError,
+                match="Pooled models and the path search share",
+            ),
+        ),
+        (
+            {
+                "search_scope": SearchScope.PER_QUANTILE,
+                "search_group_size": 8,
+            },
+            pytest.raises(
+                ParameterCombinationError,
+                match="search_group_size requires search_scope",
+            ),
+        ),
+        (
+            {
+                "search_scope": SearchScope.PER_SLOT_GROUP,
+                "slot_group_size": 8,
+            },
+            pytest.raises(
+                InvalidConfigValueError,
+                match="search_group_size must be a positive divisor",
+            ),
+        ),
+        (
+            {
+                "search_scope": SearchScope.PER_QUANTILE,
+                "search_sample_slots": 0,
+            },
+            pytest.raises(
+                InvalidConfigValueError,
+                match="search_sample_slots must be positive",
+            ),
+        ),
+    ],
+)
+def test_search_scope(kwargs, expectation) -> None:
+    """Test the checks of a search shared by several models."""
+    with expectation:
+        cfg = SpotOptConfig(
+            **{
+                "model_name": ModelName("Lasso"),
+                "frequency": Frequency(15),
+                "run_hyperparam_search": True,
+                **kwargs,
+            },
+        )
+        assert SpotOptConfig.from_dict(cfg.to_dict()) == cfg
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expectation"),
+    [
+        (
+            {
+                "cv_strategy": CVStrategy.FORWARD,
+                "cv_gap_days": 1,
+                "cv_train_days": 365,
+            },
+            does_not_raise(),
+        ),
+        (
+            {"cv_train_days": 365},
+            pytest.raises(
+                ParameterCombinationError,
+                match="cv_gap_days and cv_train_days require cv_strategy",
+            ),
+        ),
+        (
+            {"cv_strategy": CVStrategy.FORWARD, "cv_gap_days": -1},
+            pytest.raises(
+                InvalidConfigValueError,
+                match="cv_gap_days must not be negative",
+            ),
+        ),
+        (
+            {"cv_strategy": CVStrategy.FORWARD, "cv_train_days": 0},
+            pytest.raises(
+                InvalidConfigValueError,
+                match="cv_train_days must be positive",
+            ),
+        ),
+    ],
+)
+def test_cv_options(kwargs, expectation) -> None:
+    """Test the checks of the folds of the hyperparameter search."""
+    with expectation:
+        cfg = SpotOptConfig(
+            **{
+                "model_name": ModelName("Lasso"),
+                "frequency": Frequency(60),
+                "run_hyperparam_search": True,
+                **kwargs,
+            },
+        )
+        assert SpotOptConfig.from_dict(cfg.to_dict()) == cfg
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expectation"),
+    [
+        (
+            {"max_training_days": 365, "recency_halflife_days": 30.0},
+            does_not_raise(),
+        ),
+        (
+            {"max_training_days": 0},
+            pytest.raises(
+                InvalidConfigValueError,
+                match="max_training_days must be positive",
+            ),
+        ),
+        (
+            {"recency_halflife_days": 0.0},
+            pytest.raises(
+                InvalidConfigValueError,
+                match="recency_halflife_days must be positive",
+            ),
+        ),
+        (
+            {
+                "model_name": ModelName("GBR"),
+                "recency_halflife_days": 30.0,
+                "early_stopping_rounds": 10,
+            },
+            pytest.raises(
+                ParameterCombinationError,
+                match="recency_halflife_days cannot be combined",
+            ),
+        ),
+        (
+            {
+                "run_hyperparam_search": True,
+                "search_strategy": SearchStrategy.PATH,
+                "recency_halflife_days": 30.0,
+            },
+            pytest.raises(
+                ParameterCombinationError,
+                match="recency_halflife_days cannot be combined",
+            ),
+        ),
+    ],
+)
+def test_training_window(kwargs, expectation) -> None:
+    """Test the checks of the training window and recency weights."""
+    with expectation:
+        cfg = SpotOptConfig(
+            **{
+                "model_name": ModelName("Lasso"),
+                "frequency": Frequency(60),
+                **kwargs,
+            },
+        )
+        assert SpotOptConfig.from_dict(cfg.to_dict()) == cfg
@@ -0,0 +1,35 @@
+"""Tests for utils.get_weighted_quantiles."""
+
+import numpy as np
+import pytest
+
+from spotopt._utils import get_weighted_quantiles
+
+
+def test_unweighted_matches_inverted_cdf() -> None:
+    """Test that equal weights match numpy's inverted CDF quantiles."""
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=101)
+    quantiles = np.array([0.01, 0.1, 0.5, 0.9, 0.99])
+    np.testing.assert_array_equal(
+        get_weighted_quantiles(values, quantiles),
+        np.quantile(values, quantiles, method="inverted_cdf"),
+    )
+
+
+@pytest.mark.parametrize(
+    ("weights", "expected"),
+    [
+        (np.array([1.0, 1.0, 1.0, 1.0]), [1.0, 2.0, 4.0]),
+        (np.array([0.0, 0.0, 1.0, 1.0]), [1.0, 1.0, 3.0]),
+        (np.array([1.0, 0.0, 0.0, 0.0]), [4.0, 4.0, 4.0]),
+    ],
+)
+def test_weighted(weights: np.ndarray, expected: list[float]) -> None:
+    """Test weighted quantiles."""
+    result = get_weighted_quantiles(
+        np.array([4.0, 2.0, 3.0, 1.0]),
+        np.array([0.1, 0.5, 1.0]),
+        weights,
+    )
+    assert result.tolist() == expected
@@ -0,0 +1,38 @@
+"""Tests for utils.interpolate_quantiles."""
+
+import numpy as np
+import pytest
+
+from spotopt._utils import interpolate_quantiles
+
+
+@pytest.mark.parametrize(
+    ("target_quantiles", "expected"),
+    [
+        ([10, 50, 90], [0.0, 4.0, 8.0]),
+        ([30, 70], [2.0, 6.0]),
+        ([1, 5, 95, 99], [0.0, 0.0, 8.0, 8.0]),
+    ],
+)
+def test_standard_use_cases(
+    target_quantiles: list[int],
+    expected: list[float],
+) -> None:
+    """Test linear interpolation and flat extrapolation."""
+    predictions = np.array([[0.0, 4.0, 8.0]])
+    result = interpolate_quantiles(predictions, [10, 50, 90], target_quantiles)
+    assert result.tolist() == [expected]
+
+
+def test_crossing_quantiles_are_sorted() -> None:
+    """Test that crossing quantiles give monotone interpolations."""
+    predictions = np.array([[[3.0, 1.0, 2.0]]])
+    result = interpolate_quantiles(predictions, [10, 50, 90], [10, 30, 90])
+    assert result.tolist() == [[[1.0, 1.5, 3.0]]]
+
+
+def test_single_quantile() -> None:
+    """Test that a single fitted quantile is repeated."""
+    predictions = np.array([[1.0], [2.0]])
+    result = interpolate_quantiles(predictions, [50], [5, 50, 95])
+    assert result.tolist() == [[1.0, 1.0, 1.0], [2.0, 2.0, 2.0]]
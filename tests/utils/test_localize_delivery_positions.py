@@ -0,0 +1,41 @@
+"""Tests for utils.localize_delivery_positions."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from spotopt._types import Frequency
+from spotopt._utils import (
+    convert_from_none_time_zone,
+    localize_delivery_positions,
+)
+
+
+@pytest.mark.parametrize(
+    ("start", "frequency"),
+    [
+        ("2025-01-10", Frequency(60)),
+        ("2025-03-29", Frequency(60)),
+        ("2025-03-29", Frequency(15)),
+        ("2025-10-25", Frequency(60)),
+        ("2025-10-25", Frequency(15)),
+    ],
+    ids=["regular", "march-h", "march-qh", "october-h", "october-qh"],
+)
+def test_matches_convert_from_none_time_zone(
+    start: str,
+    frequency: Frequency,
+) -> None:
+    """Test that positions reproduce the DataFrame conversion."""
+    index = pd.date_range(
+        start=start,
+        periods=3 * 24 * 60 // frequency.value,
+        freq=f"{frequency.value}min",
+    )
+    values = np.arange(len(index), dtype=float)
+    df_expected = convert_from_none_time_zone(
+        pd.DataFrame({"value": values}, index=index),
+    )
+    index_out, positions = localize_delivery_positions(index, frequency)
+    assert index_out.equals(df_expected.index)
+    assert values[positions].tolist() == df_expected["value"].tolist()